@@ -0,0 +1,157 @@
+"""Batch module for converting many files on a worker pool."""
+
+import glob
+import multiprocessing
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from parquet_lf.converters.base import polars_env
+from parquet_lf.converters.compression import strip_compression_suffix
+from parquet_lf.converters.shrink import TypeShrinkage
+from parquet_lf.predicate import RowGroupPruning
+
+# Characters that mark an input argument as a glob pattern
+GLOB_CHARS = frozenset("*?[")
+
+
+@dataclass
+class BatchResult:
+    """Outcome of converting a single file in a batch."""
+
+    input_path: Path
+    output_path: Path
+    error: str | None = None
+    shrinkage: TypeShrinkage | None = None
+    pruning: RowGroupPruning | None = None
+
+
+def expand_inputs(inputs: Sequence[Path], extensions: Sequence[str]) -> list[Path]:
+    """Expand input arguments into a sorted list of files.
+
+    Directories contribute every file directly inside them whose extension
+    is in `extensions`, also when compressed (e.g. data.csv.gz for ".csv");
+    arguments containing glob characters are expanded; anything else is taken
+    as a file path.
+
+    Args:
+        inputs: Files, directories or glob patterns.
+        extensions: Lowercase extensions (e.g. ".csv") to pick from directories.
+
+    Returns:
+        De-duplicated list of input files in a stable order.
+
+    Raises:
+        FileNotFoundError: If an input does not exist or a pattern matches nothing.
+    """
+    files: list[Path] = []
+    for item in inputs:
+        if GLOB_CHARS & set(str(item)):
+            matches = sorted(Path(match) for match in glob.glob(str(item)))
+            if not matches:
+                raise FileNotFoundError(f"No files match pattern: {item}")
+            files.extend(matches)
+        elif item.is_dir():
+            files.extend(
+                sorted(
+                    p
+                    for p in item.iterdir()
+                    if p.is_file() and strip_compression_suffix(p).suffix.lower() in extensions
+                )
+            )
+        elif item.exists():
+            files.append(item)
+        else:
+            raise FileNotFoundError(f"Input file not found: {item}")
+
+    return list(dict.fromkeys(files))
+
+
+def batch_output_path(input_path: Path, output_dir: Path, extension: str) -> Path:
+    """Build the output path for an input file in a batch.
+
+    Args:
+        input_path: Path to the input file.
+        output_dir: Directory that receives the converted files.
+        extension: Output file extension, including the dot.
+
+    Returns:
+        Path inside output_dir with the input's stem (without any compression
+        extension) and the new extension.
+    """
+    return output_dir / f"{strip_compression_suffix(input_path).stem}{extension}"
+
+
+def threads_per_worker(jobs: int) -> int:
+    """Split the available CPUs evenly between worker processes.
+
+    Args:
+        jobs: Number of worker processes.
+
+    Returns:
+        Number of polars threads each worker should use (at least 1).
+    """
+    cpus = os.process_cpu_count() or 1
+    return max(1, cpus // jobs)
+
+
+def _convert_one(convert: Callable[[Path, Path], object], input_path: Path, output_path: Path) -> BatchResult:
+    """Convert one file, capturing any error or numeric type shrinkage in the result."""
+    try:
+        converted = convert(input_path, output_path)
+    except Exception as e:
+        return BatchResult(input_path=input_path, output_path=output_path, error=str(e))
+    shrinkage = converted if isinstance(converted, TypeShrinkage) else None
+    return BatchResult(input_path=input_path, output_path=output_path, shrinkage=shrinkage)
+
+
+def run_batch(
+    convert: Callable[[Path, Path], object],
+    input_paths: Sequence[Path],
+    output_dir: Path,
+    extension: str,
+    jobs: int,
+) -> list[BatchResult]:
+    """Convert many files, optionally in parallel.
+
+    With more than one job, files are distributed over a pool of worker
+    processes that stay alive for the whole batch, so interpreter start-up and
+    imports are paid once per worker rather than once per file. Each worker's
+    polars thread pool is sized so that all workers together match the number
+    of CPUs. A failing file does not stop the rest of the batch.
+
+    Args:
+        convert: Picklable function taking (input_path, output_path); a
+            returned TypeShrinkage is kept in the result, anything else is
+            ignored.
+        input_paths: Files to convert.
+        output_dir: Directory that receives the converted files.
+        extension: Output file extension, including the dot.
+        jobs: Number of worker processes; 1 converts in-process.
+
+    Returns:
+        One BatchResult per input, in input order.
+
+    Raises:
+        ValueError: If jobs is less than 1 or two inputs map to the same output.
+    """
+    if jobs < 1:
+        raise ValueError(f"jobs must be at least 1, got {jobs}")
+
+    output_paths = [batch_output_path(path, output_dir, extension) for path in input_paths]
+    if len(set(output_paths)) != len(output_paths):
+        raise ValueError("Multiple inputs would be written to the same output file; use unique file names")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if jobs == 1:
+        return [_convert_one(convert, i, o) for i, o in zip(input_paths, output_paths, strict=True)]
+
+    # Spawn rather than fork: forking after polars has started its thread pool can deadlock
+    context = multiprocessing.get_context("spawn")
+    with polars_env("POLARS_MAX_THREADS", str(threads_per_worker(jobs))):
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+            futures = [pool.submit(_convert_one, convert, i, o) for i, o in zip(input_paths, output_paths, strict=True)]
+            return [future.result() for future in futures]
@@ -0,0 +1,292 @@
+"""Cache module for persisting file metadata between runs."""
+
+import dataclasses
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from parquet_lf.info import FileFormat, FileInfo
+from parquet_lf.parquet_footer import ColumnChunkMetadata, ColumnStatistics, ParquetFooter, RowGroupMetadata
+
+# Bump when FileInfo (or anything it holds) changes shape, so stale entries are ignored
+CACHE_FORMAT_VERSION = 2
+
+# Upper bound on the total size of cached entries; least recently used entries are evicted first
+DEFAULT_MAX_CACHE_BYTES = 32 * 1024 * 1024
+
+# Bytes hashed from each end of a file for its content fingerprint
+FINGERPRINT_SIZE = 64 * 1024
+
+# Environment variable that overrides the cache directory
+CACHE_DIR_ENV = "PARQUET_LF_CACHE_DIR"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS file_info (
+    key TEXT PRIMARY KEY,
+    size_bytes INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    fingerprint BLOB NOT NULL,
+    value BLOB NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+# Delete the oldest entries beyond the size budget, keeping the most recently used ones
+_EVICT = """
+DELETE FROM file_info WHERE key IN (
+    SELECT key FROM (
+        SELECT key, SUM(LENGTH(value)) OVER (ORDER BY last_used DESC, key) AS running
+        FROM file_info
+    ) WHERE running > ?
+)
+"""
+
+
+def default_cache_dir() -> Path:
+    """Return the directory that holds the metadata cache.
+
+    Uses $PARQUET_LF_CACHE_DIR if set, otherwise $XDG_CACHE_HOME/parquet-lf,
+    falling back to ~/.cache/parquet-lf.
+
+    Returns:
+        Path to the cache directory (not necessarily existing yet).
+    """
+    if override := os.environ.get(CACHE_DIR_ENV):
+        return Path(override)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "parquet-lf"
+
+
+def file_fingerprint(path: Path, size_bytes: int) -> bytes:
+    """Hash the first and last bytes of a file.
+
+    This catches rewrites that keep the same size and modification time
+    without reading the whole file.
+
+    Args:
+        path: Path to the file.
+        size_bytes: Size of the file in bytes.
+
+    Returns:
+        16-byte digest of the file's head and tail.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as f:
+        digest.update(f.read(FINGERPRINT_SIZE))
+        if size_bytes > FINGERPRINT_SIZE:
+            f.seek(max(FINGERPRINT_SIZE, size_bytes - FINGERPRINT_SIZE))
+            digest.update(f.read(FINGERPRINT_SIZE))
+    return digest.digest()
+
+
+@dataclasses.dataclass(frozen=True)
+class FileState:
+    """Size, modification time and content fingerprint of a file at one moment."""
+
+    size_bytes: int
+    mtime_ns: int
+    fingerprint: bytes
+
+
+def file_state(path: Path) -> FileState | None:
+    """Capture the state a cache entry is validated against.
+
+    Take it before reading the file: metadata computed from a file that
+    changes meanwhile is then stored under the earlier state, which no
+    longer matches, instead of being served for the new contents.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        The file's state, or None if it cannot be read.
+    """
+    try:
+        stat = path.stat()
+        return FileState(stat.st_size, stat.st_mtime_ns, file_fingerprint(path, stat.st_size))
+    except OSError:
+        return None
+
+
+def _json_default(value: Any) -> Any:
+    """Encode the non-JSON values held by FileInfo."""
+    if isinstance(value, bytes):
+        return value.hex()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Cannot encode {type(value).__name__}")
+
+
+def dump_file_info(info: FileInfo) -> str:
+    """Encode FileInfo as JSON for the cache.
+
+    Entries are stored as plain data rather than pickles, so a cache
+    directory written by someone else cannot make a lookup run code.
+
+    Args:
+        info: Metadata to encode.
+
+    Returns:
+        JSON text; the file path is not included.
+    """
+    data = dataclasses.asdict(info)
+    del data["path"]
+    return json.dumps(data, default=_json_default, separators=(",", ":"))
+
+
+def _load_statistics(data: dict[str, Any] | None) -> ColumnStatistics | None:
+    """Decode column statistics, whose min/max bytes are stored as hex."""
+    if data is None:
+        return None
+    return ColumnStatistics(
+        min_value=None if data["min_value"] is None else bytes.fromhex(data["min_value"]),
+        max_value=None if data["max_value"] is None else bytes.fromhex(data["max_value"]),
+        null_count=data["null_count"],
+    )
+
+
+def _load_column(data: dict[str, Any]) -> ColumnChunkMetadata:
+    """Decode the metadata of one column chunk."""
+    return ColumnChunkMetadata(
+        path=data["path"],
+        physical_type=data["physical_type"],
+        codec=data["codec"],
+        encodings=data["encodings"],
+        num_values=data["num_values"],
+        compressed_size=data["compressed_size"],
+        uncompressed_size=data["uncompressed_size"],
+        statistics=_load_statistics(data["statistics"]),
+    )
+
+
+def _load_footer(data: dict[str, Any] | None) -> ParquetFooter | None:
+    """Decode a Parquet footer."""
+    if data is None:
+        return None
+    row_groups = [
+        RowGroupMetadata(
+            num_rows=rg["num_rows"],
+            compressed_size=rg["compressed_size"],
+            uncompressed_size=rg["uncompressed_size"],
+            columns=[_load_column(col) for col in rg["columns"]],
+        )
+        for rg in data["row_groups"]
+    ]
+    return ParquetFooter(
+        num_rows=data["num_rows"], schema=data["schema"], row_groups=row_groups, created_by=data["created_by"]
+    )
+
+
+def load_file_info(text: str | bytes, path: Path) -> FileInfo:
+    """Decode FileInfo written by dump_file_info.
+
+    Args:
+        text: JSON text of the entry.
+        path: Path of the file the entry describes.
+
+    Returns:
+        The decoded FileInfo.
+
+    Raises:
+        ValueError: If the entry is malformed.
+    """
+    try:
+        data = json.loads(text)
+        return FileInfo(
+            path=path,
+            format=FileFormat(data["format"]),
+            size_bytes=data["size_bytes"],
+            row_count=data["row_count"],
+            column_count=data["column_count"],
+            schema=data["schema"],
+            parquet_footer=_load_footer(data["parquet_footer"]),
+            row_count_error=data["row_count_error"],
+        )
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Malformed cache entry: {e}") from None
+
+
+class MetadataCache:
+    """On-disk cache of FileInfo results with size-bounded LRU eviction.
+
+    Entries are keyed by absolute path and validated against the file's size,
+    modification time and content fingerprint, so a changed file is always
+    recomputed. The cache is best-effort: if the database cannot be opened or
+    written, lookups miss and stores are skipped.
+    """
+
+    def __init__(self, cache_dir: Path | None = None, max_bytes: int = DEFAULT_MAX_CACHE_BYTES) -> None:
+        self.path = (cache_dir or default_cache_dir()) / "metadata.sqlite"
+        self.max_bytes = max_bytes
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5)
+        conn.execute(_SCHEMA)
+        return conn
+
+    @staticmethod
+    def _key(path: Path, approx: bool) -> str:
+        return f"{CACHE_FORMAT_VERSION}:{int(approx)}:{path.resolve()}"
+
+    def get(self, path: Path, approx: bool = False) -> FileInfo | None:
+        """Look up cached metadata for an unchanged file.
+
+        Args:
+            path: Path to the file.
+            approx: Whether the row count was estimated (cached separately).
+
+        Returns:
+            Cached FileInfo, or None on a miss or if the file changed.
+        """
+        key = self._key(path, approx)
+        try:
+            stat = path.stat()
+            # closing() closes the connection; the connection's own context commits
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT size_bytes, mtime_ns, fingerprint, value FROM file_info WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or (row[0], row[1]) != (stat.st_size, stat.st_mtime_ns):
+                    return None
+                if row[2] != file_fingerprint(path, stat.st_size):
+                    return None
+                conn.execute("UPDATE file_info SET last_used = ? WHERE key = ?", (time.time(), key))
+            # The entry may have been stored under another relative path to the same file
+            return load_file_info(row[3], path)
+        except (OSError, sqlite3.Error, ValueError):
+            return None
+
+    def put(self, info: FileInfo, state: FileState | None, approx: bool = False) -> None:
+        """Store metadata for a file, evicting least recently used entries.
+
+        Args:
+            info: Metadata to cache.
+            state: State of the file taken before info was computed (see
+                file_state); nothing is stored if None.
+            approx: Whether the row count was estimated.
+        """
+        if state is None:
+            return
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO file_info VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        self._key(info.path, approx),
+                        state.size_bytes,
+                        state.mtime_ns,
+                        state.fingerprint,
+                        dump_file_info(info),
+                        time.time(),
+                    ),
+                )
+                conn.execute(_EVICT, (self.max_bytes,))
+        except (OSError, sqlite3.Error):
+            return
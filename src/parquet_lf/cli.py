@@ -1,18 +1,39 @@
 """CLI application for parquet-lf using Typer and structlog."""
 
+import os
 import sys
+from collections.abc import Callable
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any, Literal
 
+import polars as pl
 import structlog
 import typer
 
 from parquet_lf import __version__
+from parquet_lf.command.batch_convert import BatchConvertInput, execute_batch_convert
 from parquet_lf.command.from_parquet_csv import FromParquetCsvInput, execute_from_parquet_csv
 from parquet_lf.command.from_parquet_ndjson import FromParquetNdjsonInput, execute_from_parquet_ndjson
+from parquet_lf.command.head import HeadInput, execute_head
 from parquet_lf.command.info import InfoInput, execute_info
+from parquet_lf.command.sample import SampleInput, execute_sample
+from parquet_lf.command.schema_infer import SchemaInferInput, execute_schema_infer
+from parquet_lf.command.tail import TailInput, execute_tail
 from parquet_lf.command.to_parquet_csv import ToParquetCsvInput, execute_to_parquet_csv
 from parquet_lf.command.to_parquet_ndjson import ToParquetNdjsonInput, execute_to_parquet_ndjson
+from parquet_lf.converters.base import (
+    DEFAULT_MAX_OPEN_FILES,
+    DEFAULT_SORT_MEMORY,
+    ParquetCompression,
+    ParquetReadOptions,
+    ParquetStatistics,
+    ParquetWriteOptions,
+)
+from parquet_lf.converters.compression import OutputCompression, infer_output_compression
+from parquet_lf.converters.shrink import TypeShrinkage
+from parquet_lf.info import BYTES_PER_MB, FileFormat
+from parquet_lf.predicate import RowGroupPruning, parse_where
+from parquet_lf.schema import DEFAULT_CATEGORICAL_RATIO, DEFAULT_SAMPLE_ROWS, SchemaInference, load_schema
 
 # Configure structlog for CLI usage
 structlog.configure(
@@ -45,9 +66,151 @@ from_parquet_app = typer.Typer(
     help="Convert Parquet to other formats.",
 )
 
+# Sub-application for schema commands
+schema_app = typer.Typer(
+    help="Create schema files for to-parquet --schema.",
+)
+
 # Register sub-applications
 app.add_typer(to_parquet_app, name="to-parquet")
 app.add_typer(from_parquet_app, name="from-parquet")
+app.add_typer(schema_app, name="schema")
+
+
+# Options shared by the conversion commands
+OutputDirOption = Annotated[
+    Path | None,
+    typer.Option(
+        "--output-dir",
+        "-d",
+        help="Convert every input into this directory (enables multiple inputs, directories and globs).",
+    ),
+]
+JobsOption = Annotated[
+    int,
+    typer.Option("--jobs", "-j", min=1, help="Number of files to convert in parallel with --output-dir."),
+]
+EagerOption = Annotated[
+    bool,
+    typer.Option("--eager", help="Load the whole file into memory instead of streaming it."),
+]
+PartitionByOption = Annotated[
+    str | None,
+    typer.Option(
+        "--partition-by",
+        help="Comma-separated columns to partition by; writes a hive-style directory tree at --output.",
+    ),
+]
+MaxOpenFilesOption = Annotated[
+    int,
+    typer.Option(
+        "--max-open-files",
+        min=1,
+        help="Maximum partitions buffered at once with --partition-by before the oldest is written out.",
+    ),
+]
+CompressionOption = Annotated[
+    ParquetCompression,
+    typer.Option("--compression", help="Parquet compression codec."),
+]
+CompressionLevelOption = Annotated[
+    int | None,
+    typer.Option("--compression-level", help="Compression level (zstd: 1-22, gzip: 0-9)."),
+]
+RowGroupSizeOption = Annotated[
+    str | None,
+    typer.Option(
+        "--row-group-size",
+        help="Rows per row group, or 'auto' to choose from the input size and column count.",
+    ),
+]
+StatisticsOption = Annotated[
+    ParquetStatistics,
+    typer.Option("--statistics", help="Column statistics to write: off, on (min/max/nulls) or full."),
+]
+SortByOption = Annotated[
+    str | None,
+    typer.Option(
+        "--sort-by",
+        help="Comma-separated columns to sort the output by, so row group statistics prune well; "
+        "spills to disk beyond --sort-memory.",
+    ),
+]
+SortMemoryOption = Annotated[
+    int,
+    typer.Option("--sort-memory", min=1, help="Memory budget in MiB for --sort-by before sorted runs spill to disk."),
+]
+ShrinkTypesOption = Annotated[
+    bool,
+    typer.Option(
+        "--shrink-types",
+        help="Cast numeric columns to the smallest type holding all their values, e.g. Int64 to Int8; "
+        "stdin and compressed input are staged in a temporary file next to the output.",
+    ),
+]
+SchemaOption = Annotated[
+    Path | None,
+    typer.Option(
+        "--schema",
+        help="JSON schema file (see `schema infer`); skips type inference and fails on the first mismatching row.",
+    ),
+]
+InferSchemaOption = Annotated[
+    SchemaInference,
+    typer.Option(
+        "--infer-schema",
+        help="Without --schema, infer types from the leading rows (head) or from samples across the file (sampled).",
+    ),
+]
+AutoCategoricalOption = Annotated[
+    bool,
+    typer.Option(
+        "--auto-categorical",
+        help="Store string columns with few distinct values in the leading rows as Categorical, "
+        "which parses them into compact dictionary codes.",
+    ),
+]
+CategoricalRatioOption = Annotated[
+    float,
+    typer.Option(
+        "--categorical-ratio",
+        min=0.0,
+        max=1.0,
+        help="Highest share of distinct values among a column's values for --auto-categorical.",
+    ),
+]
+
+ColumnsOption = Annotated[
+    str | None,
+    typer.Option("--columns", help="Comma-separated columns to read; other column chunks are never decompressed."),
+]
+ExcludeOption = Annotated[
+    str | None,
+    typer.Option("--exclude", help="Comma-separated columns to leave out."),
+]
+WhereOption = Annotated[
+    str | None,
+    typer.Option(
+        "--where",
+        help="Row filter such as \"id == 42 and day >= date('2024-01-01')\"; "
+        "row groups whose statistics rule it out are skipped.",
+    ),
+]
+OffsetOption = Annotated[
+    int,
+    typer.Option("--offset", min=0, help="Skip this many rows; only the row groups holding the slice are read."),
+]
+LimitOption = Annotated[
+    int | None,
+    typer.Option("--limit", min=0, help="Write at most this many rows."),
+]
+CompressOption = Annotated[
+    OutputCompression | None,
+    typer.Option(
+        "--compress",
+        help="Compress the output in parallel blocks; inferred from an -o extension such as .gz or .zst.",
+    ),
+]
 
 
 def version_callback(value: bool) -> None:
@@ -74,91 +237,299 @@ def main_callback(
     pass
 
 
-# --- to-parquet commands ---
+def _detach_stdout() -> None:
+    """Point stdout at /dev/null after the downstream reader closed the pipe.
 
+    Prevents Python from raising another BrokenPipeError when it flushes
+    stdout at exit (e.g. `parquet-lf from-parquet csv big.parquet | head`).
+    """
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
 
-def _handle_to_parquet_ndjson(input_file: Path, output: Path | None) -> None:
-    """Shared handler for ndjson/jsonl to parquet conversion."""
-    logger.info("conversion_start", direction="to_parquet", format="ndjson", input_file=str(input_file))
+
+def _split_columns(value: str | None) -> list[str] | None:
+    """Split a comma-separated column list, ignoring surrounding whitespace."""
+    if value is None:
+        return None
+    return [column.strip() for column in value.split(",") if column.strip()]
+
+
+def _build_write_options(
+    partition_by: str | None,
+    max_open_files: int,
+    compression: ParquetCompression,
+    compression_level: int | None,
+    row_group_size: str | None,
+    statistics: ParquetStatistics,
+    sort_by: str | None = None,
+    sort_memory: int = DEFAULT_SORT_MEMORY // BYTES_PER_MB,
+    shrink_types: bool = False,
+) -> ParquetWriteOptions:
+    """Build Parquet writer options from CLI values, exiting on invalid input."""
     try:
-        input_dto = ToParquetNdjsonInput(input_file=input_file, output=output)
-        execute_to_parquet_ndjson(input_dto)
-        logger.info("conversion_complete", direction="to_parquet", format="ndjson", input_file=str(input_file))
-    except FileNotFoundError as e:
+        parsed_row_group_size: int | Literal["auto"] | None = None
+        if row_group_size == "auto":
+            parsed_row_group_size = "auto"
+        elif row_group_size is not None:
+            if not row_group_size.isdigit() or int(row_group_size) < 1:
+                raise ValueError("--row-group-size must be a positive integer or 'auto'")
+            parsed_row_group_size = int(row_group_size)
+        return ParquetWriteOptions(
+            partition_by=_split_columns(partition_by),
+            max_open_files=max_open_files,
+            compression=compression,
+            compression_level=compression_level,
+            row_group_size=parsed_row_group_size,
+            statistics=statistics,
+            sort_by=_split_columns(sort_by),
+            sort_memory=sort_memory * BYTES_PER_MB,
+            shrink_types=shrink_types,
+        )
+    except ValueError as e:
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(code=1) from None
-    except Exception as e:
-        logger.error("conversion_failed", direction="to_parquet", format="ndjson", error=str(e))
-        typer.echo(f"Error: Failed to convert NDJSON to Parquet: {e}", err=True)
+
+
+def _build_read_options(
+    columns: str | None,
+    exclude: str | None,
+    where: str | None = None,
+    offset: int = 0,
+    limit: int | None = None,
+) -> ParquetReadOptions:
+    """Build Parquet reader options from CLI values, exiting on invalid input."""
+    if columns is not None and exclude is not None:
+        typer.echo("Error: --columns cannot be combined with --exclude", err=True)
+        raise typer.Exit(code=1)
+    if where is not None:
+        try:
+            parse_where(where)
+        except ValueError as e:
+            typer.echo(f"Error: --where: {e}", err=True)
+            raise typer.Exit(code=1) from None
+    return ParquetReadOptions(
+        columns=_split_columns(columns),
+        exclude=_split_columns(exclude),
+        where=where,
+        offset=offset,
+        limit=limit,
+    )
+
+
+def _resolve_output_compression(compress: OutputCompression | None, output: Path | None) -> OutputCompression | None:
+    """Return --compress, or the compression implied by the -o extension."""
+    if compress is not None or output is None:
+        return compress
+    return infer_output_compression(output)
+
+
+def _load_schema_option(schema_file: Path | None, infer_schema: SchemaInference) -> pl.Schema | None:
+    """Load the --schema file, exiting on a missing or invalid file."""
+    if schema_file is None:
+        return None
+    if infer_schema != SchemaInference.HEAD:
+        typer.echo("Error: --schema cannot be combined with --infer-schema", err=True)
+        raise typer.Exit(code=1)
+    try:
+        return load_schema(schema_file)
+    except (FileNotFoundError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(code=1) from None
 
 
-@to_parquet_app.command("ndjson")
-def ndjson_to_parquet(
-    input_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the input NDJSON file."),
-    ],
-    output: Annotated[
-        Path | None,
-        typer.Option("--output", "-o", help="Path to the output Parquet file."),
-    ] = None,
+def _single_input(input_files: list[Path]) -> Path:
+    """Return the only input file, or exit if several were given without --output-dir."""
+    if len(input_files) != 1:
+        typer.echo("Error: Multiple inputs require --output-dir", err=True)
+        raise typer.Exit(code=1)
+    return input_files[0]
+
+
+def _log_shrinkage(shrinkage: TypeShrinkage | None, input_file: Path) -> None:
+    """Log the numeric columns narrowed by --shrink-types and the memory they save."""
+    if shrinkage is None:
+        return
+    logger.info(
+        "types_shrunk",
+        input_file=str(input_file),
+        columns={name: str(dtype) for name, dtype in shrinkage.dtypes.items()},
+        numeric_memory_before=shrinkage.memory_before,
+        numeric_memory_after=shrinkage.memory_after,
+        numeric_memory_saved=shrinkage.memory_before - shrinkage.memory_after,
+    )
+
+
+def _log_pruning(pruning: RowGroupPruning | None, input_file: Path) -> None:
+    """Log how many row groups a --where filter ruled out from statistics."""
+    if pruning is None:
+        return
+    logger.info("row_groups_pruned", input_file=str(input_file), pruned=pruning.pruned, total=pruning.total)
+
+
+def _handle_batch(
+    direction: str,
+    file_format: str,
+    input_files: list[Path],
+    output_dir: Path,
+    jobs: int,
+    options: dict[str, Any],
 ) -> None:
-    """Convert an NDJSON file to Parquet format."""
-    _handle_to_parquet_ndjson(input_file, output)
+    """Shared handler for converting many files into an output directory."""
+    logger.info("batch_start", direction=direction, format=file_format, inputs=len(input_files), jobs=jobs)
+    try:
+        input_dto = BatchConvertInput(
+            input_files=input_files,
+            output_dir=output_dir,
+            jobs=jobs,
+            direction=direction,
+            format=file_format,
+            options=options,
+        )
+        output_dto = execute_batch_convert(input_dto)
+    except (FileNotFoundError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1) from None
 
+    for result in output_dto.results:
+        _log_shrinkage(result.shrinkage, result.input_path)
+        _log_pruning(result.pruning, result.input_path)
+    for failure in output_dto.failures:
+        logger.error(
+            "conversion_failed",
+            direction=direction,
+            format=file_format,
+            input_file=str(failure.input_path),
+            error=failure.error,
+        )
+
+    total = len(output_dto.results)
+    failed = len(output_dto.failures)
+    logger.info("batch_complete", direction=direction, format=file_format, converted=total - failed, failed=failed)
+    if failed:
+        typer.echo(f"Error: Failed to convert {failed} of {total} files", err=True)
+        raise typer.Exit(code=1)
 
-@to_parquet_app.command("jsonl")
-def jsonl_to_parquet(
-    input_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the input JSONL file."),
-    ],
-    output: Annotated[
-        Path | None,
-        typer.Option("--output", "-o", help="Path to the output Parquet file."),
-    ] = None,
-) -> None:
-    """Convert a JSONL file to Parquet format (alias for ndjson)."""
-    _handle_to_parquet_ndjson(input_file, output)
+
+# --- to-parquet commands ---
 
 
-@to_parquet_app.command("csv")
-def csv_to_parquet(
-    input_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the input CSV file."),
-    ],
-    output: Annotated[
-        Path | None,
-        typer.Option("--output", "-o", help="Path to the output Parquet file."),
-    ] = None,
-) -> None:
-    """Convert a CSV file to Parquet format."""
-    logger.info("conversion_start", direction="to_parquet", format="csv", input_file=str(input_file))
+def _handle_to_parquet(file_format: str, input_file: Path, output: Path | None, options: dict[str, Any]) -> None:
+    """Shared handler for csv/ndjson to parquet conversion of a single file."""
+    label = file_format.upper()
+    logger.info("conversion_start", direction="to_parquet", format=file_format, input_file=str(input_file))
     try:
-        input_dto = ToParquetCsvInput(input_file=input_file, output=output)
-        execute_to_parquet_csv(input_dto)
-        logger.info("conversion_complete", direction="to_parquet", format="csv", input_file=str(input_file))
+        if file_format == "csv":
+            output_dto = execute_to_parquet_csv(ToParquetCsvInput(input_file=input_file, output=output, **options))
+        else:
+            output_dto = execute_to_parquet_ndjson(
+                ToParquetNdjsonInput(input_file=input_file, output=output, **options)
+            )
+        _log_shrinkage(output_dto.shrinkage, input_file)
+        logger.info("conversion_complete", direction="to_parquet", format=file_format, input_file=str(input_file))
     except FileNotFoundError as e:
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(code=1) from None
     except Exception as e:
-        logger.error("conversion_failed", direction="to_parquet", format="csv", error=str(e))
-        typer.echo(f"Error: Failed to convert CSV to Parquet: {e}", err=True)
+        logger.error("conversion_failed", direction="to_parquet", format=file_format, error=str(e))
+        typer.echo(f"Error: Failed to convert {label} to Parquet: {e}", err=True)
         raise typer.Exit(code=1) from None
 
 
+def _to_parquet_command(batch_format: str, file_format: str, label: str, summary: str) -> Callable[..., None]:
+    """Build a to-parquet command; every input format takes the same options.
+
+    Args:
+        batch_format: Format key for batch conversion (csv, ndjson or jsonl).
+        file_format: Converter used for a single file (csv or ndjson).
+        label: Format name shown in the input argument help.
+        summary: Command help text.
+    """
+
+    def command(
+        input_files: Annotated[
+            list[Path],
+            typer.Argument(
+                help=f"Path to the input {label} file, or - for stdin. With --output-dir: files, directories or globs."
+            ),
+        ],
+        output: Annotated[
+            Path | None,
+            typer.Option("--output", "-o", help="Path to the output Parquet file."),
+        ] = None,
+        output_dir: OutputDirOption = None,
+        jobs: JobsOption = 1,
+        eager: EagerOption = False,
+        partition_by: PartitionByOption = None,
+        max_open_files: MaxOpenFilesOption = DEFAULT_MAX_OPEN_FILES,
+        compression: CompressionOption = ParquetCompression.ZSTD,
+        compression_level: CompressionLevelOption = None,
+        row_group_size: RowGroupSizeOption = None,
+        statistics: StatisticsOption = ParquetStatistics.ON,
+        sort_by: SortByOption = None,
+        sort_memory: SortMemoryOption = DEFAULT_SORT_MEMORY // BYTES_PER_MB,
+        shrink_types: ShrinkTypesOption = False,
+        schema: SchemaOption = None,
+        infer_schema: InferSchemaOption = SchemaInference.HEAD,
+        auto_categorical: AutoCategoricalOption = False,
+        categorical_ratio: CategoricalRatioOption = DEFAULT_CATEGORICAL_RATIO,
+    ) -> None:
+        write_options = _build_write_options(
+            partition_by,
+            max_open_files,
+            compression,
+            compression_level,
+            row_group_size,
+            statistics,
+            sort_by,
+            sort_memory,
+            shrink_types,
+        )
+        options = {
+            "eager": eager,
+            "write_options": write_options,
+            "schema": _load_schema_option(schema, infer_schema),
+            "schema_inference": infer_schema,
+            "categorical_ratio": categorical_ratio if auto_categorical else None,
+        }
+        if output_dir is not None:
+            _handle_batch("to_parquet", batch_format, input_files, output_dir, jobs, options)
+            return
+        _handle_to_parquet(file_format, _single_input(input_files), output, options)
+
+    # Typer reads the command help from the docstring
+    command.__doc__ = summary
+    return command
+
+
+to_parquet_app.command("ndjson")(
+    _to_parquet_command("ndjson", "ndjson", "NDJSON", "Convert NDJSON files to Parquet format.")
+)
+to_parquet_app.command("jsonl")(
+    _to_parquet_command("jsonl", "ndjson", "JSONL", "Convert JSONL files to Parquet format (alias for ndjson).")
+)
+to_parquet_app.command("csv")(_to_parquet_command("csv", "csv", "CSV", "Convert CSV files to Parquet format."))
+
+
 # --- from-parquet commands ---
 
 
-def _handle_from_parquet_ndjson(input_file: Path, output: Path | None) -> None:
+def _handle_from_parquet_ndjson(
+    input_file: Path,
+    output: Path | None,
+    read_options: ParquetReadOptions,
+    compression: OutputCompression | None,
+) -> None:
     """Shared handler for parquet to ndjson/jsonl conversion."""
     logger.info("conversion_start", direction="from_parquet", format="ndjson", input_file=str(input_file))
     try:
-        input_dto = FromParquetNdjsonInput(input_file=input_file, output=output)
-        execute_from_parquet_ndjson(input_dto)
+        input_dto = FromParquetNdjsonInput(
+            input_file=input_file, output=output, read_options=read_options, compression=compression
+        )
+        output_dto = execute_from_parquet_ndjson(input_dto)
+        _log_pruning(output_dto.pruning, input_file)
         logger.info("conversion_complete", direction="from_parquet", format="ndjson", input_file=str(input_file))
+    except BrokenPipeError:
+        _detach_stdout()
     except FileNotFoundError as e:
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(code=1) from None
@@ -170,51 +541,105 @@ def _handle_from_parquet_ndjson(input_file: Path, output: Path | None) -> None:
 
 @from_parquet_app.command("ndjson")
 def parquet_to_ndjson(
-    input_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the input Parquet file."),
+    input_files: Annotated[
+        list[Path],
+        typer.Argument(
+            help="Path to the input Parquet file, or - for stdin. With --output-dir: files, directories or globs."
+        ),
     ],
     output: Annotated[
         Path | None,
         typer.Option("--output", "-o", help="Path to the output NDJSON file."),
     ] = None,
+    output_dir: OutputDirOption = None,
+    jobs: JobsOption = 1,
+    columns: ColumnsOption = None,
+    exclude: ExcludeOption = None,
+    where: WhereOption = None,
+    offset: OffsetOption = 0,
+    limit: LimitOption = None,
+    compress: CompressOption = None,
 ) -> None:
-    """Convert a Parquet file to NDJSON format."""
-    _handle_from_parquet_ndjson(input_file, output)
+    """Convert Parquet files to NDJSON format."""
+    read_options = _build_read_options(columns, exclude, where, offset, limit)
+    if output_dir is not None:
+        options = {"read_options": read_options, "compression": compress}
+        _handle_batch("from_parquet", "ndjson", input_files, output_dir, jobs, options)
+        return
+    compression = _resolve_output_compression(compress, output)
+    _handle_from_parquet_ndjson(_single_input(input_files), output, read_options, compression)
 
 
 @from_parquet_app.command("jsonl")
 def parquet_to_jsonl(
-    input_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the input Parquet file."),
+    input_files: Annotated[
+        list[Path],
+        typer.Argument(
+            help="Path to the input Parquet file, or - for stdin. With --output-dir: files, directories or globs."
+        ),
     ],
     output: Annotated[
         Path | None,
         typer.Option("--output", "-o", help="Path to the output JSONL file."),
     ] = None,
+    output_dir: OutputDirOption = None,
+    jobs: JobsOption = 1,
+    columns: ColumnsOption = None,
+    exclude: ExcludeOption = None,
+    where: WhereOption = None,
+    offset: OffsetOption = 0,
+    limit: LimitOption = None,
+    compress: CompressOption = None,
 ) -> None:
-    """Convert a Parquet file to JSONL format (alias for ndjson)."""
-    _handle_from_parquet_ndjson(input_file, output)
+    """Convert Parquet files to JSONL format (alias for ndjson)."""
+    read_options = _build_read_options(columns, exclude, where, offset, limit)
+    if output_dir is not None:
+        options = {"read_options": read_options, "compression": compress}
+        _handle_batch("from_parquet", "jsonl", input_files, output_dir, jobs, options)
+        return
+    compression = _resolve_output_compression(compress, output)
+    _handle_from_parquet_ndjson(_single_input(input_files), output, read_options, compression)
 
 
 @from_parquet_app.command("csv")
 def parquet_to_csv(
-    input_file: Annotated[
-        Path,
-        typer.Argument(help="Path to the input Parquet file."),
+    input_files: Annotated[
+        list[Path],
+        typer.Argument(
+            help="Path to the input Parquet file, or - for stdin. With --output-dir: files, directories or globs."
+        ),
     ],
     output: Annotated[
         Path | None,
         typer.Option("--output", "-o", help="Path to the output CSV file."),
     ] = None,
+    output_dir: OutputDirOption = None,
+    jobs: JobsOption = 1,
+    columns: ColumnsOption = None,
+    exclude: ExcludeOption = None,
+    where: WhereOption = None,
+    offset: OffsetOption = 0,
+    limit: LimitOption = None,
+    compress: CompressOption = None,
 ) -> None:
-    """Convert a Parquet file to CSV format."""
+    """Convert Parquet files to CSV format."""
+    read_options = _build_read_options(columns, exclude, where, offset, limit)
+    if output_dir is not None:
+        options = {"read_options": read_options, "compression": compress}
+        _handle_batch("from_parquet", "csv", input_files, output_dir, jobs, options)
+        return
+    input_file = _single_input(input_files)
+    compression = _resolve_output_compression(compress, output)
     logger.info("conversion_start", direction="from_parquet", format="csv", input_file=str(input_file))
     try:
-        input_dto = FromParquetCsvInput(input_file=input_file, output=output)
-        execute_from_parquet_csv(input_dto)
+        input_dto = FromParquetCsvInput(
+            input_file=input_file, output=output, read_options=read_options, compression=compression
+        )
+        output_dto = execute_from_parquet_csv(input_dto)
+        _log_pruning(output_dto.pruning, input_file)
         logger.info("conversion_complete", direction="from_parquet", format="csv", input_file=str(input_file))
+    except BrokenPipeError:
+        _detach_stdout()
     except FileNotFoundError as e:
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(code=1) from None
@@ -235,13 +660,48 @@ def info_command(
     ],
     head: Annotated[
         int | None,
-        typer.Option("--head", "-n", help="Show first N rows of the file."),
+        typer.Option("--head", "--limit", "-n", min=0, help="Show first N rows of the file."),
     ] = None,
+    approx: Annotated[
+        bool,
+        typer.Option(
+            "--approx",
+            help="Estimate the CSV/NDJSON row count from a few sampled byte ranges instead of reading the whole file.",
+        ),
+    ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Recompute metadata instead of using or updating the metadata cache."),
+    ] = False,
+    columns: Annotated[
+        str | None,
+        typer.Option("--columns", help="Comma-separated columns to show in the --head preview."),
+    ] = None,
+    exclude: Annotated[
+        str | None,
+        typer.Option("--exclude", help="Comma-separated columns to leave out of the --head preview."),
+    ] = None,
+    offset: Annotated[
+        int,
+        typer.Option("--offset", min=0, help="Start the --head preview after this many rows."),
+    ] = 0,
 ) -> None:
     """Display file information and optionally preview rows."""
+    if offset and head is None:
+        typer.echo("Error: --offset requires --head", err=True)
+        raise typer.Exit(code=1)
+    read_options = _build_read_options(columns, exclude)
     logger.info("info_start", input_file=str(input_file))
     try:
-        input_dto = InfoInput(input_file=input_file, head=head)
+        input_dto = InfoInput(
+            input_file=input_file,
+            head=head,
+            approx=approx,
+            use_cache=not no_cache,
+            columns=read_options.columns,
+            exclude=read_options.exclude,
+            offset=offset,
+        )
         output_dto = execute_info(input_dto)
         typer.echo(output_dto.formatted_output)
         logger.info("info_complete", input_file=str(input_file))
@@ -255,3 +715,184 @@ def info_command(
         logger.error("info_failed", input_file=str(input_file), error=str(e))
         typer.echo(f"Error: Failed to get file info: {e}", err=True)
         raise typer.Exit(code=1) from None
+
+
+# --- head/tail commands ---
+
+RowsOption = Annotated[
+    int,
+    typer.Option("--rows", "-n", min=0, help="Number of rows to show."),
+]
+
+
+@app.command("head")
+def head_command(
+    input_file: Annotated[
+        Path,
+        typer.Argument(help="Path to the Parquet, CSV or NDJSON file."),
+    ],
+    rows: RowsOption = 10,
+    columns: ColumnsOption = None,
+    exclude: ExcludeOption = None,
+) -> None:
+    """Show the first rows of a file, reading only as much as needed."""
+    read_options = _build_read_options(columns, exclude)
+    logger.info("head_start", input_file=str(input_file))
+    try:
+        input_dto = HeadInput(
+            input_file=input_file, rows=rows, columns=read_options.columns, exclude=read_options.exclude
+        )
+        output_dto = execute_head(input_dto)
+        typer.echo(output_dto.formatted_output)
+        logger.info("head_complete", input_file=str(input_file), rows=output_dto.rows.height)
+    except (FileNotFoundError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1) from None
+    except Exception as e:
+        logger.error("head_failed", input_file=str(input_file), error=str(e))
+        typer.echo(f"Error: Failed to read file: {e}", err=True)
+        raise typer.Exit(code=1) from None
+
+
+@app.command("tail")
+def tail_command(
+    input_file: Annotated[
+        Path,
+        typer.Argument(help="Path to the Parquet, CSV or NDJSON file."),
+    ],
+    rows: RowsOption = 10,
+    columns: ColumnsOption = None,
+    exclude: ExcludeOption = None,
+) -> None:
+    """Show the last rows of a file without scanning it from the start."""
+    read_options = _build_read_options(columns, exclude)
+    logger.info("tail_start", input_file=str(input_file))
+    try:
+        input_dto = TailInput(
+            input_file=input_file, rows=rows, columns=read_options.columns, exclude=read_options.exclude
+        )
+        output_dto = execute_tail(input_dto)
+        typer.echo(output_dto.formatted_output)
+        logger.info("tail_complete", input_file=str(input_file), rows=output_dto.rows.height)
+    except (FileNotFoundError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1) from None
+    except Exception as e:
+        logger.error("tail_failed", input_file=str(input_file), error=str(e))
+        typer.echo(f"Error: Failed to read file: {e}", err=True)
+        raise typer.Exit(code=1) from None
+
+
+# --- sample command ---
+
+
+@app.command("sample")
+def sample_command(
+    input_file: Annotated[
+        Path,
+        typer.Argument(help="Path to the input Parquet file, or - for stdin."),
+    ],
+    output: Annotated[
+        Path | None,
+        typer.Option("--output", "-o", help="Path to the output file (default: stdout)."),
+    ] = None,
+    rows: Annotated[
+        int | None,
+        typer.Option("--rows", "-n", min=0, help="Number of rows to sample."),
+    ] = None,
+    fraction: Annotated[
+        float | None,
+        typer.Option("--fraction", min=0.0, max=1.0, help="Share of rows to sample, e.g. 0.001 for 0.1%."),
+    ] = None,
+    seed: Annotated[
+        int | None,
+        typer.Option("--seed", help="Seed for a reproducible sample."),
+    ] = None,
+    by_row_group: Annotated[
+        bool,
+        typer.Option(
+            "--by-row-group",
+            help="Sample within randomly picked whole row groups: reads far less, but rows cluster in those groups.",
+        ),
+    ] = False,
+    output_format: Annotated[
+        FileFormat | None,
+        typer.Option("--format", help="Output format (default: from the --output extension, or csv for stdout)."),
+    ] = None,
+    columns: ColumnsOption = None,
+    exclude: ExcludeOption = None,
+) -> None:
+    """Write a random sample of a Parquet file's rows."""
+    if (rows is None) == (fraction is None):
+        typer.echo("Error: Give exactly one of --rows and --fraction", err=True)
+        raise typer.Exit(code=1)
+    read_options = _build_read_options(columns, exclude)
+    logger.info("sample_start", input_file=str(input_file))
+    try:
+        input_dto = SampleInput(
+            input_file=input_file,
+            output=output,
+            rows=rows,
+            fraction=fraction,
+            seed=seed,
+            by_row_group=by_row_group,
+            output_format=output_format,
+            columns=read_options.columns,
+            exclude=read_options.exclude,
+        )
+        output_dto = execute_sample(input_dto)
+        logger.info(
+            "sample_complete",
+            input_file=str(input_file),
+            rows=output_dto.rows,
+            row_groups_read=output_dto.row_groups_read,
+            row_groups_total=output_dto.row_groups_total,
+        )
+    except BrokenPipeError:
+        _detach_stdout()
+    except (FileNotFoundError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1) from None
+    except Exception as e:
+        logger.error("sample_failed", input_file=str(input_file), error=str(e))
+        typer.echo(f"Error: Failed to sample file: {e}", err=True)
+        raise typer.Exit(code=1) from None
+
+
+# --- schema commands ---
+
+
+@schema_app.command("infer")
+def schema_infer_command(
+    input_file: Annotated[
+        Path,
+        typer.Argument(help="Path to a CSV, NDJSON or Parquet file to infer the schema from."),
+    ],
+    output: Annotated[
+        Path | None,
+        typer.Option("--output", "-o", help="Path to write the schema file to (default: stdout)."),
+    ] = None,
+    sample_rows: Annotated[
+        int,
+        typer.Option("--sample-rows", min=1, help="Number of leading CSV/NDJSON rows to infer types from."),
+    ] = DEFAULT_SAMPLE_ROWS,
+    sampled: Annotated[
+        bool,
+        typer.Option("--sampled", help="Infer CSV/NDJSON types from samples spread across the whole file."),
+    ] = False,
+) -> None:
+    """Infer a schema file for use with to-parquet --schema."""
+    logger.info("schema_infer_start", input_file=str(input_file))
+    try:
+        input_dto = SchemaInferInput(input_file=input_file, output=output, sample_rows=sample_rows, sampled=sampled)
+        output_dto = execute_schema_infer(input_dto)
+        if output is None:
+            typer.echo(output_dto.formatted_output)
+        logger.info("schema_infer_complete", input_file=str(input_file), columns=len(output_dto.schema))
+    except (FileNotFoundError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1) from None
+    except Exception as e:
+        logger.error("schema_infer_failed", input_file=str(input_file), error=str(e))
+        typer.echo(f"Error: Failed to infer schema: {e}", err=True)
+        raise typer.Exit(code=1) from None
@@ -0,0 +1,101 @@
+"""Batch convert command handler with DTOs for input/output."""
+
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Protocol
+
+from parquet_lf.batch import BatchResult, expand_inputs, run_batch
+from parquet_lf.converters.compression import OUTPUT_EXTENSIONS
+from parquet_lf.converters.csv import csv_to_parquet, parquet_to_csv
+from parquet_lf.converters.ndjson import ndjson_to_parquet, parquet_to_ndjson
+from parquet_lf.predicate import count_pruned_row_groups
+
+
+class BatchConverter(Protocol):
+    """A file converter taking an input and output path; further options have defaults."""
+
+    def __call__(self, input_path: Path, output: Path | None, /) -> object: ...
+
+
+# (direction, format) -> (converter, input extensions, output extension)
+BATCH_CONVERTERS: dict[tuple[str, str], tuple[BatchConverter, tuple[str, ...], str]] = {
+    ("to_parquet", "csv"): (csv_to_parquet, (".csv",), ".parquet"),
+    ("to_parquet", "ndjson"): (ndjson_to_parquet, (".ndjson", ".jsonl"), ".parquet"),
+    ("to_parquet", "jsonl"): (ndjson_to_parquet, (".ndjson", ".jsonl"), ".parquet"),
+    ("from_parquet", "csv"): (parquet_to_csv, (".parquet",), ".csv"),
+    ("from_parquet", "ndjson"): (parquet_to_ndjson, (".parquet",), ".ndjson"),
+    ("from_parquet", "jsonl"): (parquet_to_ndjson, (".parquet",), ".jsonl"),
+}
+
+
+@dataclass
+class BatchConvertInput:
+    """Input DTO for converting many files into an output directory."""
+
+    input_files: list[Path]
+    output_dir: Path
+    jobs: int
+    direction: str
+    format: str
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BatchConvertOutput:
+    """Output DTO for a batch conversion."""
+
+    results: list[BatchResult]
+
+    @property
+    def failures(self) -> list[BatchResult]:
+        """Results for files that failed to convert."""
+        return [result for result in self.results if result.error is not None]
+
+
+def execute_batch_convert(input_dto: BatchConvertInput) -> BatchConvertOutput:
+    """Execute a batch conversion.
+
+    Args:
+        input_dto: Input DTO with inputs, output directory, job count,
+            conversion direction/format and extra converter options.
+
+    Returns:
+        BatchConvertOutput DTO with one result per converted file, including
+        the numeric type shrinkage of Parquet outputs and, when a filter was
+        applied to Parquet inputs, row group pruning counts.
+
+    Raises:
+        FileNotFoundError: If an input does not exist or a pattern matches nothing.
+        ValueError: If the conversion is unknown, no inputs are found, or
+            two inputs map to the same output file.
+    """
+    key = (input_dto.direction, input_dto.format)
+    if key not in BATCH_CONVERTERS:
+        raise ValueError(f"Unsupported batch conversion: {input_dto.direction} {input_dto.format}")
+    converter, input_extensions, output_extension = BATCH_CONVERTERS[key]
+    if (compression := input_dto.options.get("compression")) is not None:
+        # Compressed text outputs are named e.g. data.csv.gz
+        output_extension += OUTPUT_EXTENSIONS[compression]
+
+    if any(str(path) == "-" for path in input_dto.input_files):
+        raise ValueError("stdin (-) cannot be used with --output-dir")
+
+    input_paths = expand_inputs(input_dto.input_files, input_extensions)
+    if not input_paths:
+        raise ValueError("No input files found")
+
+    results = run_batch(
+        partial(converter, **input_dto.options),
+        input_paths,
+        input_dto.output_dir,
+        output_extension,
+        input_dto.jobs,
+    )
+
+    read_options = input_dto.options.get("read_options")
+    if read_options is not None and read_options.where is not None:
+        for result in results:
+            if result.error is None:
+                result.pruning = count_pruned_row_groups(result.input_path, read_options.where)
+    return BatchConvertOutput(results=results)
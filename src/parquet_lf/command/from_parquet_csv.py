@@ -3,7 +3,10 @@
 from dataclasses import dataclass
 from pathlib import Path
 
+from parquet_lf.converters.base import ParquetReadOptions
+from parquet_lf.converters.compression import OutputCompression
 from parquet_lf.converters.csv import parquet_to_csv
+from parquet_lf.predicate import RowGroupPruning, count_pruned_row_groups
 
 
 @dataclass
@@ -12,16 +15,35 @@ class FromParquetCsvInput:
 
     input_file: Path
     output: Path | None
+    read_options: ParquetReadOptions | None = None
+    compression: OutputCompression | None = None
 
 
-def execute_from_parquet_csv(input_dto: FromParquetCsvInput) -> None:
+@dataclass
+class FromParquetCsvOutput:
+    """Output DTO for the from-parquet csv command."""
+
+    pruning: RowGroupPruning | None
+
+
+def execute_from_parquet_csv(input_dto: FromParquetCsvInput) -> FromParquetCsvOutput:
     """Execute the from-parquet csv command.
 
     Args:
-        input_dto: Input DTO with file path and output option.
+        input_dto: Input DTO with file path, output, read options and output compression.
+
+    Returns:
+        FromParquetCsvOutput DTO with row group pruning counts when a filter
+        was applied to a file input.
 
     Raises:
         FileNotFoundError: If the input file does not exist.
+        ValueError: If a selected column does not exist or the filter is invalid.
         pl.exceptions.ComputeError: If the Parquet file cannot be read.
     """
-    parquet_to_csv(input_dto.input_file, input_dto.output)
+    parquet_to_csv(input_dto.input_file, input_dto.output, input_dto.read_options, input_dto.compression)
+
+    where = input_dto.read_options.where if input_dto.read_options is not None else None
+    if where is None or str(input_dto.input_file) == "-":
+        return FromParquetCsvOutput(pruning=None)
+    return FromParquetCsvOutput(pruning=count_pruned_row_groups(input_dto.input_file, where))
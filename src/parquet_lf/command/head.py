@@ -0,0 +1,49 @@
+"""Head command handler with DTOs for input/output."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import polars as pl
+
+from parquet_lf.info import detect_format, format_rows, read_head
+
+
+@dataclass
+class HeadInput:
+    """Input DTO for the head command."""
+
+    input_file: Path
+    rows: int
+    columns: list[str] | None = None
+    exclude: list[str] | None = None
+
+
+@dataclass
+class HeadOutput:
+    """Output DTO for the head command."""
+
+    rows: pl.DataFrame
+    formatted_output: str
+
+
+def execute_head(input_dto: HeadInput) -> HeadOutput:
+    """Execute the head command.
+
+    Args:
+        input_dto: Input DTO with file path, row count and column options.
+
+    Returns:
+        HeadOutput DTO with the first rows and formatted output.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file extension is not supported, the file is
+            compressed or a selected column does not exist.
+    """
+    if not input_dto.input_file.exists():
+        raise FileNotFoundError(f"Input file not found: {input_dto.input_file}")
+    file_format = detect_format(input_dto.input_file)
+
+    rows = read_head(input_dto.input_file, file_format, input_dto.rows, input_dto.columns, input_dto.exclude)
+
+    return HeadOutput(rows=rows, formatted_output=format_rows(rows))
@@ -5,11 +5,12 @@ from pathlib import Path
 
 import polars as pl
 
+from parquet_lf.cache import MetadataCache, file_state
 from parquet_lf.info import (
     FileInfo,
     format_file_info,
     get_file_info,
-    get_file_info_with_preview,
+    read_head,
 )
 
 
@@ -19,6 +20,11 @@ class InfoInput:
 
     input_file: Path
     head: int | None
+    approx: bool = False
+    use_cache: bool = False
+    columns: list[str] | None = None
+    exclude: list[str] | None = None
+    offset: int = 0
 
 
 @dataclass
@@ -34,24 +40,39 @@ def execute_info(input_dto: InfoInput) -> InfoOutput:
     """Execute the info command.
 
     Args:
-        input_dto: Input DTO with file path and head option.
+        input_dto: Input DTO with file path, head, approx, cache and preview
+            column and offset options.
 
     Returns:
         InfoOutput DTO with file info, optional preview, and formatted output.
 
     Raises:
         FileNotFoundError: If the file does not exist.
-        ValueError: If the file extension is not supported.
+        ValueError: If the file extension is not supported, the file is compressed or a preview
+            column does not exist.
     """
+    cache = MetadataCache() if input_dto.use_cache else None
+    file_info = cache.get(input_dto.input_file, input_dto.approx) if cache is not None else None
+    if file_info is None:
+        # Taken before reading, so a file that changes meanwhile is not cached under its new state
+        state = file_state(input_dto.input_file) if cache is not None else None
+        file_info = get_file_info(input_dto.input_file, input_dto.approx)
+        if cache is not None:
+            cache.put(file_info, state, input_dto.approx)
+
+    # The preview reads only the requested rows and is never cached
+    preview = None
     if input_dto.head is not None:
-        # Use optimized single-read path when preview is requested
-        file_info, preview = get_file_info_with_preview(input_dto.input_file, input_dto.head)
-    else:
-        # Use lazy evaluation when no preview is needed
-        file_info = get_file_info(input_dto.input_file)
-        preview = None
-
-    formatted_output = format_file_info(file_info, preview)
+        preview = read_head(
+            input_dto.input_file,
+            file_info.format,
+            input_dto.head,
+            input_dto.columns,
+            input_dto.exclude,
+            input_dto.offset,
+        )
+
+    formatted_output = format_file_info(file_info, preview, input_dto.offset)
 
     return InfoOutput(
         file_info=file_info,
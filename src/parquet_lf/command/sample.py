@@ -0,0 +1,99 @@
+"""Sample command handler with DTOs for input/output."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import polars as pl
+
+from parquet_lf.converters.base import parquet_input, write_parquet_output
+from parquet_lf.converters.compression import OutputCompression, infer_output_compression, text_output
+from parquet_lf.info import FileFormat, detect_format
+from parquet_lf.sample import sample_parquet
+
+
+@dataclass
+class SampleInput:
+    """Input DTO for the sample command."""
+
+    input_file: Path
+    output: Path | None
+    rows: int | None = None
+    fraction: float | None = None
+    seed: int | None = None
+    by_row_group: bool = False
+    output_format: FileFormat | None = None
+    columns: list[str] | None = None
+    exclude: list[str] | None = None
+
+
+@dataclass
+class SampleOutput:
+    """Output DTO for the sample command."""
+
+    rows: int
+    row_groups_read: int
+    row_groups_total: int
+
+
+def _write_rows(
+    df: pl.DataFrame, output: Path | None, output_format: FileFormat, compression: OutputCompression | None
+) -> None:
+    """Write sampled rows to a file or stdout in the given format."""
+    if output_format == FileFormat.PARQUET:
+        write_parquet_output(df, output)
+        return
+    with text_output(output, compression) as sink:
+        if output_format == FileFormat.CSV:
+            df.write_csv(sink)
+        else:
+            df.write_ndjson(sink)
+
+
+def execute_sample(input_dto: SampleInput) -> SampleOutput:
+    """Execute the sample command.
+
+    The output format defaults to the output file's extension, or CSV when
+    writing to stdout. Text output is compressed if the output extension
+    names a compression, e.g. sample.csv.gz.
+
+    Args:
+        input_dto: Input DTO with file path, output, sample size, seed and
+            column options.
+
+    Returns:
+        SampleOutput DTO with the number of sampled rows and row groups read.
+
+    Raises:
+        FileNotFoundError: If the input file does not exist.
+        ValueError: If the sample size is invalid, the input is not Parquet,
+            the output extension is not supported, Parquet output is given a
+            compression extension or a selected column does not exist.
+    """
+    output = input_dto.output
+    compression = None
+    if output is None or str(output) == "-":
+        output_format = input_dto.output_format or FileFormat.CSV
+    else:
+        compression = infer_output_compression(output)
+        output_format = input_dto.output_format or detect_format(output)
+    if output_format == FileFormat.PARQUET and compression is not None:
+        raise ValueError(f"Parquet output is compressed internally and cannot be written to {output}")
+
+    with parquet_input(input_dto.input_file) as parquet_path:
+        sample = sample_parquet(
+            parquet_path,
+            rows=input_dto.rows,
+            fraction=input_dto.fraction,
+            seed=input_dto.seed,
+            by_row_group=input_dto.by_row_group,
+            columns=input_dto.columns,
+            exclude=input_dto.exclude,
+        )
+
+    _write_rows(sample.rows, output, output_format, compression)
+
+    return SampleOutput(
+        rows=sample.rows.height,
+        row_groups_read=sample.row_groups_read,
+        row_groups_total=sample.row_groups_total,
+    )
@@ -0,0 +1,53 @@
+"""Schema infer command handler with DTOs for input/output."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import polars as pl
+
+from parquet_lf.schema import DEFAULT_SAMPLE_ROWS, infer_schema, infer_schema_sampled, schema_to_json
+
+
+@dataclass
+class SchemaInferInput:
+    """Input DTO for the schema infer command."""
+
+    input_file: Path
+    output: Path | None
+    sample_rows: int = DEFAULT_SAMPLE_ROWS
+    sampled: bool = False
+
+
+@dataclass
+class SchemaInferOutput:
+    """Output DTO for the schema infer command."""
+
+    schema: pl.Schema
+    formatted_output: str
+
+
+def execute_schema_infer(input_dto: SchemaInferInput) -> SchemaInferOutput:
+    """Execute the schema infer command.
+
+    Args:
+        input_dto: Input DTO with file path, output path and sampling options.
+
+    Returns:
+        SchemaInferOutput DTO with the schema and its JSON text. The JSON is
+        also written to the output file when one is given.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file extension is not supported, the file is
+            compressed, or sampled inference is requested for a Parquet file.
+    """
+    if input_dto.sampled:
+        schema = infer_schema_sampled(input_dto.input_file)
+    else:
+        schema = infer_schema(input_dto.input_file, input_dto.sample_rows)
+    formatted_output = schema_to_json(schema)
+
+    if input_dto.output is not None:
+        input_dto.output.write_text(formatted_output + "\n")
+
+    return SchemaInferOutput(schema=schema, formatted_output=formatted_output)
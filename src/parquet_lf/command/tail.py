@@ -0,0 +1,49 @@
+"""Tail command handler with DTOs for input/output."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import polars as pl
+
+from parquet_lf.info import detect_format, format_rows, read_tail
+
+
+@dataclass
+class TailInput:
+    """Input DTO for the tail command."""
+
+    input_file: Path
+    rows: int
+    columns: list[str] | None = None
+    exclude: list[str] | None = None
+
+
+@dataclass
+class TailOutput:
+    """Output DTO for the tail command."""
+
+    rows: pl.DataFrame
+    formatted_output: str
+
+
+def execute_tail(input_dto: TailInput) -> TailOutput:
+    """Execute the tail command.
+
+    Args:
+        input_dto: Input DTO with file path, row count and column options.
+
+    Returns:
+        TailOutput DTO with the last rows and formatted output.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file extension is not supported, the file is
+            compressed or a selected column does not exist.
+    """
+    if not input_dto.input_file.exists():
+        raise FileNotFoundError(f"Input file not found: {input_dto.input_file}")
+    file_format = detect_format(input_dto.input_file)
+
+    rows = read_tail(input_dto.input_file, file_format, input_dto.rows, input_dto.columns, input_dto.exclude)
+
+    return TailOutput(rows=rows, formatted_output=format_rows(rows))
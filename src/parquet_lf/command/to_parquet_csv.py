@@ -1,9 +1,14 @@
 """To-parquet CSV command handler with DTOs for input/output."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
+import polars as pl
+
+from parquet_lf.converters.base import ParquetWriteOptions
 from parquet_lf.converters.csv import csv_to_parquet
+from parquet_lf.converters.shrink import TypeShrinkage
+from parquet_lf.schema import SchemaInference
 
 
 @dataclass
@@ -12,16 +17,41 @@ class ToParquetCsvInput:
 
     input_file: Path
     output: Path | None
+    eager: bool = False
+    write_options: ParquetWriteOptions = field(default_factory=ParquetWriteOptions)
+    schema: pl.Schema | None = None
+    schema_inference: SchemaInference = SchemaInference.HEAD
+    categorical_ratio: float | None = None
+
+
+@dataclass
+class ToParquetCsvOutput:
+    """Output DTO for the to-parquet csv command."""
+
+    shrinkage: TypeShrinkage | None = None
 
 
-def execute_to_parquet_csv(input_dto: ToParquetCsvInput) -> None:
+def execute_to_parquet_csv(input_dto: ToParquetCsvInput) -> ToParquetCsvOutput:
     """Execute the to-parquet csv command.
 
     Args:
-        input_dto: Input DTO with file path and output option.
+        input_dto: Input DTO with file path, output, eager, writer options and schema settings.
+
+    Returns:
+        ToParquetCsvOutput DTO with the narrowed numeric types, if requested.
 
     Raises:
         FileNotFoundError: If the input file does not exist.
+        ValueError: If the CSV header does not match the schema.
         pl.exceptions.ComputeError: If the CSV cannot be parsed.
     """
-    csv_to_parquet(input_dto.input_file, input_dto.output)
+    shrinkage = csv_to_parquet(
+        input_dto.input_file,
+        input_dto.output,
+        eager=input_dto.eager,
+        write_options=input_dto.write_options,
+        schema=input_dto.schema,
+        schema_inference=input_dto.schema_inference,
+        categorical_ratio=input_dto.categorical_ratio,
+    )
+    return ToParquetCsvOutput(shrinkage=shrinkage)
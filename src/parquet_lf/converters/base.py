@@ -1,36 +1,435 @@
 """Base utilities for format converters."""
 
-import io
+import os
+import secrets
+import shutil
 import sys
+import tempfile
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
+from typing import Any, Literal
 
 import polars as pl
 
+from parquet_lf.predicate import parse_where
 
-def write_parquet_output(df: pl.DataFrame, output: Path | None) -> None:
+# Rows per batch when streaming text output
+TEXT_BATCH_SIZE = 65_536
+
+# Bytes copied per read when spooling stdin to disk
+STDIN_COPY_SIZE = 1024 * 1024
+
+# Partitions buffered at the same time before the least recently used one is written out
+DEFAULT_MAX_OPEN_FILES = 1024
+
+# Memory of the rows buffered for all partitions before the largest one is written out
+PARTITION_BUFFER_BYTES = 128 * 1024 * 1024
+
+# Auto row group sizing: target uncompressed bytes per row group, assumed
+# bytes per value, minimum number of groups for inputs that are large enough,
+# and bounds on the resulting row count
+AUTO_ROW_GROUP_TARGET_BYTES = 128 * 1024 * 1024
+AUTO_BYTES_PER_VALUE = 8
+AUTO_MIN_ROW_GROUPS = 4
+AUTO_MIN_ROW_GROUP_SIZE = 16_384
+AUTO_MAX_ROW_GROUP_SIZE = 1_048_576
+
+# Memory budget of --sort-by before sorted runs are spilled to disk
+DEFAULT_SORT_MEMORY = 1024 * 1024 * 1024
+
+
+class ParquetCompression(Enum):
+    """Compression codecs supported for Parquet output."""
+
+    ZSTD = "zstd"
+    SNAPPY = "snappy"
+    LZ4 = "lz4"
+    GZIP = "gzip"
+    UNCOMPRESSED = "uncompressed"
+
+
+class ParquetStatistics(Enum):
+    """Column statistics written to the Parquet footer."""
+
+    OFF = "off"
+    ON = "on"
+    FULL = "full"
+
+
+# Codecs that accept a compression level
+LEVELED_COMPRESSIONS = frozenset({ParquetCompression.ZSTD, ParquetCompression.GZIP})
+
+
+@dataclass
+class ParquetWriteOptions:
+    """Options controlling how Parquet output is written.
+
+    Raises:
+        ValueError: If a compression level is given for a codec without
+            levels, or the sort memory budget is not positive.
+    """
+
+    partition_by: list[str] | None = None
+    max_open_files: int = DEFAULT_MAX_OPEN_FILES
+    compression: ParquetCompression = ParquetCompression.ZSTD
+    compression_level: int | None = None
+    row_group_size: int | Literal["auto"] | None = None
+    statistics: ParquetStatistics = ParquetStatistics.ON
+    sort_by: list[str] | None = None
+    sort_memory: int = DEFAULT_SORT_MEMORY
+    shrink_types: bool = False
+
+    def __post_init__(self) -> None:
+        if self.compression_level is not None and self.compression not in LEVELED_COMPRESSIONS:
+            raise ValueError(f"Compression level is not supported for {self.compression.value}")
+        if self.sort_memory < 1:
+            raise ValueError("Sort memory budget must be positive")
+
+
+@dataclass
+class ParquetReadOptions:
+    """Options controlling which parts of a Parquet file are read.
+
+    Raises:
+        ValueError: If both columns and exclude are given, or offset or limit
+            is negative.
+    """
+
+    columns: list[str] | None = None
+    exclude: list[str] | None = None
+    where: str | None = None
+    offset: int = 0
+    limit: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.columns is not None and self.exclude is not None:
+            raise ValueError("columns and exclude cannot be combined")
+        if self.offset < 0 or (self.limit is not None and self.limit < 0):
+            raise ValueError("offset and limit must not be negative")
+
+
+def auto_row_group_size(column_count: int, input_bytes: int | None = None) -> int:
+    """Choose a row group size from the table width and input size.
+
+    Aims for row groups of roughly AUTO_ROW_GROUP_TARGET_BYTES of uncompressed
+    data, so wide tables get fewer rows per group. When the input size is known,
+    inputs that would fit in a handful of groups are split into at least
+    AUTO_MIN_ROW_GROUPS so min/max statistics can still prune.
+
+    Args:
+        column_count: Number of columns in the output.
+        input_bytes: Size of the input data in bytes, if known.
+
+    Returns:
+        Number of rows per row group.
+    """
+    bytes_per_row = max(column_count, 1) * AUTO_BYTES_PER_VALUE
+    rows = AUTO_ROW_GROUP_TARGET_BYTES // bytes_per_row
+    if input_bytes is not None:
+        rows = min(rows, input_bytes // bytes_per_row // AUTO_MIN_ROW_GROUPS)
+    return max(AUTO_MIN_ROW_GROUP_SIZE, min(rows, AUTO_MAX_ROW_GROUP_SIZE))
+
+
+def _writer_kwargs(options: ParquetWriteOptions, column_count: int, input_bytes: int | None) -> dict[str, Any]:
+    """Translate write options into keyword arguments for the polars writer."""
+    row_group_size = options.row_group_size
+    if row_group_size == "auto":
+        row_group_size = auto_row_group_size(column_count, input_bytes)
+
+    statistics: bool | str = {
+        ParquetStatistics.OFF: False,
+        ParquetStatistics.ON: True,
+        ParquetStatistics.FULL: "full",
+    }[options.statistics]
+
+    return {
+        "compression": options.compression.value,
+        "compression_level": options.compression_level,
+        "row_group_size": row_group_size,
+        "statistics": statistics,
+    }
+
+
+@contextmanager
+def polars_env(name: str, value: str) -> Iterator[None]:
+    """Temporarily set a polars environment variable.
+
+    Polars reads some tuning knobs from the environment when a query (or a
+    child process) starts, so they are only set for the duration of the context.
+
+    Args:
+        name: Environment variable name.
+        value: Value to set.
+    """
+    previous = os.environ.get(name)
+    os.environ[name] = value
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ[name]
+        else:
+            os.environ[name] = previous
+
+
+@contextmanager
+def parquet_input(input_path: Path) -> Iterator[Path]:
+    """Resolve a Parquet input to a readable file path.
+
+    Parquet keeps its metadata in a footer at the end of the file, so stdin
+    ("-") cannot be decoded incrementally. It is instead copied to a temporary
+    file in fixed-size chunks, which keeps memory bounded.
+
+    Args:
+        input_path: Path to the input Parquet file, or "-" for stdin.
+
+    Yields:
+        Path to a Parquet file that exists for the duration of the context.
+
+    Raises:
+        FileNotFoundError: If the input file does not exist.
+    """
+    if str(input_path) == "-":
+        with tempfile.NamedTemporaryFile(suffix=".parquet") as spool:
+            shutil.copyfileobj(sys.stdin.buffer, spool, STDIN_COPY_SIZE)
+            spool.flush()
+            yield Path(spool.name)
+        return
+
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input file not found: {input_path}")
+    yield input_path
+
+
+def staging_path(output: Path, suffix: str = ".tmp") -> Path:
+    """Return a unique hidden path next to an output for data written before it.
+
+    Args:
+        output: Final output path.
+        suffix: Suffix of the temporary file name.
+
+    Returns:
+        Path in the output's directory that no other run uses.
+    """
+    return output.with_name(f".{output.name}.{secrets.token_hex(4)}{suffix}")
+
+
+@contextmanager
+def atomic_output(output: Path) -> Iterator[Path]:
+    """Write a file under a temporary name and move it into place on success.
+
+    The temporary file lives next to the output, so the final rename is an
+    atomic os.replace on the same filesystem. If writing fails, it is removed
+    and any previous output is left untouched, so a failed conversion never
+    leaves a truncated but readable file behind.
+
+    Args:
+        output: Final output path.
+
+    Yields:
+        Temporary path to write to, in the output's directory.
+    """
+    staging = staging_path(output)
+    try:
+        yield staging
+        os.replace(staging, output)
+    finally:
+        staging.unlink(missing_ok=True)
+
+
+def select_columns(
+    lf: pl.LazyFrame, columns: list[str] | None = None, exclude: list[str] | None = None
+) -> pl.LazyFrame:
+    """Keep only the named columns, or drop the excluded ones.
+
+    Applied to a scan, the projection is pushed into the reader, so for
+    Parquet the column chunks of unselected columns are never read or
+    decompressed.
+
+    Args:
+        lf: LazyFrame to project, typically a fresh scan.
+        columns: Columns to keep, in output order.
+        exclude: Columns to drop; ignored if columns is given.
+
+    Returns:
+        The projected LazyFrame.
+
+    Raises:
+        ValueError: If a named column does not exist or no column would remain.
+    """
+    if columns is None and exclude is None:
+        return lf
+
+    available = lf.collect_schema().names()
+    unknown = [name for name in columns or exclude or [] if name not in available]
+    if unknown:
+        raise ValueError(f"Unknown column(s): {', '.join(unknown)}")
+
+    selected = columns if columns is not None else [name for name in available if name not in (exclude or [])]
+    if not selected:
+        raise ValueError("No columns selected")
+    return lf.select(selected)
+
+
+def scan_parquet_input(parquet_path: Path, read_options: ParquetReadOptions | None = None) -> pl.LazyFrame:
+    """Lazily scan a Parquet file with the read options applied.
+
+    The filter is applied first, so it may reference columns that are not
+    selected and the offset and limit count matching rows. All of it is
+    pushed into the reader: row groups whose statistics exclude the filter,
+    row groups outside the slice (located from the footer row counts) and
+    unselected column chunks are skipped.
+
+    Args:
+        parquet_path: Path to a Parquet file (see parquet_input).
+        read_options: Row filter, slice and column projection; None reads
+            everything.
+
+    Returns:
+        LazyFrame over the selected rows and columns.
+
+    Raises:
+        ValueError: If a named column does not exist or the filter is invalid.
+    """
+    options = read_options or ParquetReadOptions()
+    lf = pl.scan_parquet(parquet_path)
+    if options.where is not None:
+        lf = lf.filter(parse_where(options.where))
+    if options.offset or options.limit is not None:
+        lf = lf.slice(options.offset, options.limit)
+    return select_columns(lf, options.columns, options.exclude)
+
+
+def write_parquet_output(
+    df: pl.DataFrame,
+    output: Path | None,
+    options: ParquetWriteOptions | None = None,
+) -> None:
     """Write DataFrame to Parquet file or stdout.
 
+    Stdout output is written directly to the binary stdout stream, without
+    staging the serialized file in an intermediate buffer.
+
     Args:
         df: The Polars DataFrame to write.
         output: Output path, or None/"-" for stdout.
+        options: Parquet writer options; defaults if None.
     """
+    options = options or ParquetWriteOptions()
+    input_bytes = int(df.estimated_size())
+    if options.sort_by:
+        # Already in memory, so no external sort is needed
+        df = df.sort(options.sort_by)
+    if options.partition_by:
+        sink_parquet_output(df.lazy(), output, options, input_bytes=input_bytes)
+        return
+
+    kwargs = _writer_kwargs(options, df.width, input_bytes)
     if output is None or str(output) == "-":
-        buffer = io.BytesIO()
-        df.write_parquet(buffer)
-        buffer.seek(0)
-        sys.stdout.buffer.write(buffer.read())
+        df.write_parquet(sys.stdout.buffer, **kwargs)
     else:
-        df.write_parquet(output)
+        with atomic_output(output) as staging:
+            df.write_parquet(staging, **kwargs)
 
 
-def write_text_output(content: str, output: Path | None) -> None:
-    """Write text content to file or stdout.
+def sink_parquet_output(
+    lf: pl.LazyFrame,
+    output: Path | None,
+    options: ParquetWriteOptions | None = None,
+    input_bytes: int | None = None,
+) -> None:
+    """Stream a LazyFrame to a Parquet file or stdout in batches.
+
+    Uses the streaming engine so peak memory is bounded by the batch size
+    rather than the size of the input. File output is written under a
+    temporary name and only moved into place once complete (see
+    atomic_output).
 
     Args:
-        content: The text content to write.
+        lf: The Polars LazyFrame to write.
         output: Output path, or None/"-" for stdout.
+        options: Parquet writer options; defaults if None.
+        input_bytes: Size of the input in bytes, used by auto row group sizing.
+
+    Raises:
+        ValueError: If partitioned output is requested for stdout.
     """
-    if output is None or str(output) == "-":
-        sys.stdout.write(content)
+    options = options or ParquetWriteOptions()
+    kwargs = _writer_kwargs(options, lf.collect_schema().len(), input_bytes)
+    if options.partition_by:
+        if output is None or str(output) == "-":
+            raise ValueError("Partitioned output requires an output directory (-o)")
+        _sink_partitioned(lf, output, options.partition_by, options.max_open_files, kwargs)
+    elif output is None or str(output) == "-":
+        lf.sink_parquet(sys.stdout.buffer, **kwargs)
     else:
-        output.write_text(content)
+        with atomic_output(output) as staging:
+            lf.sink_parquet(staging, **kwargs)
+
+
+def _sink_partitioned(
+    lf: pl.LazyFrame,
+    output_dir: Path,
+    partition_by: list[str],
+    max_open_files: int,
+    writer_kwargs: dict[str, Any],
+) -> None:
+    """Stream a LazyFrame into a hive-partitioned directory tree.
+
+    Rows are routed to `col=value/` directories in a single pass: each batch
+    is split by key and the pieces are buffered per partition. A buffer is
+    written out as a new file in its partition's directory when more than
+    max_open_files partitions are buffered (the least recently used one) or
+    all buffers together exceed PARTITION_BUFFER_BYTES (the largest one), so
+    memory stays bounded for large inputs and high-cardinality keys. A
+    partition then spans several files. Key columns are encoded in the
+    directory names and not repeated in the files.
+
+    Args:
+        lf: The Polars LazyFrame to write.
+        output_dir: Root directory of the dataset.
+        partition_by: Columns to partition by, outermost first.
+        max_open_files: Maximum number of partitions buffered at once.
+        writer_kwargs: Keyword arguments for the polars Parquet writer.
+    """
+    buffers: OrderedDict[tuple[Any, ...], list[pl.DataFrame]] = OrderedDict()
+    buffered_bytes: dict[tuple[Any, ...], float] = {}
+    files_written = 0
+
+    def flush(key: tuple[Any, ...]) -> None:
+        nonlocal files_written
+        frame = pl.concat(buffers.pop(key))
+        del buffered_bytes[key]
+        # Numbered across the dataset, so a partition's later files never replace earlier ones
+        file_name = f"{files_written:08d}.parquet"
+        files_written += 1
+        sink = pl.PartitionByKey(
+            output_dir,
+            by=partition_by,
+            include_key=False,
+            file_path=lambda context: context.hive_dirs() / file_name,
+        )
+        frame.lazy().sink_parquet(sink, mkdir=True, **writer_kwargs)
+
+    def add_batch(batch: pl.DataFrame) -> None:
+        for key, part in batch.partition_by(partition_by, as_dict=True, maintain_order=True).items():
+            buffers.setdefault(key, []).append(part)
+            buffers.move_to_end(key)
+            buffered_bytes[key] = buffered_bytes.get(key, 0) + part.estimated_size()
+            if len(buffers) > max_open_files:
+                flush(next(iter(buffers)))
+        if sum(buffered_bytes.values()) > PARTITION_BUFFER_BYTES:
+            # Write out the largest buffers until half the budget is free, so
+            # the files stay large even when every batch touches every key
+            for key in sorted(buffered_bytes, key=buffered_bytes.__getitem__, reverse=True):
+                flush(key)
+                if sum(buffered_bytes.values()) <= PARTITION_BUFFER_BYTES // 2:
+                    break
+
+    lf.sink_batches(add_batch)
+    for key in list(buffers):
+        flush(key)
@@ -0,0 +1,313 @@
+"""Compression of CSV/NDJSON text: decompressing input and compressing output."""
+
+import bz2
+import gzip
+import io
+import sys
+from collections import deque
+from collections.abc import Buffer, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import Path
+from types import TracebackType
+from typing import IO
+
+import polars as pl
+import zstandard
+
+from parquet_lf.converters.base import atomic_output
+
+
+class InputCompression(Enum):
+    """Compression formats recognized on text input."""
+
+    GZIP = "gzip"
+    ZSTD = "zstd"
+    BZIP2 = "bzip2"
+
+
+class OutputCompression(Enum):
+    """Compression formats for text output."""
+
+    GZIP = "gzip"
+    ZSTD = "zstd"
+    BZIP2 = "bzip2"
+
+
+# Map compression extensions (the last suffix, e.g. data.csv.gz) to formats
+COMPRESSION_EXTENSIONS: dict[str, InputCompression] = {
+    ".gz": InputCompression.GZIP,
+    ".zst": InputCompression.ZSTD,
+    ".zstd": InputCompression.ZSTD,
+    ".bz2": InputCompression.BZIP2,
+}
+
+# Extension appended to compressed output files
+OUTPUT_EXTENSIONS: dict[OutputCompression, str] = {
+    OutputCompression.GZIP: ".gz",
+    OutputCompression.ZSTD: ".zst",
+    OutputCompression.BZIP2: ".bz2",
+}
+
+# Uncompressed bytes per independently compressed output block
+COMPRESS_BLOCK_SIZE = 1024 * 1024
+
+# gzip level of the gzip command line tool, trading a little size for speed
+GZIP_LEVEL = 6
+
+# Default level of the zstd command line tool
+ZSTD_LEVEL = 3
+
+# Leading bytes of each compressed format, for inputs without a telling extension
+MAGIC_NUMBERS: dict[bytes, InputCompression] = {
+    b"\x1f\x8b": InputCompression.GZIP,
+    b"\x28\xb5\x2f\xfd": InputCompression.ZSTD,
+    b"BZh": InputCompression.BZIP2,
+}
+MAGIC_SIZE = max(len(magic) for magic in MAGIC_NUMBERS)
+
+
+def strip_compression_suffix(path: Path) -> Path:
+    """Remove a compression extension, e.g. data.csv.gz to data.csv.
+
+    Args:
+        path: Path to a possibly compressed file.
+
+    Returns:
+        The path without its compression extension, or unchanged.
+    """
+    return path.with_suffix("") if path.suffix.lower() in COMPRESSION_EXTENSIONS else path
+
+
+def sniff_compression(head: bytes) -> InputCompression | None:
+    """Recognize a compression format from the first bytes of the data.
+
+    Args:
+        head: At least MAGIC_SIZE leading bytes, if the data has that many.
+
+    Returns:
+        The compression format, or None for uncompressed data.
+    """
+    for magic, compression in MAGIC_NUMBERS.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def detect_compression(path: Path) -> InputCompression | None:
+    """Detect the compression of a file from its extension or magic bytes.
+
+    Args:
+        path: Path to an existing file.
+
+    Returns:
+        The compression format, or None for an uncompressed file.
+    """
+    if (compression := COMPRESSION_EXTENSIONS.get(path.suffix.lower())) is not None:
+        return compression
+    with path.open("rb") as f:
+        return sniff_compression(f.read(MAGIC_SIZE))
+
+
+def decompress_stream(source: IO[bytes], compression: InputCompression) -> io.BufferedIOBase:
+    """Wrap a binary stream in an incremental decompressor.
+
+    Closing the returned stream leaves the source open.
+
+    Args:
+        source: Compressed binary stream.
+        compression: Compression format of the source.
+
+    Returns:
+        Binary stream of the decompressed data.
+    """
+    match compression:
+        case InputCompression.GZIP:
+            return gzip.GzipFile(fileobj=source, mode="rb")
+        case InputCompression.BZIP2:
+            return bz2.BZ2File(source, mode="rb")
+        case InputCompression.ZSTD:
+            # Like the zstd tool, decode concatenated frames as one stream
+            reader = zstandard.ZstdDecompressor().stream_reader(source, read_across_frames=True, closefd=False)
+            return io.BufferedReader(reader)
+
+
+@contextmanager
+def text_input(input_path: Path) -> Iterator[Path | IO[bytes] | io.BufferedIOBase]:
+    """Resolve a CSV/NDJSON input to a file polars can scan, or a binary stream.
+
+    Uncompressed files are yielded as paths so polars can memory-map and
+    parse them in parallel. Compressed input, from a file or stdin, is
+    yielded as a stream decompressed block by block for the batch parser,
+    so neither the compressed nor the decompressed data is held in memory
+    or written to disk. Plain stdin is yielded as is.
+
+    Args:
+        input_path: Path to the input file, or "-" for stdin.
+
+    Yields:
+        Path to a file to scan, or a stream of uncompressed bytes, valid for
+        the duration of the context.
+
+    Raises:
+        FileNotFoundError: If the input file does not exist.
+    """
+    if str(input_path) == "-":
+        source = sys.stdin.buffer
+        # Peeking leaves the magic bytes in the buffer for the reader
+        head = source.peek(MAGIC_SIZE)[:MAGIC_SIZE] if isinstance(source, io.BufferedReader) else b""
+        compression = sniff_compression(head)
+        if compression is None:
+            yield source
+        else:
+            with decompress_stream(source, compression) as stream:
+                yield stream
+        return
+
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input file not found: {input_path}")
+    compression = detect_compression(input_path)
+    if compression is None:
+        yield input_path
+        return
+    with input_path.open("rb") as raw, decompress_stream(raw, compression) as stream:
+        yield stream
+
+
+def infer_output_compression(path: Path) -> OutputCompression | None:
+    """Infer the output compression from a file extension such as .gz.
+
+    Args:
+        path: Output file path.
+
+    Returns:
+        The compression format, or None for an uncompressed extension.
+    """
+    compression = COMPRESSION_EXTENSIONS.get(path.suffix.lower())
+    return None if compression is None else OutputCompression(compression.value)
+
+
+def _compress_block(data: bytes, compression: OutputCompression) -> bytes:
+    """Compress one block into a complete gzip member, zstd frame or bzip2 stream."""
+    match compression:
+        case OutputCompression.GZIP:
+            return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+        case OutputCompression.ZSTD:
+            return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+        case OutputCompression.BZIP2:
+            return bz2.compress(data)
+
+
+class ParallelCompressor(io.BufferedIOBase):
+    """Writable stream that compresses blocks in parallel on a thread pool.
+
+    Written bytes are cut into COMPRESS_BLOCK_SIZE blocks, each compressed
+    on its own into a complete gzip member, zstd frame or bzip2 stream.
+    Each format defines a concatenation of these as one file, so gzip,
+    zstd, bzip2 and polars decompress the output as usual. zlib, zstandard
+    and bz2 release the GIL while compressing, so blocks compress on all cores while the caller keeps
+    producing data. Compressed blocks are written in order, and at most two
+    blocks per worker are in flight, which bounds memory. By default there
+    are as many workers as polars threads, so POLARS_MAX_THREADS and the
+    per-process share set for --jobs also limit compression.
+
+    Used as a context manager, the remaining data is compressed and written
+    on a clean exit and discarded when the body raises.
+    """
+
+    def __init__(
+        self,
+        sink: IO[bytes],
+        compression: OutputCompression,
+        workers: int | None = None,
+        block_size: int = COMPRESS_BLOCK_SIZE,
+    ) -> None:
+        super().__init__()
+        self.sink = sink
+        self.compression = compression
+        self.block_size = block_size
+        self.workers = workers or pl.thread_pool_size()
+        self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        self._max_pending = 2 * self.workers
+        self._pending: deque[Future[bytes]] = deque()
+        self._buffer = bytearray()
+        self._blocks = 0
+        self._aborted = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, buffer: Buffer, /) -> int:
+        if self.closed:
+            raise ValueError("write to closed file")
+        data = memoryview(buffer)
+        self._buffer += data
+        while len(self._buffer) >= self.block_size:
+            self._submit(bytes(self._buffer[: self.block_size]))
+            del self._buffer[: self.block_size]
+        return data.nbytes
+
+    def _submit(self, block: bytes) -> None:
+        self._pending.append(self._pool.submit(_compress_block, block, self.compression))
+        self._blocks += 1
+        while len(self._pending) > self._max_pending:
+            self.sink.write(self._pending.popleft().result())
+
+    def close(self) -> None:
+        """Compress and write the remaining data, then shut the pool down."""
+        if self.closed:
+            return
+        try:
+            if not self._aborted:
+                # An empty output still becomes one valid (empty) compressed stream
+                if self._buffer or self._blocks == 0:
+                    self._submit(bytes(self._buffer))
+                    self._buffer.clear()
+                while self._pending:
+                    self.sink.write(self._pending.popleft().result())
+                self.sink.flush()
+        finally:
+            self._pool.shutdown(cancel_futures=True)
+            super().close()
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        # Drop unwritten data so close() does not write to a failed sink
+        self._aborted = exc_type is not None
+        self.close()
+
+
+@contextmanager
+def _compressed(sink: IO[bytes], compression: OutputCompression | None) -> Iterator[IO[bytes]]:
+    """Wrap a sink in a ParallelCompressor, or yield it as is without compression."""
+    if compression is None:
+        yield sink
+        return
+    with ParallelCompressor(sink, compression) as compressor:
+        yield compressor
+
+
+@contextmanager
+def text_output(output: Path | None, compression: OutputCompression | None = None) -> Iterator[IO[bytes]]:
+    """Open a file or stdout for writing CSV/NDJSON text, optionally compressed.
+
+    A file is written under a temporary name and moved into place once
+    complete (see atomic_output), so a failure part way through the data
+    leaves no partial output.
+
+    Args:
+        output: Output path, or None/"-" for stdout.
+        compression: Compression format, or None for plain text.
+
+    Yields:
+        Binary stream to write to; with compression, everything written is
+        compressed in parallel blocks.
+    """
+    if output is None or str(output) == "-":
+        with _compressed(sys.stdout.buffer, compression) as sink:
+            yield sink
+        return
+    with atomic_output(output) as staging, staging.open("wb") as f, _compressed(f, compression) as sink:
+        yield sink
@@ -1,48 +1,195 @@
 """NDJSON to/from Parquet converter."""
 
+import io
 from pathlib import Path
+from typing import IO
 
 import polars as pl
 
-from parquet_lf.converters.base import write_parquet_output, write_text_output
+from parquet_lf.converters.base import (
+    TEXT_BATCH_SIZE,
+    ParquetReadOptions,
+    ParquetWriteOptions,
+    parquet_input,
+    scan_parquet_input,
+    sink_parquet_output,
+    write_parquet_output,
+)
+from parquet_lf.converters.compression import (
+    OutputCompression,
+    detect_compression,
+    text_input,
+    text_output,
+)
+from parquet_lf.converters.shrink import TypeShrinkage, shrink_frame, shrunk_output
+from parquet_lf.converters.sort import sorted_output
+from parquet_lf.converters.stream import scan_ndjson_stream
+from parquet_lf.schema import DEFAULT_SAMPLE_ROWS, SchemaInference, categorical_schema, infer_schema_sampled
 
+# The NDJSON reader cannot parse straight into 8/16-bit integers; such columns
+# are read as 32-bit and narrowed with a strict cast, so overflow still fails
+_NDJSON_WIDENED_DTYPES: dict[pl.DataType, pl.DataType] = {
+    pl.Int8(): pl.Int32(),
+    pl.Int16(): pl.Int32(),
+    pl.UInt8(): pl.UInt32(),
+    pl.UInt16(): pl.UInt32(),
+}
 
-def ndjson_to_parquet(input_path: Path, output: Path | None) -> None:
+
+def _ndjson_reader_schema(schema: pl.Schema | None) -> pl.Schema | None:
+    """Map a target schema to one the NDJSON reader can parse into directly."""
+    if schema is None:
+        return None
+    return pl.Schema({name: _NDJSON_WIDENED_DTYPES.get(dtype, dtype) for name, dtype in schema.items()})
+
+
+def _narrowed_dtypes(schema: pl.Schema | None) -> pl.Schema:
+    """Return the columns read widened by the NDJSON reader, with their target types."""
+    if schema is None:
+        return pl.Schema()
+    return pl.Schema({name: dtype for name, dtype in schema.items() if dtype in _NDJSON_WIDENED_DTYPES})
+
+
+def _ndjson_categorical_schema(source: Path | bytes, schema: pl.Schema | None, max_ratio: float) -> pl.Schema:
+    """Parse the leading rows of NDJSON and mark its low-cardinality string columns."""
+    sample = pl.read_ndjson(
+        source,
+        n_rows=DEFAULT_SAMPLE_ROWS,
+        schema=_ndjson_reader_schema(schema),
+        infer_schema_length=DEFAULT_SAMPLE_ROWS,
+    )
+    return categorical_schema(sample, max_ratio, schema)
+
+
+def ndjson_to_parquet(
+    input_path: Path,
+    output: Path | None,
+    eager: bool = False,
+    write_options: ParquetWriteOptions | None = None,
+    schema: pl.Schema | None = None,
+    schema_inference: SchemaInference = SchemaInference.HEAD,
+    categorical_ratio: float | None = None,
+) -> TypeShrinkage | None:
     """Convert NDJSON file to Parquet format.
 
+    Input is parsed in batches via a lazy scan and appended to the
+    Parquet output row group by row group. Pass eager=True to load the whole
+    file first. Sorting by write_options.sort_by spills to disk beyond the
+    sort memory budget (see external_sort). With write_options.shrink_types,
+    numeric columns are cast to their smallest lossless types (see
+    shrunk_output).
+
+    With an explicit schema, type inference is skipped and values are parsed
+    directly into the declared types, failing on the first value that does
+    not fit.
+
+    gzip, bzip2 and zstd input is recognized by extension or magic bytes and
+    decompressed transparently (see text_input).
+
+    With a categorical_ratio, string columns with few distinct values in the
+    leading rows are parsed straight into Categorical (see categorical_schema).
+
     Args:
-        input_path: Path to the input NDJSON file.
+        input_path: Path to the input NDJSON file, or "-" for stdin.
         output: Output path, or None/"-" for stdout.
+        eager: Read the entire file into memory instead of streaming.
+        write_options: Parquet writer options; defaults if None.
+        schema: Column types to parse into instead of inferring them.
+        schema_inference: Without a schema, infer types from the leading rows
+            (HEAD) or from samples spread across the file (SAMPLED).
+        categorical_ratio: Store string columns whose distinct-to-non-null
+            ratio is at most this as Categorical; None keeps them String.
+
+    Returns:
+        The narrowed column types and sizes with write_options.shrink_types,
+        otherwise None.
 
     Raises:
         FileNotFoundError: If the input file does not exist.
+        ValueError: If sampled inference is requested for stdin or a
+            compressed file.
         pl.exceptions.ComputeError: If the NDJSON cannot be parsed.
     """
-    if not input_path.exists():
+    from_stdin = str(input_path) == "-"
+    if not from_stdin and not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
+    if schema is None and schema_inference == SchemaInference.SAMPLED:
+        if from_stdin:
+            raise ValueError("Sampled schema inference needs a file input, not stdin")
+        if detect_compression(input_path) is not None:
+            raise ValueError("Sampled schema inference needs an uncompressed file input")
+        schema = infer_schema_sampled(input_path)
+
+    with text_input(input_path) as source:
+        if eager:
+            data = source if isinstance(source, Path) else source.read()
+            if categorical_ratio is not None:
+                schema = _ndjson_categorical_schema(data, schema, categorical_ratio)
+            df = pl.read_ndjson(data, schema=_ndjson_reader_schema(schema))
+            df, shrinkage = shrink_frame(df.cast(dict(_narrowed_dtypes(schema))), write_options)
+            write_parquet_output(df, output, write_options)
+            return shrinkage
 
-    df = pl.read_ndjson(input_path)
-    write_parquet_output(df, output)
+        input_bytes = None
+        if isinstance(source, Path):
+            if categorical_ratio is not None:
+                schema = _ndjson_categorical_schema(source, schema, categorical_ratio)
+            lf = pl.scan_ndjson(source, schema=_ndjson_reader_schema(schema))
+            # Only uncompressed files are scanned from a path, so the size predicts the data volume
+            input_bytes = source.stat().st_size
+        else:
+            lf = scan_ndjson_stream(source, _ndjson_reader_schema(schema), categorical_ratio)
+        lf = lf.cast(dict(_narrowed_dtypes(schema)))
+        with (
+            shrunk_output(lf, write_options, output, rescannable=isinstance(source, Path)) as (lf, shrinkage),
+            sorted_output(lf, write_options) as lf,
+        ):
+            sink_parquet_output(lf, output, write_options, input_bytes=input_bytes)
+        return shrinkage
 
 
-def parquet_to_ndjson(input_path: Path, output: Path | None) -> None:
+def parquet_to_ndjson(
+    input_path: Path,
+    output: Path | None,
+    read_options: ParquetReadOptions | None = None,
+    compression: OutputCompression | None = None,
+) -> None:
     """Convert Parquet file to NDJSON format.
 
+    The output is written in batches as they are decoded, so only one batch
+    is held in memory; a file appears under its name only once complete.
+
     Args:
-        input_path: Path to the input Parquet file.
+        input_path: Path to the input Parquet file, or "-" for stdin.
         output: Output path, or None/"-" for stdout.
+        read_options: Columns and rows to read; unselected column chunks and
+            row groups excluded by the filter or slice are never decompressed.
+        compression: Compress the output in parallel blocks (see
+            ParallelCompressor).
 
     Raises:
         FileNotFoundError: If the input file does not exist.
+        ValueError: If a selected column does not exist or the filter is invalid.
         pl.exceptions.ComputeError: If the Parquet file cannot be read.
     """
-    if not input_path.exists():
-        raise FileNotFoundError(f"Input file not found: {input_path}")
+    with parquet_input(input_path) as parquet_path:
+        lf = scan_parquet_input(parquet_path, read_options)
+        with text_output(output, compression) as sink:
+            _write_ndjson_batches(lf, sink)
+
+
+def _write_ndjson_batches(lf: pl.LazyFrame, sink: IO[bytes]) -> None:
+    """Write a LazyFrame as NDJSON one batch at a time.
+
+    Args:
+        lf: The Polars LazyFrame to write.
+        sink: Binary file object to write to.
+    """
 
-    df = pl.read_parquet(input_path)
+    def write_batch(batch: pl.DataFrame) -> None:
+        buffer = io.BytesIO()
+        batch.write_ndjson(buffer)
+        sink.write(buffer.getbuffer())
 
-    if output is None or str(output) == "-":
-        content = df.write_ndjson()
-        write_text_output(content, output)
-    else:
-        df.write_ndjson(output)
+    # sink_batches raises query errors here; collect_batches would drop them
+    lf.sink_batches(write_batch, chunk_size=TEXT_BATCH_SIZE)
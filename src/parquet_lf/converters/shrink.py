@@ -0,0 +1,179 @@
+"""Numeric type narrowing for Parquet output."""
+
+import tempfile
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import polars as pl
+
+from parquet_lf.converters.base import ParquetWriteOptions, staging_path
+
+# Byte width of each numeric type that can be narrowed. Integers narrow
+# within their signedness, so arithmetic on a column behaves as before;
+# Float64 narrows to Float32 only when every value survives the cast.
+_BYTE_WIDTHS: dict[pl.DataType, int] = {
+    pl.Int8(): 1,
+    pl.Int16(): 2,
+    pl.Int32(): 4,
+    pl.Int64(): 8,
+    pl.UInt8(): 1,
+    pl.UInt16(): 2,
+    pl.UInt32(): 4,
+    pl.UInt64(): 8,
+    pl.Float32(): 4,
+    pl.Float64(): 8,
+}
+_SIGNED_INTEGERS = [pl.Int8(), pl.Int16(), pl.Int32(), pl.Int64()]
+_UNSIGNED_INTEGERS = [pl.UInt8(), pl.UInt16(), pl.UInt32(), pl.UInt64()]
+
+
+@dataclass
+class TypeShrinkage:
+    """Numeric columns narrowed to smaller types and their memory before and after.
+
+    Memory counts the fixed-width values of all numeric columns in bytes,
+    i.e. what a reader needs to load them, not the compressed file size.
+    """
+
+    dtypes: dict[str, pl.DataType] = field(default_factory=dict)
+    rows: int = 0
+    memory_before: int = 0
+    memory_after: int = 0
+
+
+def _integer_range(dtype: pl.DataType) -> tuple[int, int]:
+    """Return the smallest and largest value of an integer type."""
+    bits = 8 * _BYTE_WIDTHS[dtype]
+    if dtype in _UNSIGNED_INTEGERS:
+        return 0, 2**bits - 1
+    return -(2 ** (bits - 1)), 2 ** (bits - 1) - 1
+
+
+def smallest_integer_type(dtype: pl.DataType, low: int | None, high: int | None) -> pl.DataType:
+    """Pick the smallest integer type of the same signedness holding a range.
+
+    Args:
+        dtype: Current integer type.
+        low: Smallest value, or None for a column without values.
+        high: Largest value, or None for a column without values.
+
+    Returns:
+        The narrowest type holding every value, at most as wide as dtype.
+    """
+    candidates = _UNSIGNED_INTEGERS if dtype in _UNSIGNED_INTEGERS else _SIGNED_INTEGERS
+    for candidate in candidates:
+        if _BYTE_WIDTHS[candidate] >= _BYTE_WIDTHS[dtype]:
+            break
+        smallest, largest = _integer_range(candidate)
+        if low is None or high is None or (smallest <= low and high <= largest):
+            return candidate
+    return dtype
+
+
+def plan_shrinkage(lf: pl.LazyFrame) -> TypeShrinkage:
+    """Find the smallest lossless type of every numeric column.
+
+    A single aggregation computes the range of every integer column and
+    checks whether every Float64 value converts to Float32 and back
+    unchanged. Only numeric columns are read, and the streaming engine
+    keeps memory bounded for large inputs.
+
+    Args:
+        lf: The Polars LazyFrame to inspect.
+
+    Returns:
+        TypeShrinkage with the columns to cast and their size before and after.
+    """
+    schema = lf.collect_schema()
+    numeric = {name: dtype for name, dtype in schema.items() if dtype in _BYTE_WIDTHS}
+    if not numeric:
+        return TypeShrinkage()
+
+    # Aliases are numbered so that no column name can clash with them
+    exprs = [pl.len().alias("rows")]
+    for i, (name, dtype) in enumerate(numeric.items()):
+        column = pl.col(name)
+        if dtype == pl.Float64:
+            exprs.append(column.cast(pl.Float32).cast(pl.Float64).eq_missing(column).all().alias(f"fits_{i}"))
+        elif dtype.is_integer():
+            exprs += [column.min().alias(f"min_{i}"), column.max().alias(f"max_{i}")]
+    stats = lf.select(exprs).collect(engine="streaming").row(0, named=True)
+
+    dtypes: dict[str, pl.DataType] = {}
+    for i, (name, dtype) in enumerate(numeric.items()):
+        if dtype == pl.Float64 and stats[f"fits_{i}"]:
+            dtypes[name] = pl.Float32()
+        elif dtype.is_integer():
+            narrowed = smallest_integer_type(dtype, stats[f"min_{i}"], stats[f"max_{i}"])
+            if narrowed != dtype:
+                dtypes[name] = narrowed
+
+    rows = stats["rows"]
+    return TypeShrinkage(
+        dtypes=dtypes,
+        rows=rows,
+        memory_before=rows * sum(_BYTE_WIDTHS[dtype] for dtype in numeric.values()),
+        memory_after=rows * sum(_BYTE_WIDTHS[dtypes.get(name, dtype)] for name, dtype in numeric.items()),
+    )
+
+
+def shrink_frame(df: pl.DataFrame, options: ParquetWriteOptions | None) -> tuple[pl.DataFrame, TypeShrinkage | None]:
+    """Cast an in-memory DataFrame to its smallest lossless numeric types.
+
+    Args:
+        df: The Polars DataFrame to write.
+        options: Parquet writer options; None or no shrink_types leaves df as is.
+
+    Returns:
+        The DataFrame to write and the shrinkage, or None if not requested.
+    """
+    if options is None or not options.shrink_types:
+        return df, None
+    shrinkage = plan_shrinkage(df.lazy())
+    return df.cast(dict(shrinkage.dtypes)), shrinkage
+
+
+@contextmanager
+def shrunk_output(
+    lf: pl.LazyFrame, options: ParquetWriteOptions | None, output: Path | None, rescannable: bool
+) -> Iterator[tuple[pl.LazyFrame, TypeShrinkage | None]]:
+    """Cast a LazyFrame to its smallest lossless numeric types.
+
+    The final types depend on every row, but the output has to be written
+    with them from its first row group. A file that can be read again is
+    scanned twice: once by a single aggregate over its numeric columns,
+    then to write the output with the narrowed types. Input that can only
+    be read once, such as stdin or a compressed stream, is first parsed
+    into an lz4-compressed Parquet file next to the output (in the system
+    temporary directory when writing to stdout), and both passes read that.
+
+    Args:
+        lf: The Polars LazyFrame to write.
+        options: Parquet writer options; None or no shrink_types leaves lf as is.
+        output: Output path, or None/"-" for stdout.
+        rescannable: Whether lf reads a file that can be scanned again.
+
+    Yields:
+        The LazyFrame to write and the shrinkage, or None if not requested,
+        valid for the duration of the context.
+    """
+    if options is None or not options.shrink_types:
+        yield lf, None
+        return
+    if rescannable:
+        shrinkage = plan_shrinkage(lf)
+        yield lf.cast(dict(shrinkage.dtypes)), shrinkage
+        return
+    with ExitStack() as stack:
+        if output is None or str(output) == "-":
+            staging_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="parquet-lf-shrink-"))
+            staged = Path(staging_dir) / "staged.parquet"
+        else:
+            staged = staging_path(output, ".shrink.parquet")
+            stack.callback(staged.unlink, missing_ok=True)
+        lf.sink_parquet(staged, compression="lz4")
+        staged_lf = pl.scan_parquet(staged)
+        shrinkage = plan_shrinkage(staged_lf)
+        yield staged_lf.cast(dict(shrinkage.dtypes)), shrinkage
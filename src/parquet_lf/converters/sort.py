@@ -0,0 +1,153 @@
+"""External sort for clustering Parquet output by key columns."""
+
+import math
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from itertools import pairwise
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from parquet_lf.converters.base import ParquetWriteOptions
+from parquet_lf.converters.stream import scan_batches
+
+# Rows per row group of spilled runs; small groups let the merge pass skip
+# most of each run from its min/max statistics
+SPILL_ROW_GROUP_SIZE = 65_536
+
+# Evenly spaced key values taken from each sorted run to choose range boundaries
+SAMPLES_PER_RUN = 1024
+
+
+def _check_sort_columns(schema: pl.Schema, by: list[str]) -> None:
+    """Raise ValueError for sort columns missing from the schema."""
+    missing = [name for name in by if name not in schema]
+    if missing:
+        raise ValueError(f"Unknown sort column(s): {', '.join(missing)}")
+
+
+def choose_boundaries(samples: pl.Series, partitions: int) -> list[Any]:
+    """Pick key values that split sampled data into partitions of similar size.
+
+    Args:
+        samples: Key values sampled evenly from every run.
+        partitions: Number of partitions wanted.
+
+    Returns:
+        Sorted, distinct boundary values; partition i holds keys from
+        boundary i - 1 (inclusive) to boundary i (exclusive). There may be
+        fewer than partitions - 1 boundaries when keys repeat.
+    """
+    values = samples.drop_nulls().sort()
+    if partitions <= 1 or values.is_empty():
+        return []
+    picks = [values[len(values) * i // partitions] for i in range(1, partitions)]
+    return list(dict.fromkeys(picks))
+
+
+def _partition_filters(key: str, boundaries: list[Any]) -> list[pl.Expr]:
+    """Build one filter per key range, nulls first to match the sort order."""
+    column = pl.col(key)
+    if not boundaries:
+        return [pl.lit(True)]
+    filters = [column.is_null(), column < boundaries[0]]
+    filters += [(column >= low) & (column < high) for low, high in pairwise(boundaries)]
+    filters.append(column >= boundaries[-1])
+    return filters
+
+
+@contextmanager
+def external_sort(lf: pl.LazyFrame, by: list[str], memory_budget: int) -> Iterator[pl.LazyFrame]:
+    """Sort a LazyFrame that may not fit in memory, spilling to disk.
+
+    The input is read in batches. Once the buffered batches reach half the
+    budget (sorting needs a second copy), they are sorted and spilled to a
+    temporary Parquet file as a run. Input that never fills the buffer is
+    sorted in memory without touching disk.
+
+    Spilled runs are merged by range partitioning on the first key: boundary
+    values are chosen from evenly spaced samples of every run so that each
+    key range holds about half the budget. Ranges are then read one at a
+    time from all runs, with min/max statistics skipping the row groups of
+    each sorted run outside the range, sorted in memory by all keys, and
+    yielded in order. Rows sharing one first-key value always land in the
+    same range, so a single value with more rows than the budget is still
+    sorted in memory.
+
+    Args:
+        lf: The Polars LazyFrame to sort.
+        by: Columns to sort by, ascending, nulls first.
+        memory_budget: Approximate bytes of data held in memory at once.
+
+    Yields:
+        Single-use LazyFrame producing the sorted rows, valid for the
+        duration of the context.
+
+    Raises:
+        ValueError: If a sort column does not exist.
+    """
+    schema = lf.collect_schema()
+    _check_sort_columns(schema, by)
+    threshold = max(1, memory_budget // 2)
+
+    with tempfile.TemporaryDirectory(prefix="parquet-lf-sort-") as spill_dir:
+        runs: list[Path] = []
+        samples: list[pl.Series] = []
+        buffered: list[pl.DataFrame] = []
+        buffered_bytes = 0
+        spilled_bytes = 0
+
+        def spill() -> None:
+            nonlocal buffered_bytes, spilled_bytes
+            run = pl.concat(buffered).sort(by)
+            path = Path(spill_dir) / f"run-{len(runs):05d}.parquet"
+            run.write_parquet(path, compression="lz4", row_group_size=SPILL_ROW_GROUP_SIZE)
+            runs.append(path)
+            samples.append(run.get_column(by[0]).gather_every(max(1, run.height // SAMPLES_PER_RUN)))
+            spilled_bytes += buffered_bytes
+            buffered.clear()
+            buffered_bytes = 0
+
+        def add_batch(batch: pl.DataFrame) -> None:
+            nonlocal buffered_bytes
+            buffered.append(batch)
+            buffered_bytes += batch.estimated_size()
+            if buffered_bytes >= threshold:
+                spill()
+
+        lf.sink_batches(add_batch)
+
+        if not runs:
+            # Everything fit in the budget
+            yield pl.concat(buffered).sort(by).lazy() if buffered else pl.LazyFrame(schema=schema)
+            return
+        if buffered:
+            spill()
+
+        boundaries = choose_boundaries(pl.concat(samples), math.ceil(spilled_bytes / threshold))
+        scan = pl.scan_parquet(runs)
+        partitions = (scan.filter(expr).collect().sort(by) for expr in _partition_filters(by[0], boundaries))
+        yield scan_batches(next(partitions), partitions)
+
+
+@contextmanager
+def sorted_output(lf: pl.LazyFrame, options: ParquetWriteOptions | None) -> Iterator[pl.LazyFrame]:
+    """Sort a LazyFrame by the write options' sort_by columns, if any.
+
+    Args:
+        lf: The Polars LazyFrame to write.
+        options: Parquet writer options; None or no sort_by leaves lf as is.
+
+    Yields:
+        The LazyFrame to write, valid for the duration of the context.
+
+    Raises:
+        ValueError: If a sort column does not exist.
+    """
+    if options is None or not options.sort_by:
+        yield lf
+        return
+    with external_sort(lf, options.sort_by, options.sort_memory) as sorted_lf:
+        yield sorted_lf
@@ -0,0 +1,165 @@
+"""Incremental CSV/NDJSON parsing from binary streams such as stdin."""
+
+from collections.abc import Iterator
+from itertools import chain
+from typing import IO
+
+import polars as pl
+from polars.io.plugins import register_io_source
+
+from parquet_lf.schema import categorical_schema, check_csv_header
+
+# Bytes read from the stream per parsed batch
+STREAM_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def _last_record_boundary(data: bytes, quote_char: bytes | None) -> int:
+    """Find the index of the last newline that ends a complete record.
+
+    With a quote character, a newline only ends a record when an even number
+    of quote characters precede it, i.e. it is not inside a quoted field.
+    `data` must start on a record boundary.
+
+    Args:
+        data: Bytes starting at a record boundary.
+        quote_char: Quote character, or None if newlines are never quoted.
+
+    Returns:
+        Index of the newline, or -1 if data holds no complete record.
+    """
+    pos = data.rfind(b"\n")
+    if quote_char is None or pos == -1:
+        return pos
+
+    quotes_before = data.count(quote_char, 0, pos)
+    while pos != -1 and quotes_before % 2 != 0:
+        prev = data.rfind(b"\n", 0, pos)
+        quotes_before -= data.count(quote_char, max(prev, 0), pos)
+        pos = prev
+    return pos
+
+
+def iter_record_chunks(
+    source: IO[bytes],
+    quote_char: bytes | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Read a binary stream in blocks that end on record boundaries.
+
+    Only one block (plus a partial trailing record) is held in memory at a time.
+
+    Args:
+        source: Binary stream to read from.
+        quote_char: Quote character for newlines embedded in fields, if any.
+        chunk_size: Number of bytes to read per block.
+
+    Yields:
+        Byte blocks that each contain only complete records.
+    """
+    pending = b""
+    while block := source.read(chunk_size):
+        data = pending + block
+        cut = _last_record_boundary(data, quote_char)
+        if cut == -1:
+            pending = data
+            continue
+        yield data[: cut + 1]
+        pending = data[cut + 1 :]
+
+    if pending.strip():
+        yield pending
+
+
+def scan_batches(first: pl.DataFrame, rest: Iterator[pl.DataFrame]) -> pl.LazyFrame:
+    """Wrap a stream of DataFrame batches in a LazyFrame.
+
+    The batches are pulled by the streaming engine as it needs them. The
+    resulting LazyFrame can only be collected once.
+
+    Args:
+        first: First batch, which determines the schema.
+        rest: Iterator over the remaining batches.
+
+    Returns:
+        LazyFrame backed by the batches.
+    """
+
+    def io_source(
+        with_columns: list[str] | None,
+        predicate: pl.Expr | None,
+        n_rows: int | None,
+        batch_size: int | None,
+    ) -> Iterator[pl.DataFrame]:
+        remaining = n_rows
+        for df in chain([first], rest):
+            if with_columns is not None:
+                df = df.select(with_columns)
+            if predicate is not None:
+                df = df.filter(predicate)
+            if remaining is not None:
+                df = df.head(remaining)
+                remaining -= len(df)
+            yield df
+            if remaining == 0:
+                break
+
+    return register_io_source(io_source, schema=first.schema)
+
+
+def scan_csv_stream(
+    source: IO[bytes], schema: pl.Schema | None = None, categorical_ratio: float | None = None
+) -> pl.LazyFrame:
+    """Lazily parse CSV from a binary stream in batches.
+
+    Without an explicit schema it is inferred from the first block; later
+    blocks are parsed directly into that schema.
+
+    Args:
+        source: Binary stream with CSV content, including a header row.
+        schema: Schema to parse into instead of inferring one.
+        categorical_ratio: Store string columns whose distinct ratio in the
+            first block is at most this as Categorical (see categorical_schema).
+
+    Returns:
+        Single-use LazyFrame over the stream.
+
+    Raises:
+        pl.exceptions.NoDataError: If the stream is empty.
+        ValueError: If the header does not match the given schema.
+    """
+    chunks = iter_record_chunks(source, quote_char=b'"')
+    head = next(chunks, b"")
+    if schema is not None:
+        check_csv_header(head, schema)
+    first = pl.read_csv(head, schema=schema)
+    if categorical_ratio is not None:
+        first = first.cast(dict(categorical_schema(first, categorical_ratio)))
+    schema = first.schema
+    rest = (pl.read_csv(chunk, has_header=False, schema=schema) for chunk in chunks)
+    return scan_batches(first, rest)
+
+
+def scan_ndjson_stream(
+    source: IO[bytes], schema: pl.Schema | None = None, categorical_ratio: float | None = None
+) -> pl.LazyFrame:
+    """Lazily parse NDJSON from a binary stream in batches.
+
+    Without an explicit schema it is inferred from the first block; later
+    blocks are parsed directly into that schema.
+
+    Args:
+        source: Binary stream with one JSON object per line.
+        schema: Schema to parse into instead of inferring one.
+        categorical_ratio: Store string columns whose distinct ratio in the
+            first block is at most this as Categorical (see categorical_schema).
+
+    Returns:
+        Single-use LazyFrame over the stream.
+    """
+    chunks = iter_record_chunks(source)
+    first = pl.read_ndjson(next(chunks, b""), schema=schema)
+    if categorical_ratio is not None:
+        first = first.cast(dict(categorical_schema(first, categorical_ratio)))
+    schema = first.schema
+    rest = (pl.read_ndjson(chunk, schema=schema) for chunk in chunks)
+    return scan_batches(first, rest)
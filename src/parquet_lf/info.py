@@ -1,11 +1,18 @@
 """Info module for file inspection and metadata retrieval."""
 
+import io
+import math
+import statistics
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
 import polars as pl
 
+from parquet_lf.converters.base import select_columns
+from parquet_lf.converters.compression import detect_compression, strip_compression_suffix
+from parquet_lf.parquet_footer import ParquetFooter, read_parquet_footer
+
 
 class FileFormat(Enum):
     """Supported file formats for the info command."""
@@ -28,10 +35,24 @@ BYTES_PER_KB = 1024
 BYTES_PER_MB = BYTES_PER_KB * 1024
 BYTES_PER_GB = BYTES_PER_MB * 1024
 
+# Row count estimation: number of byte ranges sampled across the file and
+# bytes read per range, so an estimate touches at most 2 MiB
+APPROX_SAMPLE_COUNT = 8
+APPROX_SAMPLE_SIZE = 256 * 1024
+
+# First block read backward from the end of a text file by read_tail; each
+# further block doubles in size
+TAIL_READ_SIZE = 64 * 1024
+
+# z-score for the reported ~95% error bound
+APPROX_Z_SCORE = 1.96
+
 
 def detect_format(path: Path) -> FileFormat:
     """Detect file format from extension.
 
+    A compression extension is skipped, so data.csv.gz is detected as CSV.
+
     Args:
         path: Path to the file.
 
@@ -41,12 +62,28 @@ def detect_format(path: Path) -> FileFormat:
     Raises:
         ValueError: If the file extension is not supported.
     """
-    ext = path.suffix.lower()
+    ext = strip_compression_suffix(path).suffix.lower()
     if ext not in EXTENSION_MAP:
         raise ValueError(f"Unsupported file extension: {ext}")
     return EXTENSION_MAP[ext]
 
 
+def require_uncompressed(path: Path) -> None:
+    """Reject a compressed file.
+
+    Inspecting a file seeks within it or reads it more than once, while a
+    compressed file can only be decompressed as a single forward stream.
+
+    Args:
+        path: Path to an existing file.
+
+    Raises:
+        ValueError: If the file is compressed.
+    """
+    if detect_compression(path) is not None:
+        raise ValueError(f"Compressed files cannot be inspected in place; decompress {path.name} first")
+
+
 @dataclass
 class FileInfo:
     """Container for file metadata."""
@@ -57,29 +94,43 @@ class FileInfo:
     row_count: int
     column_count: int
     schema: dict[str, str]
+    parquet_footer: ParquetFooter | None = None
+    row_count_error: int | None = None
 
 
-def _read_file(path: Path, file_format: FileFormat) -> pl.DataFrame:
-    """Read a file into a DataFrame based on format.
+@dataclass
+class RowCountEstimate:
+    """Estimated row count with a ~95% error bound (both in rows)."""
+
+    rows: int
+    error: int
+
+
+def _scan_file(path: Path, file_format: FileFormat) -> pl.LazyFrame:
+    """Lazily scan a file based on format.
 
     Args:
         path: Path to the file.
         file_format: The format of the file.
 
     Returns:
-        DataFrame with file contents.
+        LazyFrame over the file contents.
     """
     match file_format:
         case FileFormat.PARQUET:
-            return pl.read_parquet(path)
+            return pl.scan_parquet(path)
         case FileFormat.CSV:
-            return pl.read_csv(path)
+            return pl.scan_csv(path)
         case FileFormat.NDJSON:
-            return pl.read_ndjson(path)
+            return pl.scan_ndjson(path)
 
 
 def _get_row_count_lazy(path: Path, file_format: FileFormat) -> int:
-    """Get row count using lazy evaluation when possible.
+    """Get row count using lazy evaluation.
+
+    For CSV and NDJSON, polars answers a bare `len()` by counting records on
+    a memory map without parsing any field; the CSV counter tracks quotes, so
+    newlines inside quoted fields are not counted as rows.
 
     Args:
         path: Path to the file.
@@ -88,18 +139,65 @@ def _get_row_count_lazy(path: Path, file_format: FileFormat) -> int:
     Returns:
         Number of rows in the file.
     """
-    match file_format:
-        case FileFormat.PARQUET:
-            # Use lazy scanning to count rows without loading all data
-            return pl.scan_parquet(path).select(pl.len()).collect().item()
-        case FileFormat.CSV:
-            return pl.scan_csv(path).select(pl.len()).collect().item()
-        case FileFormat.NDJSON:
-            return pl.scan_ndjson(path).select(pl.len()).collect().item()
+    return _scan_file(path, file_format).select(pl.len()).collect().item()
+
+
+def _sample_offsets(size: int) -> list[int]:
+    """Spread sample start offsets evenly from the start to the end of a file."""
+    last = size - APPROX_SAMPLE_SIZE
+    return sorted({round(last * i / (APPROX_SAMPLE_COUNT - 1)) for i in range(APPROX_SAMPLE_COUNT)})
+
+
+def estimate_row_count(path: Path, file_format: FileFormat) -> RowCountEstimate | None:
+    """Estimate the row count of a text file from a few sampled byte ranges.
+
+    Byte ranges at the start, end and evenly in between are realigned to
+    line boundaries; the average bytes per row across them extrapolates to
+    the file size. The error bound comes from the spread of bytes per row
+    between samples.
+
+    Args:
+        path: Path to a CSV or NDJSON file.
+        file_format: The format of the file.
+
+    Returns:
+        RowCountEstimate with the estimated rows and ~95% error bound, or None
+        if the file is small enough to be covered by the samples (or its rows
+        are longer than a sample) and should be counted exactly.
+    """
+    size = path.stat().st_size
+    if size <= APPROX_SAMPLE_COUNT * APPROX_SAMPLE_SIZE:
+        return None
+
+    header_bytes = 0
+    bytes_per_row: list[float] = []
+    with path.open("rb") as f:
+        for offset in _sample_offsets(size):
+            f.seek(offset)
+            sample = f.read(APPROX_SAMPLE_SIZE)
+            # Drop the partial line at the start (or the CSV header) and at the end
+            start = 0
+            if offset > 0 or file_format == FileFormat.CSV:
+                start = sample.find(b"\n") + 1
+                if offset == 0:
+                    header_bytes = start
+            end = sample.rfind(b"\n") + 1
+            lines = sample.count(b"\n", start, end)
+            if lines > 0:
+                bytes_per_row.append((end - start) / lines)
+
+    if not bytes_per_row:
+        return None
+
+    mean = statistics.fmean(bytes_per_row)
+    rows = (size - header_bytes) / mean
+    spread = statistics.stdev(bytes_per_row) if len(bytes_per_row) > 1 else 0.0
+    relative_error = APPROX_Z_SCORE * spread / (mean * math.sqrt(len(bytes_per_row)))
+    return RowCountEstimate(rows=round(rows), error=math.ceil(rows * relative_error))
 
 
 def _get_schema(path: Path, file_format: FileFormat) -> dict[str, str]:
-    """Get schema from a file using lazy evaluation when possible.
+    """Get schema from a file using lazy evaluation.
 
     Args:
         path: Path to the file.
@@ -108,41 +206,165 @@ def _get_schema(path: Path, file_format: FileFormat) -> dict[str, str]:
     Returns:
         Dict mapping column names to type strings.
     """
+    schema = _scan_file(path, file_format).collect_schema()
+    return {name: str(dtype) for name, dtype in schema.items()}
+
+
+def read_head(
+    path: Path,
+    file_format: FileFormat,
+    head: int,
+    columns: list[str] | None = None,
+    exclude: list[str] | None = None,
+    offset: int = 0,
+) -> pl.DataFrame:
+    """Read only the first rows of a file, or the rows after an offset.
+
+    The row slice and column selection are pushed into the scan, so Parquet
+    reads only the row groups covering the slice (located from the footer
+    row counts) and skips unselected column chunks, and text formats stop
+    parsing after `offset + head` records.
+
+    Args:
+        path: Path to the file.
+        file_format: The format of the file.
+        head: Number of rows to read.
+        columns: Columns to read; None reads every column.
+        exclude: Columns to leave out.
+        offset: Number of leading rows to skip.
+
+    Returns:
+        DataFrame with at most `head` rows.
+
+    Raises:
+        ValueError: If the file is compressed or a selected column does not exist.
+    """
+    require_uncompressed(path)
+    return select_columns(_scan_file(path, file_format), columns, exclude).slice(offset, head).collect()
+
+
+def _read_last_lines(path: Path, count: int, start: int = 0) -> list[bytes]:
+    """Read the last non-blank lines of a file by seeking backward from the end.
+
+    Only bytes from offset `start` onwards are considered, e.g. to skip a
+    CSV header.
+    """
+    if count == 0:
+        return []
+    with path.open("rb") as f:
+        position = f.seek(0, io.SEEK_END)
+        data = b""
+        block_size = TAIL_READ_SIZE
+        while True:
+            read_from = max(start, position - block_size)
+            f.seek(read_from)
+            data = f.read(position - read_from) + data
+            position = read_from
+            block_size *= 2
+
+            lines = data.split(b"\n")
+            if position > start:
+                # The first piece may be the end of a line that starts earlier
+                lines = lines[1:]
+            rows = [line for line in lines if line.strip()]
+            if len(rows) >= count or position == start:
+                return rows[-count:]
+
+
+def read_tail(
+    path: Path,
+    file_format: FileFormat,
+    count: int,
+    columns: list[str] | None = None,
+    exclude: list[str] | None = None,
+) -> pl.DataFrame:
+    """Read only the last rows of a file.
+
+    Parquet reads start at the footer row count minus `count`, so only the
+    last row groups are opened. CSV and NDJSON files are read backward from
+    the end in growing blocks until `count` records are found; their types
+    are inferred from those records. A quoted CSV field spanning lines leaves
+    an odd number of quotes on its first and last line, so a tail with such
+    a line falls back to a forward scan; quoted fields within a line, such
+    as ones containing commas, keep the backward read.
+
+    Args:
+        path: Path to the file.
+        file_format: The format of the file.
+        count: Number of rows to read.
+        columns: Columns to read; None reads every column.
+        exclude: Columns to leave out.
+
+    Returns:
+        DataFrame with at most `count` rows.
+
+    Raises:
+        ValueError: If the file is compressed or a selected column does not exist.
+    """
+    require_uncompressed(path)
     match file_format:
         case FileFormat.PARQUET:
-            schema = pl.scan_parquet(path).collect_schema()
-        case FileFormat.CSV:
-            schema = pl.scan_csv(path).collect_schema()
+            total = read_parquet_footer(path).num_rows
+            lf = pl.scan_parquet(path).slice(max(0, total - count), count)
         case FileFormat.NDJSON:
-            schema = pl.scan_ndjson(path).collect_schema()
+            rows = _read_last_lines(path, count)
+            lf = pl.read_ndjson(b"\n".join(rows)).lazy() if rows else pl.LazyFrame()
+        case FileFormat.CSV:
+            with path.open("rb") as f:
+                header = f.readline()
+            rows = _read_last_lines(path, count, start=len(header))
+            if any(row.count(b'"') % 2 for row in rows):
+                lf = pl.scan_csv(path).tail(count)
+            else:
+                lf = pl.read_csv(header + b"".join(row + b"\n" for row in rows)).lazy()
 
-    return {name: str(dtype) for name, dtype in schema.items()}
+    return select_columns(lf, columns, exclude).collect()
 
 
-def get_file_info(path: Path) -> FileInfo:
+def get_file_info(path: Path, approx: bool = False) -> FileInfo:
     """Get metadata about a file.
 
-    Uses lazy evaluation to avoid loading the entire file into memory.
+    Parquet metadata is read from the file footer only. Other formats use
+    lazy evaluation to avoid loading the entire file into memory.
 
     Args:
         path: Path to the file.
+        approx: Estimate the row count of CSV/NDJSON files from sampled byte
+            ranges instead of counting every row. Parquet counts are exact.
 
     Returns:
         FileInfo dataclass with file metadata.
 
     Raises:
         FileNotFoundError: If the file does not exist.
-        ValueError: If the file extension is not supported.
+        ValueError: If the file extension is not supported or the file is compressed.
     """
     if not path.exists():
         raise FileNotFoundError(f"Input file not found: {path}")
 
     file_format = detect_format(path)
+    require_uncompressed(path)
     size_bytes = path.stat().st_size
 
+    if file_format == FileFormat.PARQUET:
+        footer = read_parquet_footer(path)
+        return FileInfo(
+            path=path,
+            format=file_format,
+            size_bytes=size_bytes,
+            row_count=footer.num_rows,
+            column_count=len(footer.schema),
+            schema=footer.schema,
+            parquet_footer=footer,
+        )
+
     # Get schema and row count using lazy evaluation
     schema_dict = _get_schema(path, file_format)
-    row_count = _get_row_count_lazy(path, file_format)
+    estimate = estimate_row_count(path, file_format) if approx else None
+    if estimate is not None:
+        row_count, row_count_error = estimate.rows, estimate.error
+    else:
+        row_count, row_count_error = _get_row_count_lazy(path, file_format), None
 
     return FileInfo(
         path=path,
@@ -151,18 +373,21 @@ def get_file_info(path: Path) -> FileInfo:
         row_count=row_count,
         column_count=len(schema_dict),
         schema=schema_dict,
+        row_count_error=row_count_error,
     )
 
 
-def get_file_info_with_preview(path: Path, head: int) -> tuple[FileInfo, pl.DataFrame]:
-    """Get metadata and preview in a single file read.
+def get_file_info_with_preview(path: Path, head: int, approx: bool = False) -> tuple[FileInfo, pl.DataFrame]:
+    """Get metadata and a preview of the first rows.
 
-    This is more efficient than calling get_file_info() separately
-    when a preview is needed.
+    Metadata comes from the same cheap path as get_file_info() and the
+    preview reads only the first `head` rows, so latency scales with
+    `head` rather than file size.
 
     Args:
         path: Path to the file.
         head: Number of rows to include in preview.
+        approx: Estimate the row count of text files (see get_file_info).
 
     Returns:
         Tuple of (FileInfo, preview DataFrame).
@@ -171,28 +396,8 @@ def get_file_info_with_preview(path: Path, head: int) -> tuple[FileInfo, pl.Data
         FileNotFoundError: If the file does not exist.
         ValueError: If the file extension is not supported.
     """
-    if not path.exists():
-        raise FileNotFoundError(f"Input file not found: {path}")
-
-    file_format = detect_format(path)
-    size_bytes = path.stat().st_size
-
-    # Read the file once
-    df = _read_file(path, file_format)
-
-    # Extract schema from the loaded DataFrame
-    schema_dict = {name: str(dtype) for name, dtype in df.schema.items()}
-
-    file_info = FileInfo(
-        path=path,
-        format=file_format,
-        size_bytes=size_bytes,
-        row_count=df.shape[0],
-        column_count=df.shape[1],
-        schema=schema_dict,
-    )
-
-    preview = df.head(head)
+    file_info = get_file_info(path, approx=approx)
+    preview = read_head(path, file_info.format, head)
 
     return file_info, preview
 
@@ -216,12 +421,49 @@ def format_size(size_bytes: int) -> str:
         return f"{size_bytes / BYTES_PER_GB:.1f} GB"
 
 
-def format_file_info(info: FileInfo, preview: pl.DataFrame | None = None) -> str:
+def format_rows(df: pl.DataFrame) -> str:
+    """Format rows as a table, showing every row rather than eliding the middle.
+
+    Args:
+        df: Rows to format.
+
+    Returns:
+        Table text.
+    """
+    with pl.Config(tbl_rows=-1):
+        return str(df)
+
+
+def _format_parquet_layout(footer: ParquetFooter) -> list[str]:
+    """Format per-row-group sizes and per-column encodings of a Parquet file.
+
+    Args:
+        footer: Metadata read from the Parquet footer.
+
+    Returns:
+        Lines to append to the info output.
+    """
+    lines = ["", "Row group sizes:"]
+    for index, row_group in enumerate(footer.row_groups):
+        lines.append(
+            f"  {index}: {row_group.num_rows} rows, {format_size(row_group.compressed_size)} "
+            f"({format_size(row_group.uncompressed_size)} uncompressed)"
+        )
+
+    lines.extend(["", "Encodings:"])
+    for column, encodings in footer.column_encodings.items():
+        lines.append(f"  {column}: {', '.join(encodings)}")
+
+    return lines
+
+
+def format_file_info(info: FileInfo, preview: pl.DataFrame | None = None, preview_offset: int = 0) -> str:
     """Format file info as human-readable text.
 
     Args:
         info: FileInfo dataclass with metadata.
         preview: Optional DataFrame with preview rows.
+        preview_offset: Number of rows skipped before the preview.
 
     Returns:
         Formatted string for display.
@@ -230,18 +472,30 @@ def format_file_info(info: FileInfo, preview: pl.DataFrame | None = None) -> str
         f"File: {info.path.name}",
         f"Format: {info.format.value.capitalize()}",
         f"Size: {format_size(info.size_bytes)}",
-        f"Rows: {info.row_count}",
+        f"Rows: {info.row_count}"
+        if info.row_count_error is None
+        else f"Rows: ~{info.row_count} (±{info.row_count_error})",
         f"Columns: {info.column_count}",
-        "",
-        "Schema:",
     ]
 
+    footer = info.parquet_footer
+    if footer is not None:
+        lines.append(f"Row groups: {len(footer.row_groups)}")
+        lines.append(f"Compression: {', '.join(footer.codecs) or 'n/a'}")
+
+    lines.extend(["", "Schema:"])
     for name, dtype in info.schema.items():
         lines.append(f"  {name}: {dtype}")
 
+    if footer is not None:
+        lines.extend(_format_parquet_layout(footer))
+
     if preview is not None:
         lines.append("")
-        lines.append(f"Preview (first {len(preview)} rows):")
+        if preview_offset:
+            lines.append(f"Preview ({len(preview)} rows from offset {preview_offset}):")
+        else:
+            lines.append(f"Preview (first {len(preview)} rows):")
         lines.append(str(preview))
 
     return "\n".join(lines)
@@ -0,0 +1,320 @@
+"""Footer-only reader for Parquet file metadata.
+
+Parquet files end with a Thrift-encoded (compact protocol) FileMetaData
+structure followed by its length and the "PAR1" magic. Reading just that tail
+gives row counts, row group layout, codecs, encodings and statistics without
+touching any column pages.
+"""
+
+import io
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+PARQUET_MAGIC = b"PAR1"
+
+# Bytes read from the end of the file on the first attempt; most footers fit,
+# so the metadata usually arrives in a single read
+FOOTER_READ_SIZE = 64 * 1024
+
+# Thrift enum values from the Parquet format specification
+PHYSICAL_TYPES = {
+    0: "BOOLEAN",
+    1: "INT32",
+    2: "INT64",
+    3: "INT96",
+    4: "FLOAT",
+    5: "DOUBLE",
+    6: "BYTE_ARRAY",
+    7: "FIXED_LEN_BYTE_ARRAY",
+}
+CODECS = {
+    0: "UNCOMPRESSED",
+    1: "SNAPPY",
+    2: "GZIP",
+    3: "LZO",
+    4: "BROTLI",
+    5: "LZ4",
+    6: "ZSTD",
+    7: "LZ4_RAW",
+}
+ENCODINGS = {
+    0: "PLAIN",
+    2: "PLAIN_DICTIONARY",
+    3: "RLE",
+    4: "BIT_PACKED",
+    5: "DELTA_BINARY_PACKED",
+    6: "DELTA_LENGTH_BYTE_ARRAY",
+    7: "DELTA_BYTE_ARRAY",
+    8: "RLE_DICTIONARY",
+    9: "BYTE_STREAM_SPLIT",
+}
+
+# Thrift compact protocol type codes
+_STOP = 0
+_BOOL_TRUE = 1
+_BOOL_FALSE = 2
+_BYTE = 3
+_I16 = 4
+_I32 = 5
+_I64 = 6
+_DOUBLE = 7
+_BINARY = 8
+_LIST = 9
+_SET = 10
+_MAP = 11
+_STRUCT = 12
+
+
+class _CompactReader:
+    """Minimal Thrift compact protocol decoder.
+
+    Structs are decoded into dicts keyed by field id; unknown fields are kept,
+    so the reader does not need to know the full Parquet schema.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+
+    def read_byte(self) -> int:
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+
+    def read_varint(self) -> int:
+        result = 0
+        shift = 0
+        while True:
+            byte = self.read_byte()
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+
+    def read_zigzag(self) -> int:
+        n = self.read_varint()
+        return (n >> 1) ^ -(n & 1)
+
+    def read_value(self, type_code: int) -> Any:
+        match type_code:
+            case 1 | 2:
+                # Booleans inside collections are a full byte: 1 is true
+                return self.read_byte() == _BOOL_TRUE
+            case 3:
+                return struct.unpack("b", bytes([self.read_byte()]))[0]
+            case 4 | 5 | 6:
+                return self.read_zigzag()
+            case 7:
+                (value,) = struct.unpack_from("<d", self.data, self.pos)
+                self.pos += 8
+                return value
+            case 8:
+                length = self.read_varint()
+                value = self.data[self.pos : self.pos + length]
+                self.pos += length
+                return value
+            case 9 | 10:
+                return self.read_list()
+            case 11:
+                return self.read_map()
+            case 12:
+                return self.read_struct()
+        raise ValueError(f"Invalid Parquet footer: unknown Thrift type {type_code}")
+
+    def read_list(self) -> list[Any]:
+        header = self.read_byte()
+        size = header >> 4
+        if size == 15:
+            size = self.read_varint()
+        element_type = header & 0x0F
+        return [self.read_value(element_type) for _ in range(size)]
+
+    def read_map(self) -> dict[Any, Any]:
+        size = self.read_varint()
+        if size == 0:
+            return {}
+        types = self.read_byte()
+        return {self.read_value(types >> 4): self.read_value(types & 0x0F) for _ in range(size)}
+
+    def read_struct(self) -> dict[int, Any]:
+        fields: dict[int, Any] = {}
+        last_id = 0
+        while (header := self.read_byte()) != _STOP:
+            type_code = header & 0x0F
+            delta = header >> 4
+            field_id = last_id + delta if delta else self.read_zigzag()
+            last_id = field_id
+            if type_code == _BOOL_TRUE:
+                fields[field_id] = True
+            elif type_code == _BOOL_FALSE:
+                fields[field_id] = False
+            else:
+                fields[field_id] = self.read_value(type_code)
+        return fields
+
+
+@dataclass
+class ColumnStatistics:
+    """Raw min/max statistics of a column chunk, in Parquet plain encoding."""
+
+    min_value: bytes | None
+    max_value: bytes | None
+    null_count: int | None
+
+
+@dataclass
+class ColumnChunkMetadata:
+    """Metadata of one column within one row group."""
+
+    path: str
+    physical_type: str
+    codec: str
+    encodings: list[str]
+    num_values: int
+    compressed_size: int
+    uncompressed_size: int
+    statistics: ColumnStatistics | None
+
+
+@dataclass
+class RowGroupMetadata:
+    """Metadata of one row group."""
+
+    num_rows: int
+    compressed_size: int
+    uncompressed_size: int
+    columns: list[ColumnChunkMetadata]
+
+
+@dataclass
+class ParquetFooter:
+    """Metadata decoded from a Parquet file footer."""
+
+    num_rows: int
+    schema: dict[str, str]
+    row_groups: list[RowGroupMetadata]
+    created_by: str | None
+
+    @property
+    def codecs(self) -> list[str]:
+        """Distinct compression codecs used by any column chunk, in first-seen order."""
+        return list(dict.fromkeys(col.codec for rg in self.row_groups for col in rg.columns))
+
+    @property
+    def column_encodings(self) -> dict[str, list[str]]:
+        """Distinct encodings per column across all row groups."""
+        encodings: dict[str, dict[str, None]] = {}
+        for rg in self.row_groups:
+            for col in rg.columns:
+                encodings.setdefault(col.path, {}).update(dict.fromkeys(col.encodings))
+        return {path: list(names) for path, names in encodings.items()}
+
+
+def _parse_statistics(fields: dict[int, Any] | None) -> ColumnStatistics | None:
+    """Build ColumnStatistics from a Thrift Statistics struct."""
+    if not fields:
+        return None
+    # Fields 5/6 (min_value/max_value) supersede the deprecated 1/2 (max/min)
+    return ColumnStatistics(
+        min_value=fields.get(6, fields.get(2)),
+        max_value=fields.get(5, fields.get(1)),
+        null_count=fields.get(3),
+    )
+
+
+def _parse_column_chunk(fields: dict[int, Any]) -> ColumnChunkMetadata:
+    """Build ColumnChunkMetadata from a Thrift ColumnChunk struct."""
+    meta = fields.get(3, {})
+    return ColumnChunkMetadata(
+        path=".".join(part.decode() for part in meta.get(3, [])),
+        physical_type=PHYSICAL_TYPES.get(meta.get(1, -1), "UNKNOWN"),
+        codec=CODECS.get(meta.get(4, -1), "UNKNOWN"),
+        encodings=[ENCODINGS.get(e, f"UNKNOWN({e})") for e in meta.get(2, [])],
+        num_values=meta.get(5, 0),
+        uncompressed_size=meta.get(6, 0),
+        compressed_size=meta.get(7, 0),
+        statistics=_parse_statistics(meta.get(12)),
+    )
+
+
+def _parse_row_group(fields: dict[int, Any]) -> RowGroupMetadata:
+    """Build RowGroupMetadata from a Thrift RowGroup struct."""
+    columns = [_parse_column_chunk(col) for col in fields.get(1, [])]
+    return RowGroupMetadata(
+        num_rows=fields.get(3, 0),
+        compressed_size=fields.get(6, sum(col.compressed_size for col in columns)),
+        uncompressed_size=fields.get(2, sum(col.uncompressed_size for col in columns)),
+        columns=columns,
+    )
+
+
+def _read_footer_bytes(path: Path) -> bytes:
+    """Read the raw Thrift FileMetaData bytes from the end of a Parquet file.
+
+    Raises:
+        ValueError: If the file is not a Parquet file.
+    """
+    with path.open("rb") as f:
+        file_size = f.seek(0, io.SEEK_END)
+        if file_size < 2 * len(PARQUET_MAGIC) + 4:
+            raise ValueError(f"Not a Parquet file: {path}")
+
+        tail_size = min(file_size, FOOTER_READ_SIZE)
+        f.seek(file_size - tail_size)
+        tail = f.read(tail_size)
+        if tail[-4:] != PARQUET_MAGIC:
+            raise ValueError(f"Not a Parquet file: {path}")
+
+        (footer_size,) = struct.unpack("<I", tail[-8:-4])
+        if footer_size + 8 > file_size - len(PARQUET_MAGIC):
+            raise ValueError(f"Invalid Parquet footer length in {path}")
+        if footer_size + 8 <= tail_size:
+            return tail[-8 - footer_size : -8]
+
+        f.seek(file_size - 8 - footer_size)
+        return f.read(footer_size)
+
+
+def _polars_schema(footer: bytes) -> dict[str, str]:
+    """Resolve the polars schema from footer bytes alone.
+
+    The footer is wrapped in a minimal Parquet envelope so polars can map
+    physical/logical/Arrow types exactly as it would for the full file.
+    """
+    envelope = PARQUET_MAGIC + footer + struct.pack("<I", len(footer)) + PARQUET_MAGIC
+    schema = pl.read_parquet_schema(io.BytesIO(envelope))
+    return {name: str(dtype) for name, dtype in schema.items()}
+
+
+def read_parquet_footer(path: Path) -> ParquetFooter:
+    """Read Parquet metadata from the file footer only.
+
+    The file is opened once and, for footers under FOOTER_READ_SIZE, read
+    with a single request; no column data is read.
+
+    Args:
+        path: Path to the Parquet file.
+
+    Returns:
+        ParquetFooter with row count, schema and row group metadata.
+
+    Raises:
+        ValueError: If the file is not a valid Parquet file.
+    """
+    footer = _read_footer_bytes(path)
+    try:
+        fields = _CompactReader(footer).read_struct()
+    except IndexError:
+        raise ValueError(f"Invalid Parquet footer in {path}") from None
+
+    created_by = fields.get(6)
+    return ParquetFooter(
+        num_rows=fields.get(3, 0),
+        schema=_polars_schema(footer),
+        row_groups=[_parse_row_group(rg) for rg in fields.get(4, [])],
+        created_by=created_by.decode() if created_by is not None else None,
+    )
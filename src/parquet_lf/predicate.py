@@ -0,0 +1,317 @@
+"""Predicate module for --where row filters.
+
+A filter is a Python-style boolean expression over column names, e.g.
+
+    customer_id == 42 and day >= date("2024-01-01")
+
+Expressions are parsed with the ast module and only column references,
+literals, comparisons, boolean operators and arithmetic are allowed, so the
+text is never evaluated as Python code. Columns whose names are not valid
+identifiers can be written as col("name").
+"""
+
+import ast
+import datetime
+import math
+import operator
+import struct
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import reduce
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from parquet_lf.parquet_footer import ParquetFooter, RowGroupMetadata, read_parquet_footer
+
+# Helpers that build temporal literals from ISO 8601 strings
+_LITERAL_FUNCTIONS: dict[str, Callable[[str], Any]] = {
+    "date": datetime.date.fromisoformat,
+    "datetime": datetime.datetime.fromisoformat,
+}
+
+_COMPARISONS: dict[type[ast.cmpop], Callable[[Any, Any], Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+# The same comparison with its operands swapped, e.g. 5 < x is x > 5
+_FLIPPED: dict[type[ast.cmpop], ast.cmpop] = {
+    ast.Eq: ast.Eq(),
+    ast.NotEq: ast.NotEq(),
+    ast.Lt: ast.Gt(),
+    ast.LtE: ast.GtE(),
+    ast.Gt: ast.Lt(),
+    ast.GtE: ast.LtE(),
+}
+
+_ARITHMETIC: dict[type[ast.operator], Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+}
+
+# Polars types whose Parquet min/max statistics can be decoded and compared
+_SIGNED_INTEGERS = frozenset({"Int8", "Int16", "Int32", "Int64"})
+_UNSIGNED_INTEGERS = frozenset({"UInt8", "UInt16", "UInt32", "UInt64"})
+_EPOCH = datetime.date(1970, 1, 1)
+
+
+@dataclass
+class RowGroupPruning:
+    """How many row groups a filter rules out from statistics alone."""
+
+    total: int
+    pruned: int
+
+
+@dataclass
+class _ColumnRange:
+    """Decoded statistics of one column chunk; None where unknown."""
+
+    min_value: Any
+    max_value: Any
+    null_count: int | None
+    num_values: int
+
+
+def _parse_tree(text: str) -> ast.expr:
+    """Parse filter text into an expression tree."""
+    try:
+        return ast.parse(text.strip(), mode="eval").body
+    except SyntaxError as e:
+        raise ValueError(f"Invalid filter expression {text!r}: {e.msg}") from None
+
+
+def _column_name(node: ast.expr) -> str | None:
+    """Return the column a node refers to, or None if it is not a column."""
+    match node:
+        case ast.Name(id=name):
+            return name
+        case ast.Call(func=ast.Name(id="col"), args=[ast.Constant(value=str() as name)], keywords=[]):
+            return name
+    return None
+
+
+def _literal_value(node: ast.expr) -> Any:
+    """Return the Python value of a literal node."""
+    match node:
+        case ast.Constant(value=None | bool() | int() | float() | str() as value):
+            return value
+        case ast.UnaryOp(op=ast.USub(), operand=ast.Constant(value=int() | float() as value)):
+            return -value
+        case ast.Call(func=ast.Name(id=name), args=[ast.Constant(value=str() as text)], keywords=[]):
+            if name not in _LITERAL_FUNCTIONS:
+                raise ValueError(f"Unknown function: {name}")
+            try:
+                return _LITERAL_FUNCTIONS[name](text)
+            except ValueError:
+                raise ValueError(f"Invalid {name}: {text!r}") from None
+        case ast.List(elts=elts) | ast.Tuple(elts=elts):
+            return [_literal_value(elt) for elt in elts]
+    raise ValueError(f"Unsupported expression: {ast.unparse(node)}")
+
+
+def _comparison_expr(left: ast.expr, op: ast.cmpop, right: ast.expr) -> pl.Expr:
+    """Build the polars expression for a single comparison."""
+    match op:
+        case ast.In() | ast.NotIn():
+            values = _literal_value(right)
+            if not isinstance(values, list):
+                raise ValueError(f"'in' needs a list of literals: {ast.unparse(right)}")
+            expr = _to_expr(left).is_in(values)
+            return ~expr if isinstance(op, ast.NotIn) else expr
+        case ast.Is() | ast.IsNot():
+            if not (isinstance(right, ast.Constant) and right.value is None):
+                raise ValueError(f"'is' can only compare to None: {ast.unparse(right)}")
+            return _to_expr(left).is_null() if isinstance(op, ast.Is) else _to_expr(left).is_not_null()
+    return _COMPARISONS[type(op)](_to_expr(left), _to_expr(right))
+
+
+def _to_expr(node: ast.expr) -> pl.Expr:
+    """Translate an expression tree into a polars expression."""
+    if (name := _column_name(node)) is not None:
+        return pl.col(name)
+
+    match node:
+        case ast.BoolOp(op=op, values=values):
+            combine = operator.and_ if isinstance(op, ast.And) else operator.or_
+            return reduce(combine, [_to_expr(value) for value in values])
+        case ast.UnaryOp(op=ast.Not(), operand=operand):
+            return ~_to_expr(operand)
+        case ast.Compare(left=left, ops=ops, comparators=comparators):
+            # Chained comparisons (a < x < b) mean each pair holds
+            operands = [left, *comparators]
+            parts = [_comparison_expr(operands[i], op, operands[i + 1]) for i, op in enumerate(ops)]
+            return reduce(operator.and_, parts)
+        case ast.BinOp(left=left, op=op, right=right) if type(op) in _ARITHMETIC:
+            return _ARITHMETIC[type(op)](_to_expr(left), _to_expr(right))
+    return pl.lit(_literal_value(node))
+
+
+def parse_where(text: str) -> pl.Expr:
+    """Parse a filter expression into a polars expression.
+
+    Supports ==, !=, <, <=, >, >=, in / not in [literals], is None / is not
+    None, and / or / not, + - * / %, numbers, strings, True/False and the
+    date("YYYY-MM-DD") and datetime("YYYY-MM-DDTHH:MM:SS") literals.
+
+    Args:
+        text: Filter expression.
+
+    Returns:
+        Boolean polars expression.
+
+    Raises:
+        ValueError: If the expression is invalid or uses unsupported syntax.
+    """
+    return _to_expr(_parse_tree(text))
+
+
+def _decode_statistic(raw: bytes | None, physical_type: str, dtype: str) -> Any:
+    """Decode a plain-encoded min/max value, or return None if it is not comparable."""
+    if raw is None:
+        return None
+    if dtype in _SIGNED_INTEGERS | _UNSIGNED_INTEGERS and physical_type in ("INT32", "INT64"):
+        return int.from_bytes(raw, "little", signed=dtype in _SIGNED_INTEGERS)
+    if dtype == "Date" and physical_type == "INT32":
+        return _EPOCH + datetime.timedelta(days=int.from_bytes(raw, "little", signed=True))
+    if dtype in ("Float32", "Float64") and physical_type in ("FLOAT", "DOUBLE"):
+        (value,) = struct.unpack("<f" if physical_type == "FLOAT" else "<d", raw)
+        return None if math.isnan(value) else value
+    if dtype == "String" and physical_type == "BYTE_ARRAY":
+        # UTF-8 byte order matches code point order, so str comparisons agree with Parquet's
+        try:
+            return raw.decode()
+        except UnicodeDecodeError:
+            return None
+    return None
+
+
+def _column_ranges(row_group: RowGroupMetadata, schema: dict[str, str]) -> dict[str, _ColumnRange]:
+    """Decode the statistics of every top-level column in a row group."""
+    ranges = {}
+    for column in row_group.columns:
+        if column.path not in schema or column.statistics is None:
+            continue
+        stats = column.statistics
+        dtype = schema[column.path]
+        ranges[column.path] = _ColumnRange(
+            min_value=_decode_statistic(stats.min_value, column.physical_type, dtype),
+            max_value=_decode_statistic(stats.max_value, column.physical_type, dtype),
+            null_count=stats.null_count,
+            num_values=column.num_values,
+        )
+    return ranges
+
+
+def _comparison_may_match(left: ast.expr, op: ast.cmpop, right: ast.expr, ranges: dict[str, _ColumnRange]) -> bool:
+    """Check whether any row in the ranges could satisfy one comparison."""
+    name = _column_name(left)
+    if name is None:
+        # Only literal-on-the-left comparisons can be flipped
+        name = _column_name(right)
+        if name is None or type(op) not in _FLIPPED:
+            return True
+        left, op, right = right, _FLIPPED[type(op)], left
+
+    column = ranges.get(name)
+    if column is None:
+        return True
+    if isinstance(op, ast.Is | ast.IsNot):
+        if column.null_count is None:
+            return True
+        return column.null_count > 0 if isinstance(op, ast.Is) else column.null_count < column.num_values
+
+    try:
+        value = _literal_value(right)
+    except ValueError:
+        return True
+    low, high = column.min_value, column.max_value
+    if low is None or high is None:
+        return True
+
+    try:
+        match op:
+            case ast.Eq():
+                return low <= value <= high
+            case ast.NotEq():
+                return not low == high == value
+            case ast.Lt():
+                return low < value
+            case ast.LtE():
+                return low <= value
+            case ast.Gt():
+                return high > value
+            case ast.GtE():
+                return high >= value
+            case ast.In() if isinstance(value, list):
+                return any(low <= item <= high for item in value)
+    except TypeError:
+        # Mismatched types, e.g. a string literal against an integer column
+        return True
+    return True
+
+
+def _may_match(node: ast.expr, ranges: dict[str, _ColumnRange]) -> bool:
+    """Check whether any row in the ranges could satisfy the expression.
+
+    Errs towards True: anything the statistics cannot decide may match.
+    """
+    match node:
+        case ast.BoolOp(op=ast.And(), values=values):
+            return all(_may_match(value, ranges) for value in values)
+        case ast.BoolOp(op=ast.Or(), values=values):
+            return any(_may_match(value, ranges) for value in values)
+        case ast.Compare(left=left, ops=ops, comparators=comparators):
+            operands = [left, *comparators]
+            return all(_comparison_may_match(operands[i], op, operands[i + 1], ranges) for i, op in enumerate(ops))
+    return True
+
+
+def prune_row_groups(footer: ParquetFooter, where: str) -> RowGroupPruning:
+    """Count the row groups whose min/max statistics exclude a filter.
+
+    Polars applies the same statistics when it scans with the filter, so
+    these row groups are skipped without reading their column data.
+
+    Args:
+        footer: Footer of the Parquet file.
+        where: Filter expression (see parse_where).
+
+    Returns:
+        RowGroupPruning with the total and pruned row group counts.
+
+    Raises:
+        ValueError: If the expression is invalid.
+    """
+    tree = _parse_tree(where)
+    # Reject exactly the expressions parse_where rejects
+    _to_expr(tree)
+    pruned = sum(not _may_match(tree, _column_ranges(rg, footer.schema)) for rg in footer.row_groups)
+    return RowGroupPruning(total=len(footer.row_groups), pruned=pruned)
+
+
+def count_pruned_row_groups(path: Path, where: str) -> RowGroupPruning:
+    """Count the row groups of a Parquet file that a filter rules out.
+
+    Only the file footer is read.
+
+    Args:
+        path: Path to the Parquet file.
+        where: Filter expression (see parse_where).
+
+    Returns:
+        RowGroupPruning with the total and pruned row group counts.
+
+    Raises:
+        ValueError: If the file is not Parquet or the expression is invalid.
+    """
+    return prune_row_groups(read_parquet_footer(path), where)
@@ -0,0 +1,144 @@
+"""Sample module for drawing random rows from Parquet files."""
+
+import bisect
+import itertools
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+import polars as pl
+
+from parquet_lf.converters.base import select_columns
+from parquet_lf.parquet_footer import read_parquet_footer
+
+
+@dataclass
+class ParquetSample:
+    """Rows drawn from a Parquet file and how much of the file was read."""
+
+    rows: pl.DataFrame
+    row_groups_read: int
+    row_groups_total: int
+
+
+def sample_size(total: int, rows: int | None = None, fraction: float | None = None) -> int:
+    """Work out how many rows to sample.
+
+    Args:
+        total: Number of rows in the file.
+        rows: Fixed number of rows; capped at `total`.
+        fraction: Share of rows between 0 and 1, rounded to whole rows.
+
+    Returns:
+        Number of rows to sample.
+
+    Raises:
+        ValueError: If not exactly one of rows and fraction is given, or
+            either is out of range.
+    """
+    if (rows is None) == (fraction is None):
+        raise ValueError("Give either a number of rows or a fraction to sample")
+    if rows is not None:
+        if rows < 0:
+            raise ValueError(f"Number of rows must not be negative, got {rows}")
+        return min(rows, total)
+    if fraction is None or not 0 <= fraction <= 1:
+        raise ValueError(f"Fraction must be between 0 and 1, got {fraction}")
+    return round(total * fraction)
+
+
+def plan_sample(
+    row_counts: list[int], size: int, seed: int | None = None, by_row_group: bool = False
+) -> dict[int, list[int]]:
+    """Choose rows at random and group them by row group.
+
+    By default every row is equally likely to be chosen, which usually puts
+    a chosen row in every row group. With `by_row_group`, random whole row
+    groups are picked first until they hold `size` rows and the rows are
+    chosen among those, so only about size / rows-per-group row groups are
+    read, at the cost of a sample clustered in those groups.
+
+    Args:
+        row_counts: Number of rows in each row group, in file order.
+        size: Number of distinct rows to choose; capped at the total.
+        seed: Seed for a reproducible choice; None draws a fresh one.
+        by_row_group: Restrict the choice to randomly picked row groups.
+
+    Returns:
+        Mapping of row group index to the sorted positions of the chosen rows
+        within it. Row groups without chosen rows are left out.
+    """
+    rng = random.Random(seed)
+    size = min(size, sum(row_counts))
+    groups = list(range(len(row_counts)))
+    if by_row_group:
+        picked: list[int] = []
+        covered = 0
+        for group in rng.sample(groups, len(groups)):
+            if covered >= size:
+                break
+            picked.append(group)
+            covered += row_counts[group]
+        groups = sorted(picked)
+
+    # Number the rows of the candidate groups consecutively and draw from them
+    starts = list(itertools.accumulate((row_counts[group] for group in groups), initial=0))
+    chosen = sorted(rng.sample(range(starts[-1]), size))
+
+    plan: dict[int, list[int]] = {}
+    for row in chosen:
+        index = bisect.bisect_right(starts, row) - 1
+        plan.setdefault(groups[index], []).append(row - starts[index])
+    return plan
+
+
+def sample_parquet(
+    path: Path,
+    rows: int | None = None,
+    fraction: float | None = None,
+    seed: int | None = None,
+    by_row_group: bool = False,
+    columns: list[str] | None = None,
+    exclude: list[str] | None = None,
+) -> ParquetSample:
+    """Draw a random sample of rows from a Parquet file.
+
+    The rows are chosen from the footer row counts before any data is read
+    (see plan_sample). Only row groups holding a chosen row are then read,
+    one at a time, so memory stays bounded by one row group plus the sample.
+    Sampled rows keep their file order.
+
+    Args:
+        path: Path to the Parquet file.
+        rows: Fixed number of rows to sample.
+        fraction: Share of rows to sample, between 0 and 1.
+        seed: Seed for a reproducible sample.
+        by_row_group: Sample within randomly picked whole row groups, reading
+            only as many row groups as the sample needs.
+        columns: Columns to read; None reads every column.
+        exclude: Columns to leave out.
+
+    Returns:
+        ParquetSample with the sampled rows and row group counts.
+
+    Raises:
+        ValueError: If the sample size is invalid, the file is not Parquet or
+            a selected column does not exist.
+    """
+    footer = read_parquet_footer(path)
+    row_counts = [row_group.num_rows for row_group in footer.row_groups]
+    plan = plan_sample(row_counts, sample_size(footer.num_rows, rows, fraction), seed, by_row_group)
+
+    lf = select_columns(pl.scan_parquet(path), columns, exclude)
+    starts = list(itertools.accumulate(row_counts, initial=0))
+    # The slice is pushed into the reader, so each collect decodes a single row group
+    frames = [
+        lf.slice(starts[group], row_counts[group]).collect().select(pl.all().gather(positions))
+        for group, positions in plan.items()
+    ]
+
+    return ParquetSample(
+        rows=pl.concat(frames) if frames else lf.clear().collect(),
+        row_groups_read=len(plan),
+        row_groups_total=len(row_counts),
+    )
@@ -0,0 +1,294 @@
+"""Schema module for reading, writing and inferring schema files.
+
+A schema file is a JSON object mapping column names to polars data types,
+written the way polars prints them (the same strings `info` shows):
+
+    {"id": "Int64", "name": "String", "tags": "List(String)"}
+"""
+
+import ast
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from parquet_lf.info import FileFormat, detect_format, require_uncompressed
+
+# Rows used to infer a schema when none is given
+DEFAULT_SAMPLE_ROWS = 10_000
+
+# Highest share of distinct values among a string column's non-null values
+# for automatic categorical detection to store it as Categorical
+DEFAULT_CATEGORICAL_RATIO = 0.05
+
+# Sampled inference: byte ranges spread across the file and bytes parsed per range
+INFERENCE_SAMPLE_COUNT = 16
+INFERENCE_SAMPLE_SIZE = 128 * 1024
+
+
+class SchemaInference(Enum):
+    """How column types are inferred when no schema is given."""
+
+    HEAD = "head"
+    SAMPLED = "sampled"
+
+
+def _dtype_class(name: str) -> type[pl.DataType]:
+    """Look up a polars data type class by name."""
+    dtype = getattr(pl, name, None)
+    if not (isinstance(dtype, type) and issubclass(dtype, pl.DataType)):
+        raise ValueError(f"Unknown data type: {name}")
+    return dtype
+
+
+def _eval_dtype_node(node: ast.expr) -> Any:
+    """Evaluate a parsed data type expression, allowing only dtypes and literals."""
+    match node:
+        case ast.Name(id=name):
+            return _dtype_class(name)
+        case ast.Call(func=ast.Name(id=name), args=args, keywords=keywords):
+            kwargs = {kw.arg: _eval_dtype_node(kw.value) for kw in keywords if kw.arg is not None}
+            return _dtype_class(name)(*[_eval_dtype_node(arg) for arg in args], **kwargs)
+        case ast.Constant(value=value):
+            return value
+        case ast.Dict(keys=keys, values=values):
+            return {_eval_dtype_node(k): _eval_dtype_node(v) for k, v in zip(keys, values, strict=True) if k}
+        case ast.List(elts=elts):
+            return [_eval_dtype_node(elt) for elt in elts]
+        case ast.Tuple(elts=elts):
+            return tuple(_eval_dtype_node(elt) for elt in elts)
+    raise ValueError(f"Unsupported expression: {ast.unparse(node)}")
+
+
+def parse_dtype(text: str) -> pl.DataType:
+    """Parse a polars data type from its string form.
+
+    Accepts what `str(dtype)` produces, e.g. "Int64",
+    "Datetime(time_unit='us', time_zone='UTC')" or "Struct({'a': List(Int64)})".
+    Only polars data types and literals are evaluated.
+
+    Args:
+        text: Data type string.
+
+    Returns:
+        The polars data type.
+
+    Raises:
+        ValueError: If the string is not a valid polars data type.
+    """
+    try:
+        dtype = _eval_dtype_node(ast.parse(text.strip(), mode="eval").body)
+        return dtype() if isinstance(dtype, type) else dtype
+    except (SyntaxError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid data type {text!r}: {e}") from None
+
+
+def load_schema(path: Path) -> pl.Schema:
+    """Load a schema file.
+
+    Args:
+        path: Path to a JSON schema file.
+
+    Returns:
+        Schema with the columns in file order.
+
+    Raises:
+        FileNotFoundError: If the schema file does not exist.
+        ValueError: If the file is not a JSON object of column types.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Schema file not found: {path}")
+    try:
+        columns = json.loads(path.read_text())
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid schema file {path}: {e}") from None
+    if not isinstance(columns, dict) or not all(isinstance(v, str) for v in columns.values()):
+        raise ValueError(f"Invalid schema file {path}: expected a JSON object mapping column names to types")
+
+    return pl.Schema({name: parse_dtype(dtype) for name, dtype in columns.items()})
+
+
+def schema_to_json(schema: pl.Schema) -> str:
+    """Serialize a schema in the schema file format.
+
+    Args:
+        schema: Schema to serialize.
+
+    Returns:
+        Indented JSON text.
+    """
+    return json.dumps({name: str(dtype) for name, dtype in schema.items()}, indent=2)
+
+
+def infer_schema(path: Path, sample_rows: int | None = DEFAULT_SAMPLE_ROWS) -> pl.Schema:
+    """Infer the schema of a file.
+
+    CSV and NDJSON types are inferred from the first `sample_rows` rows;
+    Parquet schemas are read from the file metadata.
+
+    Args:
+        path: Path to a CSV, NDJSON or Parquet file.
+        sample_rows: Number of rows to infer text file types from; None
+            infers from every row.
+
+    Returns:
+        The inferred schema.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file extension is not supported or the file is compressed.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Input file not found: {path}")
+
+    file_format = detect_format(path)
+    require_uncompressed(path)
+    match file_format:
+        case FileFormat.PARQUET:
+            return pl.scan_parquet(path).collect_schema()
+        case FileFormat.CSV:
+            return pl.scan_csv(path, infer_schema_length=sample_rows).collect_schema()
+        case FileFormat.NDJSON:
+            return pl.scan_ndjson(path, infer_schema_length=sample_rows).collect_schema()
+
+
+def _merge_schemas(schemas: list[pl.Schema]) -> pl.Schema:
+    """Combine schemas into one that fits every sample.
+
+    Columns keep their first-seen order; differing types widen to their
+    polars supertype (e.g. Int64 and Float64 to Float64, anything and String
+    to String), as inference over all rows at once would.
+    """
+    frames = [pl.DataFrame(schema=schema) for schema in schemas]
+    return pl.concat(frames, how="diagonal_relaxed").schema
+
+
+def _infer_sample(path: Path, file_format: FileFormat, offset: int, header: bytes) -> pl.Schema | None:
+    """Infer the schema of one byte range realigned to line boundaries.
+
+    Returns None if the range holds no complete record or cannot be parsed,
+    e.g. when it starts inside a quoted field that spans lines.
+    """
+    with path.open("rb") as f:
+        f.seek(offset)
+        data = f.read(INFERENCE_SAMPLE_SIZE)
+
+    # Skip the partial record before the first newline (or the header itself)
+    start = data.find(b"\n") + 1 if offset > 0 or header else 0
+    end = data.rfind(b"\n") + 1
+    if end <= start:
+        return None
+
+    try:
+        if file_format == FileFormat.CSV:
+            df = pl.read_csv(header + data[start:end], infer_schema_length=None)
+        else:
+            df = pl.read_ndjson(data[start:end], infer_schema_length=None)
+    except pl.exceptions.PolarsError:
+        return None
+
+    # An all-empty CSV column reads as String; mark it Null so other samples decide its type
+    return pl.Schema(
+        {name: pl.Null() if df[name].null_count() == df.height else dtype for name, dtype in df.schema.items()}
+    )
+
+
+def infer_schema_sampled(path: Path) -> pl.Schema:
+    """Infer the schema of a text file from samples spread across it.
+
+    Byte ranges at the start, end and evenly in between are realigned to
+    record boundaries, inferred in parallel from every row they hold, and
+    merged by type supertype. This approaches full-file inference while
+    parsing at most INFERENCE_SAMPLE_COUNT * INFERENCE_SAMPLE_SIZE bytes.
+
+    Args:
+        path: Path to a CSV or NDJSON file.
+
+    Returns:
+        The inferred schema.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file is not CSV/NDJSON, is compressed or no sample
+            can be parsed.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Input file not found: {path}")
+    file_format = detect_format(path)
+    if file_format == FileFormat.PARQUET:
+        raise ValueError("Sampled schema inference applies to CSV and NDJSON files")
+    require_uncompressed(path)
+
+    size = path.stat().st_size
+    if size <= INFERENCE_SAMPLE_COUNT * INFERENCE_SAMPLE_SIZE:
+        # Cheaper to infer from every row than to sample
+        return infer_schema(path, sample_rows=None)
+
+    header = b""
+    if file_format == FileFormat.CSV:
+        with path.open("rb") as f:
+            header = f.readline()
+
+    last = size - INFERENCE_SAMPLE_SIZE
+    offsets = sorted({last * i // (INFERENCE_SAMPLE_COUNT - 1) for i in range(INFERENCE_SAMPLE_COUNT)})
+    # polars releases the GIL while parsing, so threads infer samples in parallel
+    with ThreadPoolExecutor(max_workers=min(len(offsets), os.process_cpu_count() or 1)) as pool:
+        results = list(pool.map(lambda offset: _infer_sample(path, file_format, offset, header), offsets))
+
+    schemas = [schema for schema in results if schema is not None]
+    if not schemas:
+        raise ValueError(f"Could not infer a schema from samples of {path}")
+    schema = _merge_schemas(schemas)
+    if file_format == FileFormat.CSV:
+        # Columns empty in every sample: CSV inference treats them as String
+        schema = pl.Schema({name: pl.String() if dtype == pl.Null else dtype for name, dtype in schema.items()})
+    return schema
+
+
+def check_csv_header(source: Path | bytes, schema: pl.Schema) -> None:
+    """Check that a CSV header names the schema's columns in order.
+
+    Polars applies an explicit CSV schema by position, so a mismatched
+    header would silently relabel columns.
+
+    Args:
+        source: CSV file path or bytes starting with the header row.
+        schema: Schema the CSV will be parsed into.
+
+    Raises:
+        ValueError: If the header and schema columns differ.
+    """
+    header = pl.read_csv(source, n_rows=0, infer_schema=False).columns
+    if header != schema.names():
+        raise ValueError(f"CSV header does not match the schema: expected {schema.names()}, found {header}")
+
+
+def categorical_schema(sample: pl.DataFrame, max_ratio: float, schema: pl.Schema | None = None) -> pl.Schema:
+    """Mark low-cardinality string columns of a sample as Categorical.
+
+    A String column qualifies when its distinct non-null values number at
+    most `max_ratio` times its non-null values. Categorical columns hold each
+    distinct string once and the rows as small integer codes, so parsing
+    straight into them keeps repetitive text columns compact in memory.
+
+    Args:
+        sample: Leading rows of the input.
+        max_ratio: Highest distinct-to-non-null ratio, between 0 and 1.
+        schema: Schema to update; defaults to the sample's.
+
+    Returns:
+        The schema with qualifying columns changed to Categorical.
+    """
+    schema = schema or sample.schema
+    categorical = set()
+    for name, dtype in sample.schema.items():
+        if dtype != pl.String or schema.get(name) != pl.String:
+            continue
+        values = sample[name].drop_nulls()
+        if not values.is_empty() and values.n_unique() <= max_ratio * len(values):
+            categorical.add(name)
+    return pl.Schema({name: pl.Categorical() if name in categorical else dtype for name, dtype in schema.items()})
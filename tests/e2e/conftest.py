@@ -15,6 +15,12 @@ class CLIResult(NamedTuple):
     stderr: str
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch) -> None:
+    """Point the metadata cache at a temporary directory for every CLI test."""
+    monkeypatch.setenv("PARQUET_LF_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+
+
 @pytest.fixture
 def run_cli():
     """Fixture that returns a function to run parquet-lf CLI commands.
@@ -1,5 +1,8 @@
 """End-to-end tests for CLI commands."""
 
+import gzip
+import os
+import re
 from pathlib import Path
 
 import polars as pl
@@ -43,6 +46,102 @@ class TestToParquetCSV:
         df = pl.read_parquet(output_file)
         assert df.shape == (1, 2)
 
+    def test_csv_to_parquet_eager_flag(self, run_cli, tmp_path: Path) -> None:
+        """CLI converts CSV to Parquet with --eager."""
+        csv_file = tmp_path / "input.csv"
+        csv_file.write_text("name,value\nalice,10\nbob,20")
+        output_file = tmp_path / "output.parquet"
+
+        result = run_cli(["to-parquet", "csv", str(csv_file), "-o", str(output_file), "--eager"])
+
+        assert result.exit_code == 0
+        assert pl.read_parquet(output_file).shape == (2, 2)
+
+    def test_csv_to_parquet_writer_options(self, run_cli, tmp_path: Path) -> None:
+        """CLI accepts compression, row group size and statistics options."""
+        csv_file = tmp_path / "input.csv"
+        csv_file.write_text("name,value\nalice,10\nbob,20")
+        output_file = tmp_path / "output.parquet"
+
+        result = run_cli(
+            [
+                "to-parquet",
+                "csv",
+                str(csv_file),
+                "-o",
+                str(output_file),
+                "--compression",
+                "gzip",
+                "--compression-level",
+                "6",
+                "--row-group-size",
+                "auto",
+                "--statistics",
+                "full",
+            ]
+        )
+
+        assert result.exit_code == 0
+        assert pl.read_parquet(output_file).shape == (2, 2)
+
+    def test_csv_to_parquet_invalid_compression_level(self, run_cli, tmp_path: Path) -> None:
+        """CLI rejects a compression level for a codec without levels."""
+        csv_file = tmp_path / "input.csv"
+        csv_file.write_text("name,value\nalice,10")
+
+        result = run_cli(["to-parquet", "csv", str(csv_file), "--compression", "snappy", "--compression-level", "3"])
+
+        assert result.exit_code == 1
+        assert "not supported for snappy" in result.stderr
+
+    def test_gzip_csv_to_parquet(self, run_cli, tmp_path: Path) -> None:
+        """CLI converts a gzip-compressed CSV file."""
+        csv_file = tmp_path / "input.csv.gz"
+        csv_file.write_bytes(gzip.compress(b"name,value\nalice,10\nbob,20\n"))
+        output_file = tmp_path / "output.parquet"
+
+        result = run_cli(["to-parquet", "csv", str(csv_file), "-o", str(output_file)])
+
+        assert result.exit_code == 0
+        assert pl.read_parquet(output_file).shape == (2, 2)
+
+    def test_csv_to_parquet_sort_by(self, run_cli, tmp_path: Path) -> None:
+        """CLI sorts the output by the --sort-by columns."""
+        csv_file = tmp_path / "input.csv"
+        csv_file.write_text("name,value\ncarol,30\nalice,10\nbob,20")
+        output_file = tmp_path / "output.parquet"
+
+        result = run_cli(["to-parquet", "csv", str(csv_file), "-o", str(output_file), "--sort-by", "name"])
+
+        assert result.exit_code == 0
+        assert pl.read_parquet(output_file)["name"].to_list() == ["alice", "bob", "carol"]
+
+    def test_csv_to_parquet_shrink_types(self, run_cli, tmp_path: Path) -> None:
+        """CLI narrows numeric columns with --shrink-types and logs the bytes saved."""
+        csv_file = tmp_path / "input.csv"
+        csv_file.write_text("name,count,flag\nalice,300,1\nbob,20,0")
+        output_file = tmp_path / "output.parquet"
+
+        result = run_cli(["to-parquet", "csv", str(csv_file), "-o", str(output_file), "--shrink-types"])
+
+        assert result.exit_code == 0
+        schema = pl.read_parquet_schema(output_file)
+        assert (schema["count"], schema["flag"]) == (pl.Int16, pl.Int8)
+        logs = re.sub(r"\x1b\[[0-9;]*m", "", result.stderr)
+        assert re.search(
+            r"types_shrunk .*numeric_memory_after=6 numeric_memory_before=32 numeric_memory_saved=26", logs
+        )
+
+    def test_csv_to_parquet_sort_by_unknown_column(self, run_cli, tmp_path: Path) -> None:
+        """CLI reports an unknown --sort-by column."""
+        csv_file = tmp_path / "input.csv"
+        csv_file.write_text("name,value\nalice,10")
+
+        result = run_cli(["to-parquet", "csv", str(csv_file), "-o", str(tmp_path / "out.parquet"), "--sort-by", "x"])
+
+        assert result.exit_code == 1
+        assert "Unknown sort column(s): x" in result.stderr
+
     def test_csv_to_parquet_missing_file(self, run_cli, tmp_path: Path) -> None:
         """CLI returns error for missing input file."""
         nonexistent = tmp_path / "nonexistent.csv"
@@ -53,6 +152,63 @@ class TestToParquetCSV:
         assert "not found" in result.stderr.lower() or "error" in result.stderr.lower()
 
 
+class TestBatchConversion:
+    """E2E tests for converting many files with --output-dir."""
+
+    def test_directory_to_output_dir_with_jobs(self, run_cli, tmp_path: Path) -> None:
+        """CLI converts every CSV in a directory with a worker pool."""
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for i in range(3):
+            (input_dir / f"part{i}.csv").write_text(f"id\n{i}")
+        output_dir = tmp_path / "output"
+
+        result = run_cli(["to-parquet", "csv", str(input_dir), "-d", str(output_dir), "-j", "2"])
+
+        assert result.exit_code == 0
+        assert sorted(p.name for p in output_dir.iterdir()) == ["part0.parquet", "part1.parquet", "part2.parquet"]
+
+    def test_shrink_types_logged_per_file(self, run_cli, tmp_path: Path) -> None:
+        """CLI logs the numeric types narrowed by --shrink-types for every file in a batch."""
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for i in range(2):
+            (input_dir / f"part{i}.csv").write_text(f"id\n{i}")
+
+        result = run_cli(["to-parquet", "csv", str(input_dir), "-d", str(tmp_path / "output"), "--shrink-types"])
+
+        assert result.exit_code == 0
+        logs = re.sub(r"\x1b\[[0-9;]*m", "", result.stderr)
+        for i in range(2):
+            assert re.search(rf"types_shrunk .*input_file=\S*part{i}\.csv .*numeric_memory_saved=7", logs)
+
+    def test_where_pruning_logged_per_file(self, run_cli, tmp_path: Path) -> None:
+        """CLI logs the row groups a --where filter pruned for every file in a batch."""
+        for name in ("a", "b"):
+            pl.DataFrame({"id": range(100)}).write_parquet(tmp_path / f"{name}.parquet", row_group_size=10)
+
+        result = run_cli(
+            ["from-parquet", "csv", str(tmp_path / "*.parquet"), "-d", str(tmp_path / "output"), "--where", "id < 15"]
+        )
+
+        assert result.exit_code == 0
+        logs = re.sub(r"\x1b\[[0-9;]*m", "", result.stderr)
+        for name in ("a", "b"):
+            assert re.search(rf"row_groups_pruned .*input_file=\S*{name}\.parquet .*pruned=8 total=10", logs)
+
+    def test_multiple_inputs_require_output_dir(self, run_cli, tmp_path: Path) -> None:
+        """CLI rejects several inputs without --output-dir."""
+        first = tmp_path / "a.parquet"
+        second = tmp_path / "b.parquet"
+        pl.DataFrame({"id": [1]}).write_parquet(first)
+        pl.DataFrame({"id": [2]}).write_parquet(second)
+
+        result = run_cli(["from-parquet", "csv", str(first), str(second)])
+
+        assert result.exit_code == 1
+        assert "--output-dir" in result.stderr
+
+
 class TestToParquetNDJSON:
     """E2E tests for to-parquet ndjson command."""
 
@@ -80,6 +236,29 @@ class TestToParquetNDJSON:
         assert result.exit_code == 0
         assert output_file.exists()
 
+    def test_ndjson_to_parquet_from_stdin(self, run_cli, tmp_path: Path) -> None:
+        """CLI reads NDJSON from stdin when input is a dash."""
+        output_file = tmp_path / "output.parquet"
+
+        result = run_cli(
+            ["to-parquet", "ndjson", "-", "-o", str(output_file)],
+            input_text='{"name": "alice", "value": 10}\n{"name": "bob", "value": 20}\n',
+        )
+
+        assert result.exit_code == 0
+        assert pl.read_parquet(output_file).shape == (2, 2)
+
+    def test_ndjson_to_parquet_partition_by(self, run_cli, tmp_path: Path) -> None:
+        """CLI writes a hive-partitioned dataset with --partition-by."""
+        ndjson_file = tmp_path / "input.ndjson"
+        ndjson_file.write_text('{"day": "mon", "value": 1}\n{"day": "tue", "value": 2}\n')
+        output_dir = tmp_path / "dataset"
+
+        result = run_cli(["to-parquet", "ndjson", str(ndjson_file), "-o", str(output_dir), "--partition-by", "day"])
+
+        assert result.exit_code == 0
+        assert sorted(p.name for p in output_dir.iterdir()) == ["day=mon", "day=tue"]
+
     def test_ndjson_to_parquet_missing_file(self, run_cli, tmp_path: Path) -> None:
         """CLI returns error for missing input file."""
         nonexistent = tmp_path / "nonexistent.ndjson"
@@ -108,6 +287,33 @@ class TestFromParquetCSV:
         assert "name,value" in content
         assert "alice" in content
 
+    def test_parquet_to_csv_compressed_by_extension(self, run_cli, tmp_path: Path) -> None:
+        """CLI gzip-compresses CSV output when -o ends in .gz."""
+        parquet_file = tmp_path / "input.parquet"
+        pl.DataFrame({"name": ["alice", "bob"], "value": [10, 20]}).write_parquet(parquet_file)
+        output_file = tmp_path / "output.csv.gz"
+
+        result = run_cli(["from-parquet", "csv", str(parquet_file), "-o", str(output_file)])
+
+        assert result.exit_code == 0
+        assert gzip.decompress(output_file.read_bytes()) == b"name,value\nalice,10\nbob,20\n"
+
+    def test_parquet_to_csv_zstd_from_extension(self, run_cli, tmp_path: Path) -> None:
+        """CLI writes zstd-compressed CSV when -o ends in .zst, readable back by to-parquet."""
+        parquet_file = tmp_path / "input.parquet"
+        df = pl.DataFrame({"name": ["alice", "bob"], "value": [10, 20]})
+        df.write_parquet(parquet_file)
+        output_file = tmp_path / "output.csv.zst"
+        roundtrip_file = tmp_path / "roundtrip.parquet"
+
+        result = run_cli(["from-parquet", "csv", str(parquet_file), "-o", str(output_file)])
+        assert result.exit_code == 0
+        assert output_file.read_bytes().startswith(b"\x28\xb5\x2f\xfd")
+
+        result = run_cli(["to-parquet", "csv", str(output_file), "-o", str(roundtrip_file)])
+        assert result.exit_code == 0
+        assert pl.read_parquet(roundtrip_file).equals(df)
+
     def test_parquet_to_csv_stdout(self, run_cli, tmp_path: Path) -> None:
         """CLI outputs CSV to stdout when no -o flag."""
         parquet_file = tmp_path / "input.parquet"
@@ -120,6 +326,78 @@ class TestFromParquetCSV:
         assert "name,value" in result.stdout
         assert "test" in result.stdout
 
+    def test_parquet_to_csv_stdout_closed_early(self, tmp_path: Path) -> None:
+        """CLI exits cleanly when the downstream reader closes the pipe."""
+        parquet_file = tmp_path / "input.parquet"
+        pl.DataFrame({"value": list(range(200_000))}).write_parquet(parquet_file)
+
+        import subprocess
+
+        result = subprocess.run(
+            f"set -o pipefail; uv run parquet-lf from-parquet csv {parquet_file} | head -n 2",
+            shell=True,
+            executable="/bin/bash",
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        assert result.stdout == "value\n0\n"
+        assert "Error" not in result.stderr
+
+    def test_parquet_to_csv_selected_columns(self, run_cli, tmp_path: Path) -> None:
+        """CLI writes only the columns named with --columns."""
+        parquet_file = tmp_path / "input.parquet"
+        pl.DataFrame({"name": ["alice"], "value": [10], "city": ["paris"]}).write_parquet(parquet_file)
+
+        result = run_cli(["from-parquet", "csv", str(parquet_file), "--columns", "city,name"])
+
+        assert result.exit_code == 0
+        assert result.stdout == "city,name\nparis,alice\n"
+
+    def test_parquet_to_csv_columns_with_exclude_fails(self, run_cli, tmp_path: Path) -> None:
+        """CLI rejects --columns combined with --exclude."""
+        parquet_file = tmp_path / "input.parquet"
+        pl.DataFrame({"name": ["alice"], "value": [10]}).write_parquet(parquet_file)
+
+        result = run_cli(["from-parquet", "csv", str(parquet_file), "--columns", "name", "--exclude", "value"])
+
+        assert result.exit_code == 1
+        assert "cannot be combined" in result.stderr
+
+    def test_parquet_to_csv_where_logs_pruned_row_groups(self, run_cli, tmp_path: Path) -> None:
+        """CLI filters rows with --where and logs the pruned row groups."""
+        parquet_file = tmp_path / "input.parquet"
+        pl.DataFrame({"id": range(100)}).write_parquet(parquet_file, row_group_size=10)
+
+        result = run_cli(["from-parquet", "csv", str(parquet_file), "--where", "id == 42"])
+
+        assert result.exit_code == 0
+        assert result.stdout == "id\n42\n"
+        logs = re.sub(r"\x1b\[[0-9;]*m", "", result.stderr)
+        assert re.search(r"row_groups_pruned .*pruned=9 total=10", logs)
+
+    def test_parquet_to_csv_invalid_where_fails(self, run_cli, tmp_path: Path) -> None:
+        """CLI rejects a malformed --where expression before converting."""
+        parquet_file = tmp_path / "input.parquet"
+        pl.DataFrame({"id": [1]}).write_parquet(parquet_file)
+
+        result = run_cli(["from-parquet", "csv", str(parquet_file), "--where", "id = 1"])
+
+        assert result.exit_code == 1
+        assert "--where" in result.stderr
+        assert result.stdout == ""
+
+    def test_parquet_to_csv_offset_and_limit(self, run_cli, tmp_path: Path) -> None:
+        """CLI writes only the rows selected by --offset and --limit."""
+        parquet_file = tmp_path / "input.parquet"
+        pl.DataFrame({"id": range(100)}).write_parquet(parquet_file, row_group_size=10)
+
+        result = run_cli(["from-parquet", "csv", str(parquet_file), "--offset", "48", "--limit", "3"])
+
+        assert result.exit_code == 0
+        assert result.stdout == "id\n48\n49\n50\n"
+
     def test_parquet_to_csv_missing_file(self, run_cli, tmp_path: Path) -> None:
         """CLI returns error for missing input file."""
         nonexistent = tmp_path / "nonexistent.parquet"
@@ -172,6 +450,23 @@ class TestFromParquetNDJSON:
         assert result.exit_code == 0
         assert output_file.exists()
 
+    def test_parquet_to_ndjson_from_stdin(self, tmp_path: Path) -> None:
+        """CLI reads Parquet from stdin when input is a dash."""
+        parquet_file = tmp_path / "input.parquet"
+        pl.DataFrame({"name": ["alice"], "value": [10]}).write_parquet(parquet_file)
+
+        import subprocess
+
+        result = subprocess.run(
+            f"uv run parquet-lf from-parquet ndjson - < {parquet_file}",
+            shell=True,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        assert '{"name":"alice","value":10}' in result.stdout
+
     def test_parquet_to_ndjson_missing_file(self, run_cli, tmp_path: Path) -> None:
         """CLI returns error for missing input file."""
         nonexistent = tmp_path / "nonexistent.parquet"
@@ -233,6 +528,9 @@ class TestInfoCommand:
         assert "Schema:" in result.stdout
         assert "name: String" in result.stdout
         assert "value: Int64" in result.stdout
+        assert "Row groups: 1" in result.stdout
+        assert "Compression: ZSTD" in result.stdout
+        assert "Encodings:" in result.stdout
 
     def test_info_csv_shows_metadata(self, run_cli, tmp_path: Path) -> None:
         """Test info command shows metadata for CSV file."""
@@ -282,6 +580,68 @@ class TestInfoCommand:
         assert result.exit_code == 0
         assert "Preview (first 1 rows):" in result.stdout
 
+    def test_info_head_with_excluded_columns(self, run_cli, tmp_path: Path) -> None:
+        """Test info --head leaves --exclude columns out of the preview only."""
+        parquet_file = tmp_path / "test.parquet"
+        pl.DataFrame({"name": ["alice"], "secret": ["s3cr3t"]}).write_parquet(parquet_file)
+
+        result = run_cli(["info", "--head", "1", "--exclude", "secret", str(parquet_file)])
+
+        assert result.exit_code == 0
+        assert "Columns: 2" in result.stdout
+        assert "alice" in result.stdout
+        assert "s3cr3t" not in result.stdout
+
+    def test_info_preview_after_offset(self, run_cli, tmp_path: Path) -> None:
+        """Test info --offset starts the preview after the skipped rows."""
+        parquet_file = tmp_path / "test.parquet"
+        pl.DataFrame({"name": ["alice", "bob", "charlie"]}).write_parquet(parquet_file)
+
+        result = run_cli(["info", "--offset", "1", "--limit", "1", str(parquet_file)])
+
+        assert result.exit_code == 0
+        assert "Preview (1 rows from offset 1):" in result.stdout
+        assert "bob" in result.stdout
+        assert "alice" not in result.stdout
+
+    def test_info_offset_without_head_fails(self, run_cli, tmp_path: Path) -> None:
+        """Test info --offset without --head exits with an error."""
+        parquet_file = tmp_path / "test.parquet"
+        pl.DataFrame({"name": ["alice"]}).write_parquet(parquet_file)
+
+        result = run_cli(["info", "--offset", "1", str(parquet_file)])
+
+        assert result.exit_code == 1
+        assert "--offset requires --head" in result.stderr
+
+    def test_info_approx_estimates_rows(self, run_cli, tmp_path: Path) -> None:
+        """Test info --approx reports an estimated row count for large text files."""
+        ndjson_file = tmp_path / "big.ndjson"
+        ndjson_file.write_text('{"id": 1234567}\n' * 200_000)
+
+        result = run_cli(["info", "--approx", str(ndjson_file)])
+
+        assert result.exit_code == 0
+        assert "Rows: ~200000 (±0)" in result.stdout
+
+    def test_info_uses_metadata_cache(self, run_cli, tmp_path: Path) -> None:
+        """Test repeated info calls answer from the cache and --no-cache bypasses it."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("name,value\nalice,1\nbob,2")
+
+        first = run_cli(["info", str(csv_file)])
+        cached = run_cli(["info", str(csv_file)])
+        uncached = run_cli(["info", "--no-cache", str(csv_file)])
+
+        assert first.exit_code == cached.exit_code == uncached.exit_code == 0
+        assert first.stdout == cached.stdout == uncached.stdout
+        assert (Path(os.environ["PARQUET_LF_CACHE_DIR"]) / "metadata.sqlite").exists()
+
+        csv_file.write_text("name,value\nalice,1\nbob,2\ncarol,3")
+        changed = run_cli(["info", str(csv_file)])
+
+        assert "Rows: 3" in changed.stdout
+
     def test_info_nonexistent_file_exits_with_error(self, run_cli, tmp_path: Path) -> None:
         """Test info command exits with code 1 for missing file."""
         nonexistent = tmp_path / "nonexistent.parquet"
@@ -349,3 +709,228 @@ class TestInfoWithExamples:
         assert "Alice" in result.stdout
         assert "Bob" in result.stdout
         assert "Charlie" in result.stdout
+
+
+class TestHeadTailCommands:
+    """E2E tests for the head and tail commands."""
+
+    def test_head_csv(self, run_cli, tmp_path: Path) -> None:
+        """Test head shows the first rows of a CSV file."""
+        csv_file = tmp_path / "data.csv"
+        pl.DataFrame({"name": ["alice", "bob", "charlie"]}).write_csv(csv_file)
+
+        result = run_cli(["head", "-n", "2", str(csv_file)])
+
+        assert result.exit_code == 0
+        assert "alice" in result.stdout
+        assert "bob" in result.stdout
+        assert "charlie" not in result.stdout
+
+    def test_tail_parquet_shows_every_requested_row(self, run_cli, tmp_path: Path) -> None:
+        """Test tail shows the last rows of a Parquet file without eliding any."""
+        parquet_file = tmp_path / "data.parquet"
+        pl.DataFrame({"id": [f"id{i:03d}" for i in range(100)]}).write_parquet(parquet_file, row_group_size=10)
+
+        result = run_cli(["tail", "--rows", "25", str(parquet_file)])
+
+        assert result.exit_code == 0
+        assert "id074" not in result.stdout
+        assert all(f"id{i:03d}" in result.stdout for i in range(75, 100))
+
+    def test_compressed_input_rejected(self, run_cli, tmp_path: Path) -> None:
+        """Test info, head and tail explain that compressed files are not supported."""
+        csv_file = tmp_path / "data.csv.gz"
+        csv_file.write_bytes(gzip.compress(b"name,value\nalice,1\n"))
+
+        for command in ("info", "head", "tail"):
+            result = run_cli([command, str(csv_file)])
+
+            assert result.exit_code == 1
+            assert "Compressed files cannot be inspected in place" in result.stderr
+            assert "Unsupported file extension" not in result.stderr
+
+    def test_tail_missing_file(self, run_cli, tmp_path: Path) -> None:
+        """Test tail exits with an error for a missing file."""
+        result = run_cli(["tail", str(tmp_path / "missing.ndjson")])
+
+        assert result.exit_code == 1
+        assert "not found" in result.stderr
+
+
+class TestSampleCommand:
+    """E2E tests for the sample command."""
+
+    def test_sample_to_ndjson_file_is_reproducible(self, run_cli, tmp_path: Path) -> None:
+        """Test sample writes the output format of the file extension and honors --seed."""
+        parquet_file = tmp_path / "data.parquet"
+        pl.DataFrame({"id": range(1000)}).write_parquet(parquet_file, row_group_size=100)
+        first = tmp_path / "first.ndjson"
+        second = tmp_path / "second.ndjson"
+
+        for output in (first, second):
+            result = run_cli(["sample", str(parquet_file), "--fraction", "0.01", "--seed", "5", "-o", str(output)])
+            assert result.exit_code == 0
+
+        assert pl.read_ndjson(first).height == 10
+        assert first.read_text() == second.read_text()
+
+    def test_sample_stdout_defaults_to_csv(self, run_cli, tmp_path: Path) -> None:
+        """Test sample writes CSV to stdout by default."""
+        parquet_file = tmp_path / "data.parquet"
+        pl.DataFrame({"id": [1, 2, 3]}).write_parquet(parquet_file)
+
+        result = run_cli(["sample", str(parquet_file), "-n", "10"])
+
+        assert result.exit_code == 0
+        assert result.stdout == "id\n1\n2\n3\n"
+
+    def test_sample_compressed_output(self, run_cli, tmp_path: Path) -> None:
+        """Test sample compresses text output with a compression extension and rejects it for Parquet."""
+        parquet_file = tmp_path / "data.parquet"
+        pl.DataFrame({"id": [1, 2, 3]}).write_parquet(parquet_file)
+        output = tmp_path / "sample.csv.gz"
+
+        result = run_cli(["sample", str(parquet_file), "-n", "10", "-o", str(output)])
+        rejected = run_cli(["sample", str(parquet_file), "-n", "10", "-o", str(tmp_path / "sample.parquet.gz")])
+
+        assert result.exit_code == 0
+        assert gzip.decompress(output.read_bytes()) == b"id\n1\n2\n3\n"
+        assert rejected.exit_code == 1
+        assert "Parquet output" in rejected.stderr
+
+    def test_sample_requires_size(self, run_cli, tmp_path: Path) -> None:
+        """Test sample exits with an error without --rows or --fraction."""
+        parquet_file = tmp_path / "data.parquet"
+        pl.DataFrame({"id": [1]}).write_parquet(parquet_file)
+
+        result = run_cli(["sample", str(parquet_file)])
+
+        assert result.exit_code == 1
+        assert "--rows" in result.stderr
+
+
+class TestSchemaFiles:
+    """Tests for schema infer and to-parquet --schema."""
+
+    def test_infer_then_convert(self, run_cli, tmp_path: Path) -> None:
+        """Test an inferred schema file drives a later conversion."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("id,name\n1,alice\n2,bob\n")
+        schema_file = tmp_path / "schema.json"
+        output_file = tmp_path / "data.parquet"
+
+        infer = run_cli(["schema", "infer", str(csv_file), "-o", str(schema_file)])
+        convert = run_cli(["to-parquet", "csv", str(csv_file), "-o", str(output_file), "--schema", str(schema_file)])
+
+        assert infer.exit_code == 0
+        assert convert.exit_code == 0
+        assert pl.read_parquet_schema(output_file) == {"id": pl.Int64, "name": pl.String}
+
+    def test_infer_prints_to_stdout(self, run_cli, tmp_path: Path) -> None:
+        """Test schema infer prints JSON without -o."""
+        ndjson_file = tmp_path / "data.ndjson"
+        ndjson_file.write_text('{"id": 1, "tags": ["a"]}\n')
+
+        result = run_cli(["schema", "infer", str(ndjson_file)])
+
+        assert result.exit_code == 0
+        assert '"tags": "List(String)"' in result.stdout
+
+    def test_mismatching_row_exits_with_error(self, run_cli, tmp_path: Path) -> None:
+        """Test a row that does not fit the schema fails the conversion."""
+        ndjson_file = tmp_path / "data.ndjson"
+        ndjson_file.write_text('{"id": 1}\n{"id": "x"}\n')
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text('{"id": "Int64"}')
+
+        result = run_cli(
+            [
+                "to-parquet",
+                "ndjson",
+                str(ndjson_file),
+                "-o",
+                str(tmp_path / "out.parquet"),
+                "--schema",
+                str(schema_file),
+            ]
+        )
+
+        assert result.exit_code == 1
+        assert "Failed to convert NDJSON to Parquet" in result.stderr
+
+    def test_invalid_schema_file_exits_with_error(self, run_cli, tmp_path: Path) -> None:
+        """Test an unknown type in the schema file exits before converting."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("id\n1\n")
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text('{"id": "Int65"}')
+
+        result = run_cli(["to-parquet", "csv", str(csv_file), "--schema", str(schema_file)])
+
+        assert result.exit_code == 1
+        assert "Unknown data type: Int65" in result.stderr
+
+    def test_sampled_inference(self, run_cli, tmp_path: Path) -> None:
+        """Test --infer-schema sampled picks up types past the leading rows."""
+        ndjson_file = tmp_path / "data.ndjson"
+        rows = 100_000
+        pl.DataFrame({"id": range(rows), "score": [None] * (rows // 2) + [0.5] * (rows // 2)}).write_ndjson(ndjson_file)
+        output_file = tmp_path / "data.parquet"
+
+        result = run_cli(
+            ["to-parquet", "ndjson", str(ndjson_file), "-o", str(output_file), "--infer-schema", "sampled"]
+        )
+
+        assert result.exit_code == 0
+        assert pl.read_parquet_schema(output_file)["score"] == pl.Float64
+
+    def test_auto_categorical(self, run_cli, tmp_path: Path) -> None:
+        """Test --auto-categorical stores repetitive string columns as Categorical."""
+        csv_file = tmp_path / "data.csv"
+        rows = 1000
+        pl.DataFrame({"id": range(rows), "status": ["open", "closed"] * (rows // 2)}).write_csv(csv_file)
+        output_file = tmp_path / "data.parquet"
+
+        result = run_cli(["to-parquet", "csv", str(csv_file), "-o", str(output_file), "--auto-categorical"])
+
+        assert result.exit_code == 0
+        assert pl.read_parquet_schema(output_file)["status"] == pl.Categorical
+
+    def test_categorical_ratio_threshold(self, run_cli, tmp_path: Path) -> None:
+        """Test --categorical-ratio sets the distinct-value threshold."""
+        ndjson_file = tmp_path / "data.ndjson"
+        pl.DataFrame({"code": [f"c{i % 20}" for i in range(100)]}).write_ndjson(ndjson_file)
+        strict_file = tmp_path / "strict.parquet"
+        loose_file = tmp_path / "loose.parquet"
+
+        strict = run_cli(["to-parquet", "ndjson", str(ndjson_file), "-o", str(strict_file), "--auto-categorical"])
+        loose = run_cli(
+            [
+                "to-parquet",
+                "ndjson",
+                str(ndjson_file),
+                "-o",
+                str(loose_file),
+                "--auto-categorical",
+                "--categorical-ratio",
+                "0.2",
+            ]
+        )
+
+        assert strict.exit_code == 0 and loose.exit_code == 0
+        assert pl.read_parquet_schema(strict_file)["code"] == pl.String
+        assert pl.read_parquet_schema(loose_file)["code"] == pl.Categorical
+
+    def test_schema_with_infer_schema_exits_with_error(self, run_cli, tmp_path: Path) -> None:
+        """Test --schema and --infer-schema sampled are mutually exclusive."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("id\n1\n")
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text('{"id": "Int64"}')
+
+        result = run_cli(
+            ["to-parquet", "csv", str(csv_file), "--schema", str(schema_file), "--infer-schema", "sampled"]
+        )
+
+        assert result.exit_code == 1
+        assert "--schema cannot be combined with --infer-schema" in result.stderr
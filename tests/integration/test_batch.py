@@ -0,0 +1,226 @@
+"""Integration tests for batch conversion.
+
+These tests cover functions that interact with the filesystem.
+"""
+
+import gzip
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from parquet_lf.batch import expand_inputs, run_batch
+from parquet_lf.command.batch_convert import BatchConvertInput, execute_batch_convert
+from parquet_lf.converters.base import ParquetReadOptions, ParquetWriteOptions
+from parquet_lf.converters.compression import OutputCompression
+from parquet_lf.converters.csv import csv_to_parquet
+from parquet_lf.predicate import RowGroupPruning
+
+
+@pytest.fixture
+def csv_dir(tmp_path: Path) -> Path:
+    """Create a directory with three small CSV files and one unrelated file."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    for i in range(3):
+        (input_dir / f"part{i}.csv").write_text(f"id,value\n{i},{i * 10}")
+    (input_dir / "notes.txt").write_text("not data")
+    return input_dir
+
+
+class TestExpandInputs:
+    """Tests for the expand_inputs function."""
+
+    def test_directory_filters_by_extension(self, csv_dir: Path) -> None:
+        """Test a directory expands to its files with matching extensions."""
+        files = expand_inputs([csv_dir], (".csv",))
+
+        assert [f.name for f in files] == ["part0.csv", "part1.csv", "part2.csv"]
+
+    def test_glob_pattern(self, csv_dir: Path) -> None:
+        """Test glob patterns are expanded."""
+        files = expand_inputs([csv_dir / "part[01].csv"], (".csv",))
+
+        assert [f.name for f in files] == ["part0.csv", "part1.csv"]
+
+    def test_duplicates_removed(self, csv_dir: Path) -> None:
+        """Test a file given twice is only converted once."""
+        files = expand_inputs([csv_dir / "part0.csv", csv_dir], (".csv",))
+
+        assert len(files) == 3
+
+    def test_missing_file_raises_error(self, tmp_path: Path) -> None:
+        """Test a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="Input file not found"):
+            expand_inputs([tmp_path / "missing.csv"], (".csv",))
+
+    def test_unmatched_glob_raises_error(self, tmp_path: Path) -> None:
+        """Test a glob that matches nothing raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="No files match pattern"):
+            expand_inputs([tmp_path / "*.csv"], (".csv",))
+
+
+class TestRunBatch:
+    """Tests for the run_batch function."""
+
+    def test_sequential(self, csv_dir: Path, tmp_path: Path) -> None:
+        """Test files are converted in-process with one job."""
+        output_dir = tmp_path / "out"
+        inputs = expand_inputs([csv_dir], (".csv",))
+
+        results = run_batch(csv_to_parquet, inputs, output_dir, ".parquet", jobs=1)
+
+        assert all(result.error is None for result in results)
+        assert pl.read_parquet(output_dir / "part2.parquet")["value"].to_list() == [20]
+
+    def test_parallel(self, csv_dir: Path, tmp_path: Path) -> None:
+        """Test files are converted on a worker pool with several jobs."""
+        output_dir = tmp_path / "out"
+        inputs = expand_inputs([csv_dir], (".csv",))
+
+        results = run_batch(csv_to_parquet, inputs, output_dir, ".parquet", jobs=2)
+
+        assert [result.output_path.name for result in results] == ["part0.parquet", "part1.parquet", "part2.parquet"]
+        assert all(result.output_path.exists() for result in results)
+
+    def test_failure_does_not_stop_batch(self, csv_dir: Path, tmp_path: Path) -> None:
+        """Test a failing file is reported while the others still convert."""
+        (csv_dir / "empty.csv").write_text("")
+        inputs = expand_inputs([csv_dir], (".csv",))
+
+        results = run_batch(csv_to_parquet, inputs, tmp_path / "out", ".parquet", jobs=1)
+
+        failed = [result.input_path.name for result in results if result.error is not None]
+        assert failed == ["empty.csv"]
+        assert len(results) == 4
+
+    def test_conflicting_outputs_raise_error(self, tmp_path: Path) -> None:
+        """Test inputs with the same stem are rejected."""
+        inputs = [tmp_path / "a" / "data.csv", tmp_path / "b" / "data.csv"]
+
+        with pytest.raises(ValueError, match="same output file"):
+            run_batch(csv_to_parquet, inputs, tmp_path / "out", ".parquet", jobs=1)
+
+
+class TestExecuteBatchConvert:
+    """Tests for the execute_batch_convert function."""
+
+    def test_from_parquet_csv(self, sample_parquet_file: Path, tmp_path: Path) -> None:
+        """Test Parquet files are converted to CSV in the output directory."""
+        input_dto = BatchConvertInput(
+            input_files=[sample_parquet_file],
+            output_dir=tmp_path / "out",
+            jobs=1,
+            direction="from_parquet",
+            format="csv",
+        )
+
+        output_dto = execute_batch_convert(input_dto)
+
+        assert output_dto.failures == []
+        assert (tmp_path / "out" / "sample.csv").exists()
+
+    def test_compressed_inputs(self, sample_csv_content: str, tmp_path: Path) -> None:
+        """Test compressed files in a directory are converted and named after the inner file."""
+        input_dir = tmp_path / "in"
+        input_dir.mkdir()
+        (input_dir / "a.csv.gz").write_bytes(gzip.compress(sample_csv_content.encode()))
+        input_dto = BatchConvertInput(
+            input_files=[input_dir],
+            output_dir=tmp_path / "out",
+            jobs=1,
+            direction="to_parquet",
+            format="csv",
+        )
+
+        output_dto = execute_batch_convert(input_dto)
+
+        assert output_dto.failures == []
+        assert pl.read_parquet(tmp_path / "out" / "a.parquet").equals(pl.read_csv(sample_csv_content.encode()))
+
+    def test_auto_categorical(self, tmp_path: Path) -> None:
+        """Test the categorical ratio is passed to every conversion."""
+        input_dir = tmp_path / "in"
+        input_dir.mkdir()
+        for name in ("a", "b"):
+            pl.DataFrame({"kind": ["x", "y"] * 50}).write_csv(input_dir / f"{name}.csv")
+        input_dto = BatchConvertInput(
+            input_files=[input_dir],
+            output_dir=tmp_path / "out",
+            jobs=2,
+            direction="to_parquet",
+            format="csv",
+            options={"categorical_ratio": 0.05},
+        )
+
+        output_dto = execute_batch_convert(input_dto)
+
+        assert output_dto.failures == []
+        for name in ("a", "b"):
+            assert pl.read_parquet_schema(tmp_path / "out" / f"{name}.parquet")["kind"] == pl.Categorical
+
+    def test_compressed_outputs(self, sample_parquet_file: Path, tmp_path: Path) -> None:
+        """Test compressed outputs get the compression extension."""
+        input_dto = BatchConvertInput(
+            input_files=[sample_parquet_file],
+            output_dir=tmp_path / "out",
+            jobs=1,
+            direction="from_parquet",
+            format="csv",
+            options={"compression": OutputCompression.GZIP},
+        )
+
+        output_dto = execute_batch_convert(input_dto)
+
+        assert output_dto.failures == []
+        assert pl.read_csv(tmp_path / "out" / "sample.csv.gz").equals(pl.read_parquet(sample_parquet_file))
+
+    def test_shrinkage_returned(self, csv_dir: Path, tmp_path: Path) -> None:
+        """Test the numeric type shrinkage of each file comes back from the worker processes."""
+        input_dto = BatchConvertInput(
+            input_files=[csv_dir],
+            output_dir=tmp_path / "out",
+            jobs=2,
+            direction="to_parquet",
+            format="csv",
+            options={"write_options": ParquetWriteOptions(shrink_types=True)},
+        )
+
+        output_dto = execute_batch_convert(input_dto)
+
+        assert output_dto.failures == []
+        for result in output_dto.results:
+            assert result.shrinkage is not None
+            assert result.shrinkage.dtypes == {"id": pl.Int8(), "value": pl.Int8()}
+
+    def test_where_pruning_counted(self, tmp_path: Path) -> None:
+        """Test each filtered Parquet input reports the row groups ruled out by statistics."""
+        parquet_file = tmp_path / "data.parquet"
+        pl.DataFrame({"id": range(100)}).write_parquet(parquet_file, row_group_size=10)
+        input_dto = BatchConvertInput(
+            input_files=[parquet_file],
+            output_dir=tmp_path / "out",
+            jobs=1,
+            direction="from_parquet",
+            format="csv",
+            options={"read_options": ParquetReadOptions(where="id >= 90")},
+        )
+
+        output_dto = execute_batch_convert(input_dto)
+
+        assert output_dto.failures == []
+        assert output_dto.results[0].pruning == RowGroupPruning(total=10, pruned=9)
+        assert output_dto.results[0].shrinkage is None
+
+    def test_stdin_rejected(self, tmp_path: Path) -> None:
+        """Test stdin cannot be combined with an output directory."""
+        input_dto = BatchConvertInput(
+            input_files=[Path("-")],
+            output_dir=tmp_path / "out",
+            jobs=1,
+            direction="to_parquet",
+            format="csv",
+        )
+
+        with pytest.raises(ValueError, match="stdin"):
+            execute_batch_convert(input_dto)
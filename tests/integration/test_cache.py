@@ -0,0 +1,141 @@
+"""Integration tests for the cache module.
+
+These tests cover functions that interact with the filesystem.
+"""
+
+import os
+import pickle
+import sqlite3
+from pathlib import Path
+
+import parquet_lf.command.info as info_command
+from parquet_lf.cache import MetadataCache, dump_file_info, file_state
+from parquet_lf.command.info import InfoInput, execute_info
+from parquet_lf.info import FileInfo, get_file_info
+
+
+class TestMetadataCache:
+    """Tests for the MetadataCache class with real files."""
+
+    def test_miss_then_hit(self, sample_parquet_file: Path, tmp_path: Path) -> None:
+        """Test stored metadata is returned for an unchanged file."""
+        cache = MetadataCache(tmp_path / "cache")
+        info = get_file_info(sample_parquet_file)
+
+        assert cache.get(sample_parquet_file) is None
+        cache.put(info, file_state(sample_parquet_file))
+
+        assert cache.get(sample_parquet_file) == info
+
+    def test_changed_file_misses(self, sample_csv_file: Path, tmp_path: Path) -> None:
+        """Test a file that grew is recomputed."""
+        cache = MetadataCache(tmp_path / "cache")
+        cache.put(get_file_info(sample_csv_file), file_state(sample_csv_file))
+
+        with sample_csv_file.open("a") as f:
+            f.write("\nextra,1")
+
+        assert cache.get(sample_csv_file) is None
+
+    def test_change_during_compute_not_cached(self, sample_csv_file: Path, tmp_path: Path) -> None:
+        """Test metadata of a file that grew while it was read is not served for the grown file."""
+        cache = MetadataCache(tmp_path / "cache")
+        state = file_state(sample_csv_file)
+        info = get_file_info(sample_csv_file)
+        with sample_csv_file.open("a") as f:
+            f.write("\nextra,1")
+        cache.put(info, state)
+
+        assert cache.get(sample_csv_file) is None
+
+    def test_unreadable_file_not_cached(self, tmp_path: Path) -> None:
+        """Test no state is captured for a missing file."""
+        assert file_state(tmp_path / "missing.csv") is None
+
+    def test_same_size_and_mtime_rewrite_misses(self, sample_csv_file: Path, tmp_path: Path) -> None:
+        """Test the content fingerprint catches rewrites that keep size and mtime."""
+        cache = MetadataCache(tmp_path / "cache")
+        cache.put(get_file_info(sample_csv_file), file_state(sample_csv_file))
+        stat = sample_csv_file.stat()
+
+        sample_csv_file.write_text(sample_csv_file.read_text().replace("test", "TEST"))
+        os.utime(sample_csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert cache.get(sample_csv_file) is None
+
+    def test_approx_cached_separately(self, sample_csv_file: Path, tmp_path: Path) -> None:
+        """Test exact and approximate results do not share an entry."""
+        cache = MetadataCache(tmp_path / "cache")
+        cache.put(get_file_info(sample_csv_file), file_state(sample_csv_file))
+
+        assert cache.get(sample_csv_file, approx=True) is None
+
+    def test_least_recently_used_evicted(self, tmp_path: Path) -> None:
+        """Test the oldest entries are evicted once the size budget is exceeded."""
+        files = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.csv"
+            path.write_text("x,y\n1,2\n")
+            files.append(path)
+        infos = [get_file_info(path) for path in files]
+
+        # Room for two entries but not three
+        entry_size = max(len(dump_file_info(info)) for info in infos)
+        cache = MetadataCache(tmp_path / "cache", max_bytes=2 * entry_size)
+        cache.put(infos[0], file_state(files[0]))
+        cache.put(infos[1], file_state(files[1]))
+        assert cache.get(files[0]) is not None  # a is now more recent than b
+        cache.put(infos[2], file_state(files[2]))
+
+        assert cache.get(files[0]) is not None
+        assert cache.get(files[1]) is None
+        assert cache.get(files[2]) is not None
+
+    def test_unusable_cache_dir_is_ignored(self, sample_csv_file: Path, tmp_path: Path) -> None:
+        """Test an unusable cache location degrades to always missing."""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        cache = MetadataCache(blocker)
+
+        cache.put(get_file_info(sample_csv_file), file_state(sample_csv_file))
+
+        assert cache.get(sample_csv_file) is None
+
+    def test_pickled_entry_not_loaded(self, sample_csv_file: Path, tmp_path: Path) -> None:
+        """Test a pickle planted in the cache database is never unpickled."""
+        marker = tmp_path / "unpickled"
+
+        class Payload:
+            def __reduce__(self) -> tuple[object, tuple[Path]]:
+                return Path.touch, (marker,)
+
+        cache = MetadataCache(tmp_path / "cache")
+        cache.put(get_file_info(sample_csv_file), file_state(sample_csv_file))
+        with sqlite3.connect(cache.path) as conn:
+            conn.execute("UPDATE file_info SET value = ?", (pickle.dumps(Payload()),))
+
+        assert cache.get(sample_csv_file) is None
+        assert not marker.exists()
+
+
+class TestInfoCommandCache:
+    """Tests for execute_info storing metadata in the cache."""
+
+    def test_file_growing_during_read_not_cached(self, sample_csv_file: Path, tmp_path: Path, monkeypatch) -> None:
+        """Test metadata of a file appended to while info reads it is not reused for the grown file."""
+        monkeypatch.setenv("PARQUET_LF_CACHE_DIR", str(tmp_path / "cache"))
+        rows = get_file_info(sample_csv_file).row_count
+
+        def get_file_info_then_append(path: Path, approx: bool = False) -> FileInfo:
+            info = get_file_info(path, approx)
+            with path.open("a") as f:
+                f.write("\nextra,1")
+            return info
+
+        with monkeypatch.context() as patch:
+            patch.setattr(info_command, "get_file_info", get_file_info_then_append)
+            first = execute_info(InfoInput(sample_csv_file, head=None, use_cache=True))
+        second = execute_info(InfoInput(sample_csv_file, head=None, use_cache=True))
+
+        assert first.file_info.row_count == rows
+        assert second.file_info.row_count == rows + 1
@@ -3,12 +3,23 @@
 These tests cover functions that interact with the filesystem.
 """
 
+import gzip
 from pathlib import Path
 
 import polars as pl
 import pytest
 
-from parquet_lf.info import FileFormat, get_file_info, get_file_info_with_preview
+import parquet_lf.info
+from parquet_lf.info import (
+    APPROX_SAMPLE_COUNT,
+    APPROX_SAMPLE_SIZE,
+    FileFormat,
+    estimate_row_count,
+    get_file_info,
+    get_file_info_with_preview,
+    read_head,
+    read_tail,
+)
 
 
 class TestGetFileInfo:
@@ -25,6 +36,8 @@ class TestGetFileInfo:
         assert info.column_count == 2
         assert "name" in info.schema
         assert "value" in info.schema
+        assert info.parquet_footer is not None
+        assert len(info.parquet_footer.row_groups) == 1
 
     def test_csv_file_info(self, sample_csv_file: Path) -> None:
         """Test get_file_info with a CSV file."""
@@ -86,6 +99,119 @@ class TestGetFileInfo:
         assert info.format == FileFormat.NDJSON
 
 
+class TestCompressedInput:
+    """Tests for inspecting compressed files."""
+
+    @pytest.fixture
+    def gzip_csv_file(self, tmp_path: Path, sample_csv_content: str) -> Path:
+        """Create a gzip-compressed CSV file."""
+        path = tmp_path / "data.csv.gz"
+        path.write_bytes(gzip.compress(sample_csv_content.encode()))
+        return path
+
+    def test_file_info_rejected(self, gzip_csv_file: Path) -> None:
+        """Test file info of a compressed file raises a clear error."""
+        with pytest.raises(ValueError, match="Compressed files cannot be inspected in place"):
+            get_file_info(gzip_csv_file)
+
+    def test_head_rejected(self, gzip_csv_file: Path) -> None:
+        """Test reading the head of a compressed file raises a clear error."""
+        with pytest.raises(ValueError, match="Compressed files cannot be inspected in place"):
+            read_head(gzip_csv_file, FileFormat.CSV, 1)
+
+    def test_tail_rejected(self, gzip_csv_file: Path) -> None:
+        """Test reading the tail of a compressed file raises a clear error."""
+        with pytest.raises(ValueError, match="Compressed files cannot be inspected in place"):
+            read_tail(gzip_csv_file, FileFormat.CSV, 1)
+
+
+class TestRowCount:
+    """Tests for exact row counts of text files."""
+
+    def test_csv_quoted_newlines_are_not_rows(self, tmp_path: Path) -> None:
+        """Test newlines inside quoted CSV fields do not add rows."""
+        csv_file = tmp_path / "quoted.csv"
+        csv_file.write_text('name,value\n"multi\nline",1\n"say ""hi""\n",2\nplain,3\n')
+
+        assert get_file_info(csv_file).row_count == 3
+
+    def test_csv_without_trailing_newline(self, tmp_path: Path) -> None:
+        """Test the last CSV record counts without a trailing newline."""
+        csv_file = tmp_path / "no_newline.csv"
+        csv_file.write_text("name,value\r\nalice,1\r\nbob,2")
+
+        assert get_file_info(csv_file).row_count == 2
+
+    def test_csv_header_only(self, tmp_path: Path) -> None:
+        """Test a CSV with only a header has no rows."""
+        csv_file = tmp_path / "header.csv"
+        csv_file.write_text("name,value\n")
+
+        assert get_file_info(csv_file).row_count == 0
+
+    def test_ndjson_blank_lines_are_not_rows(self, tmp_path: Path) -> None:
+        """Test blank NDJSON lines are skipped."""
+        ndjson_file = tmp_path / "blank.ndjson"
+        ndjson_file.write_text('{"a": 1}\n\n{"a": 2}\n\n')
+
+        assert get_file_info(ndjson_file).row_count == 2
+
+    def test_ndjson_escaped_newlines(self, tmp_path: Path) -> None:
+        """Test escaped newlines in JSON strings do not add rows."""
+        ndjson_file = tmp_path / "escaped.ndjson"
+        ndjson_file.write_text('{"a": "x\\ny"}\n{"a": "z"}\n')
+
+        assert get_file_info(ndjson_file).row_count == 2
+
+
+class TestEstimateRowCount:
+    """Tests for sampled row count estimation."""
+
+    def test_small_file_is_not_estimated(self, sample_csv_file: Path) -> None:
+        """Test files covered by the samples return None to be counted exactly."""
+        assert estimate_row_count(sample_csv_file, FileFormat.CSV) is None
+
+    def test_fixed_width_csv_is_exact(self, tmp_path: Path) -> None:
+        """Test rows of equal length give an exact estimate with no error."""
+        csv_file = tmp_path / "fixed.csv"
+        rows = APPROX_SAMPLE_COUNT * APPROX_SAMPLE_SIZE // 10 + 1000
+        csv_file.write_text("id,v\n" + "".join(f"{i:06d},abc\n" for i in range(rows)))
+
+        estimate = estimate_row_count(csv_file, FileFormat.CSV)
+
+        assert estimate is not None
+        assert estimate.rows == rows
+        assert estimate.error == 0
+
+    def test_variable_width_ndjson_within_bound(self, tmp_path: Path) -> None:
+        """Test the true row count of varied rows lies within the error bound."""
+        ndjson_file = tmp_path / "varied.ndjson"
+        rows = 200_000
+        ndjson_file.write_text("".join(f'{{"id": {i}, "name": "{"x" * (i % 17)}"}}\n' for i in range(rows)))
+
+        estimate = estimate_row_count(ndjson_file, FileFormat.NDJSON)
+
+        assert estimate is not None
+        assert abs(estimate.rows - rows) <= estimate.error
+
+    def test_get_file_info_approx(self, tmp_path: Path) -> None:
+        """Test get_file_info reports the estimate and its error bound."""
+        ndjson_file = tmp_path / "data.ndjson"
+        ndjson_file.write_text('{"id": 1234567}\n' * 200_000)
+
+        info = get_file_info(ndjson_file, approx=True)
+
+        assert info.row_count == 200_000
+        assert info.row_count_error == 0
+
+    def test_get_file_info_approx_small_file_is_exact(self, sample_csv_file: Path) -> None:
+        """Test small files are counted exactly even with approx."""
+        info = get_file_info(sample_csv_file, approx=True)
+
+        assert info.row_count == 2
+        assert info.row_count_error is None
+
+
 class TestGetFileInfoWithPreview:
     """Tests for the get_file_info_with_preview function."""
 
@@ -125,6 +251,16 @@ class TestGetFileInfoWithPreview:
         with pytest.raises(FileNotFoundError, match="Input file not found"):
             get_file_info_with_preview(nonexistent, 5)
 
+    def test_preview_of_multi_row_group_file(self, tmp_path: Path) -> None:
+        """Test preview holds the first rows while the row count covers the whole file."""
+        parquet_file = tmp_path / "groups.parquet"
+        pl.DataFrame({"id": list(range(1000))}).write_parquet(parquet_file, row_group_size=100)
+
+        info, preview = get_file_info_with_preview(parquet_file, 3)
+
+        assert info.row_count == 1000
+        assert preview["id"].to_list() == [0, 1, 2]
+
     def test_info_matches_standalone_function(self, sample_parquet_file: Path) -> None:
         """Test info from combined function matches standalone get_file_info."""
         info_standalone = get_file_info(sample_parquet_file)
@@ -133,3 +269,100 @@ class TestGetFileInfoWithPreview:
         assert info_standalone.row_count == info_combined.row_count
         assert info_standalone.column_count == info_combined.column_count
         assert info_standalone.schema == info_combined.schema
+
+
+class TestReadHead:
+    """Tests for the read_head function."""
+
+    def test_offset_in_later_row_group(self, tmp_path: Path) -> None:
+        """Test an offset reads rows from the row group that holds them."""
+        parquet_file = tmp_path / "groups.parquet"
+        pl.DataFrame({"id": list(range(1000))}).write_parquet(parquet_file, row_group_size=100)
+
+        preview = read_head(parquet_file, FileFormat.PARQUET, 3, offset=598)
+
+        assert preview["id"].to_list() == [598, 599, 600]
+
+    def test_offset_with_columns_csv(self, sample_csv_file: Path) -> None:
+        """Test offset and column selection apply to text formats too."""
+        preview = read_head(sample_csv_file, FileFormat.CSV, 5, columns=["name"], offset=1)
+
+        assert preview.columns == ["name"]
+        assert len(preview) == 1
+
+    def test_offset_past_end_is_empty(self, sample_parquet_file: Path) -> None:
+        """Test an offset beyond the last row returns no rows."""
+        assert read_head(sample_parquet_file, FileFormat.PARQUET, 5, offset=10).is_empty()
+
+
+class TestReadTail:
+    """Tests for the read_tail function."""
+
+    def test_parquet_last_rows(self, tmp_path: Path) -> None:
+        """Test the last rows of a multi-row-group Parquet file are returned in order."""
+        parquet_file = tmp_path / "groups.parquet"
+        pl.DataFrame({"id": list(range(1000))}).write_parquet(parquet_file, row_group_size=100)
+
+        tail = read_tail(parquet_file, FileFormat.PARQUET, 150)
+
+        assert tail["id"].to_list() == list(range(850, 1000))
+
+    def test_csv_reads_backward_across_blocks(self, tmp_path: Path, monkeypatch) -> None:
+        """Test a CSV tail spanning several backward reads keeps the header and every row."""
+        monkeypatch.setattr(parquet_lf.info, "TAIL_READ_SIZE", 16)
+        csv_file = tmp_path / "data.csv"
+        pl.DataFrame({"id": list(range(100)), "name": [f"row{i}" for i in range(100)]}).write_csv(csv_file)
+
+        tail = read_tail(csv_file, FileFormat.CSV, 5)
+
+        assert tail.columns == ["id", "name"]
+        assert tail["id"].to_list() == [95, 96, 97, 98, 99]
+
+    def test_csv_quoted_newline_falls_back(self, tmp_path: Path) -> None:
+        """Test a quoted field spanning lines is not split into records."""
+        csv_file = tmp_path / "quoted.csv"
+        csv_file.write_text('id,note\n1,"first\nline"\n2,plain\n')
+
+        tail = read_tail(csv_file, FileFormat.CSV, 2)
+
+        assert tail["note"].to_list() == ["first\nline", "plain"]
+
+    def test_csv_quoted_commas_read_backward(self, tmp_path: Path, monkeypatch) -> None:
+        """Test quoted fields without newlines do not fall back to a forward scan."""
+        csv_file = tmp_path / "quoted.csv"
+        csv_file.write_text('id,note\n1,"a, b"\n2,"say ""hi"", then go"\n3,plain\n')
+
+        def no_scan(*args: object, **kwargs: object) -> pl.LazyFrame:
+            raise AssertionError("forward scan used")
+
+        monkeypatch.setattr(pl, "scan_csv", no_scan)
+        tail = read_tail(csv_file, FileFormat.CSV, 2)
+
+        assert tail["note"].to_list() == ['say "hi", then go', "plain"]
+
+    def test_csv_header_only(self, tmp_path: Path) -> None:
+        """Test a header-only CSV returns no rows."""
+        csv_file = tmp_path / "empty.csv"
+        csv_file.write_text("id,name\n")
+
+        tail = read_tail(csv_file, FileFormat.CSV, 5)
+
+        assert tail.columns == ["id", "name"]
+        assert tail.is_empty()
+
+    def test_ndjson_skips_blank_lines(self, tmp_path: Path) -> None:
+        """Test blank lines do not count as NDJSON records."""
+        ndjson_file = tmp_path / "data.ndjson"
+        ndjson_file.write_text('{"id": 1}\n{"id": 2}\n\n{"id": 3}\n\n')
+
+        tail = read_tail(ndjson_file, FileFormat.NDJSON, 2)
+
+        assert tail["id"].to_list() == [2, 3]
+
+    def test_fewer_rows_than_requested(self, sample_ndjson_file: Path) -> None:
+        """Test asking for more rows than exist returns the whole file."""
+        assert len(read_tail(sample_ndjson_file, FileFormat.NDJSON, 100)) == 2
+
+    def test_selected_columns(self, sample_parquet_file: Path) -> None:
+        """Test column selection applies to the tail."""
+        assert read_tail(sample_parquet_file, FileFormat.PARQUET, 1, columns=["value"]).columns == ["value"]
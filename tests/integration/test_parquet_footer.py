@@ -0,0 +1,64 @@
+"""Integration tests for the Parquet footer module.
+
+These tests cover functions that interact with the filesystem.
+"""
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from parquet_lf.parquet_footer import read_parquet_footer
+
+
+class TestReadParquetFooter:
+    """Tests for the read_parquet_footer function with real files."""
+
+    def test_row_groups_and_counts(self, tmp_path: Path) -> None:
+        """Test row group layout is read from the footer."""
+        parquet_file = tmp_path / "groups.parquet"
+        pl.DataFrame({"id": list(range(1000))}).write_parquet(parquet_file, row_group_size=300)
+
+        footer = read_parquet_footer(parquet_file)
+
+        assert footer.num_rows == 1000
+        assert [rg.num_rows for rg in footer.row_groups] == [300, 300, 300, 100]
+        assert all(rg.compressed_size > 0 for rg in footer.row_groups)
+
+    def test_schema_matches_polars(self, sample_parquet_file: Path) -> None:
+        """Test the schema matches the one polars reports for the full file."""
+        footer = read_parquet_footer(sample_parquet_file)
+
+        expected = {name: str(dtype) for name, dtype in pl.read_parquet_schema(sample_parquet_file).items()}
+        assert footer.schema == expected
+
+    def test_codecs_and_encodings(self, tmp_path: Path) -> None:
+        """Test compression codecs and encodings are reported."""
+        parquet_file = tmp_path / "snappy.parquet"
+        pl.DataFrame({"id": [1, 2, 3]}).write_parquet(parquet_file, compression="snappy")
+
+        footer = read_parquet_footer(parquet_file)
+
+        assert footer.codecs == ["SNAPPY"]
+        assert "id" in footer.column_encodings
+        assert footer.column_encodings["id"]
+
+    def test_statistics(self, tmp_path: Path) -> None:
+        """Test min/max statistics and null counts are decoded."""
+        parquet_file = tmp_path / "stats.parquet"
+        pl.DataFrame({"id": [5, None, 9]}).write_parquet(parquet_file)
+
+        stats = read_parquet_footer(parquet_file).row_groups[0].columns[0].statistics
+
+        assert stats is not None
+        assert stats.null_count == 1
+        assert stats.min_value == (5).to_bytes(8, "little")
+        assert stats.max_value == (9).to_bytes(8, "little")
+
+    def test_not_parquet_raises_error(self, tmp_path: Path) -> None:
+        """Test a non-Parquet file raises ValueError."""
+        not_parquet = tmp_path / "fake.parquet"
+        not_parquet.write_text("this is not parquet data")
+
+        with pytest.raises(ValueError, match="Not a Parquet file"):
+            read_parquet_footer(not_parquet)
@@ -0,0 +1,68 @@
+"""Integration tests for the predicate module.
+
+These tests cover functions that interact with the filesystem.
+"""
+
+import datetime
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from parquet_lf.predicate import count_pruned_row_groups
+
+
+@pytest.fixture
+def events_parquet_file(tmp_path: Path) -> Path:
+    """Create a Parquet file with ten row groups of 100 rows, one day each."""
+    parquet_file = tmp_path / "events.parquet"
+    pl.DataFrame(
+        {
+            "id": range(1000),
+            "small": pl.Series(range(1000), dtype=pl.UInt16),
+            "day": [datetime.date(2024, 1, 1) + datetime.timedelta(days=i // 100) for i in range(1000)],
+            "score": [i / 10 for i in range(1000)],
+            "name": [f"user{i:04d}" for i in range(1000)],
+        }
+    ).write_parquet(parquet_file, row_group_size=100)
+    return parquet_file
+
+
+class TestCountPrunedRowGroups:
+    """Tests for counting row groups pruned by statistics in real files."""
+
+    @pytest.mark.parametrize(
+        ("where", "pruned"),
+        [
+            ("id == 150", 9),
+            ("small >= 900", 9),
+            ("day == date('2024-01-05')", 9),
+            ("score < 10.5", 8),
+            ("name in ['user0001', 'user0999']", 8),
+            ("day >= date('2024-01-09') or id < 100", 7),
+        ],
+    )
+    def test_decodes_statistics_per_type(self, events_parquet_file: Path, where: str, pruned: int) -> None:
+        """Test statistics of each supported type are decoded and compared correctly."""
+        result = count_pruned_row_groups(events_parquet_file, where)
+
+        assert result.total == 10
+        assert result.pruned == pruned
+
+    def test_pruned_row_groups_have_no_matches(self, events_parquet_file: Path) -> None:
+        """Test every row that matches the filter lies in the one kept row group."""
+        where = "day == date('2024-01-05')"
+
+        result = count_pruned_row_groups(events_parquet_file, where)
+        matches = pl.read_parquet(events_parquet_file).filter(pl.col("day") == datetime.date(2024, 1, 5))
+
+        assert matches.height == 100
+        assert result.total - result.pruned == 1
+
+    def test_not_parquet_raises_error(self, tmp_path: Path) -> None:
+        """Test a non-Parquet file raises ValueError."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("id\n1\n")
+
+        with pytest.raises(ValueError, match="Not a Parquet file"):
+            count_pruned_row_groups(csv_file, "id == 1")
@@ -1,14 +1,28 @@
 """Integration tests for round-trip conversions."""
 
+import bz2
+import gzip
+import io
 from pathlib import Path
 
 import polars as pl
 import pytest
+import zstandard
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
+from parquet_lf.converters.base import (
+    DEFAULT_MAX_OPEN_FILES,
+    ParquetCompression,
+    ParquetReadOptions,
+    ParquetStatistics,
+    ParquetWriteOptions,
+)
+from parquet_lf.converters.compression import OUTPUT_EXTENSIONS, OutputCompression, text_input
 from parquet_lf.converters.csv import csv_to_parquet, parquet_to_csv
 from parquet_lf.converters.ndjson import ndjson_to_parquet, parquet_to_ndjson
+from parquet_lf.predicate import count_pruned_row_groups
+from parquet_lf.schema import SchemaInference
 
 
 class TestCSVRoundtrip:
@@ -47,6 +61,16 @@ class TestCSVRoundtrip:
 
         assert original_df.equals(roundtrip_df)
 
+    def test_csv_to_parquet_eager_matches_streaming(self, sample_csv_file: Path, tmp_path: Path) -> None:
+        """Eager and streaming CSV conversion produce the same data."""
+        streaming_path = tmp_path / "streaming.parquet"
+        eager_path = tmp_path / "eager.parquet"
+
+        csv_to_parquet(sample_csv_file, streaming_path)
+        csv_to_parquet(sample_csv_file, eager_path, eager=True)
+
+        assert pl.read_parquet(streaming_path).equals(pl.read_parquet(eager_path))
+
     def test_csv_file_not_found(self, tmp_path: Path) -> None:
         """FileNotFoundError raised for missing CSV file."""
         nonexistent = tmp_path / "nonexistent.csv"
@@ -100,6 +124,16 @@ class TestNDJSONRoundtrip:
 
         assert original_df.equals(roundtrip_df)
 
+    def test_ndjson_to_parquet_eager_matches_streaming(self, sample_ndjson_file: Path, tmp_path: Path) -> None:
+        """Eager and streaming NDJSON conversion produce the same data."""
+        streaming_path = tmp_path / "streaming.parquet"
+        eager_path = tmp_path / "eager.parquet"
+
+        ndjson_to_parquet(sample_ndjson_file, streaming_path)
+        ndjson_to_parquet(sample_ndjson_file, eager_path, eager=True)
+
+        assert pl.read_parquet(streaming_path).equals(pl.read_parquet(eager_path))
+
     def test_ndjson_file_not_found(self, tmp_path: Path) -> None:
         """FileNotFoundError raised for missing NDJSON file."""
         nonexistent = tmp_path / "nonexistent.ndjson"
@@ -147,6 +181,787 @@ class TestCrossFormatConversion:
         assert original_df.equals(final_df)
 
 
+class TestStdoutStreaming:
+    """Tests for batch-by-batch text output to stdout and files."""
+
+    def test_csv_stdout_header_written_once(self, tmp_path: Path, capsysbinary, monkeypatch) -> None:
+        """CSV stdout output spans several batches with a single header row."""
+        monkeypatch.setattr("parquet_lf.converters.csv.TEXT_BATCH_SIZE", 2)
+        parquet_path = tmp_path / "input.parquet"
+        df = pl.DataFrame({"id": [1, 2, 3, 4, 5], "name": ["a", "b", "c", "d", "e"]})
+        df.write_parquet(parquet_path)
+
+        parquet_to_csv(parquet_path, None)
+
+        output = capsysbinary.readouterr().out
+        assert output.count(b"id,name") == 1
+        assert pl.read_csv(output).equals(df)
+
+    def test_csv_file_written_in_batches(self, tmp_path: Path, monkeypatch) -> None:
+        """CSV file output is written batch by batch with a single header row."""
+        monkeypatch.setattr("parquet_lf.converters.csv.TEXT_BATCH_SIZE", 2)
+        parquet_path = tmp_path / "input.parquet"
+        df = pl.DataFrame({"id": [1, 2, 3, 4, 5], "name": ["a", "b", "c", "d", "e"]})
+        df.write_parquet(parquet_path)
+        output_path = tmp_path / "output.csv"
+
+        parquet_to_csv(parquet_path, output_path)
+
+        assert output_path.read_text().count("id,name") == 1
+        assert pl.read_csv(output_path).equals(df)
+
+    def test_csv_stdout_empty_file_writes_header(self, tmp_path: Path, capsysbinary) -> None:
+        """CSV stdout output for an empty Parquet file still has a header."""
+        parquet_path = tmp_path / "empty.parquet"
+        pl.DataFrame({"id": [], "name": []}, schema={"id": pl.Int64, "name": pl.String}).write_parquet(parquet_path)
+
+        parquet_to_csv(parquet_path, None)
+
+        assert capsysbinary.readouterr().out == b"id,name\n"
+
+    def test_ndjson_stdout_multiple_batches(self, tmp_path: Path, capsysbinary, monkeypatch) -> None:
+        """NDJSON stdout output spans several batches without losing rows."""
+        monkeypatch.setattr("parquet_lf.converters.ndjson.TEXT_BATCH_SIZE", 2)
+        parquet_path = tmp_path / "input.parquet"
+        df = pl.DataFrame({"id": [1, 2, 3, 4, 5]})
+        df.write_parquet(parquet_path)
+
+        parquet_to_ndjson(parquet_path, Path("-"))
+
+        output = capsysbinary.readouterr().out
+        assert output.count(b"\n") == 5
+        assert pl.read_ndjson(output).equals(df)
+
+    @pytest.mark.parametrize("converter", [parquet_to_csv, parquet_to_ndjson])
+    def test_stdout_query_error_raised(self, sample_parquet_file: Path, capsysbinary, converter) -> None:
+        """A query failing while batches are streamed is raised, not reported as success."""
+        read_options = ParquetReadOptions(where="name > 5")
+
+        with pytest.raises(pl.exceptions.ComputeError, match="cannot compare string with numeric"):
+            converter(sample_parquet_file, None, read_options)
+
+        assert capsysbinary.readouterr().out == b""
+
+
+class TestParquetStdout:
+    """Tests for writing Parquet directly to stdout."""
+
+    def test_csv_to_parquet_stdout_streaming(self, sample_csv_file: Path, capsysbinary) -> None:
+        """Streaming CSV conversion writes a valid Parquet file to stdout."""
+        csv_to_parquet(sample_csv_file, None)
+
+        df = pl.read_parquet(capsysbinary.readouterr().out)
+        assert df.equals(pl.read_csv(sample_csv_file))
+
+    def test_ndjson_to_parquet_stdout_eager(self, sample_ndjson_file: Path, capsysbinary) -> None:
+        """Eager NDJSON conversion writes a valid Parquet file to stdout."""
+        ndjson_to_parquet(sample_ndjson_file, Path("-"), eager=True)
+
+        df = pl.read_parquet(capsysbinary.readouterr().out)
+        assert df.equals(pl.read_ndjson(sample_ndjson_file))
+
+
+class TestStdinInput:
+    """Tests for reading input from stdin."""
+
+    def test_csv_to_parquet_from_stdin(self, sample_csv_content: str, tmp_path: Path, monkeypatch) -> None:
+        """CSV read from stdin converts to Parquet."""
+        monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(sample_csv_content.encode())))
+        output_path = tmp_path / "output.parquet"
+
+        csv_to_parquet(Path("-"), output_path)
+
+        assert pl.read_parquet(output_path).equals(pl.read_csv(sample_csv_content.encode()))
+
+    def test_ndjson_to_parquet_from_stdin_eager(self, sample_ndjson_content: str, tmp_path: Path, monkeypatch) -> None:
+        """NDJSON read eagerly from stdin converts to Parquet."""
+        monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(sample_ndjson_content.encode())))
+        output_path = tmp_path / "output.parquet"
+
+        ndjson_to_parquet(Path("-"), output_path, eager=True)
+
+        assert pl.read_parquet(output_path).equals(pl.read_ndjson(sample_ndjson_content.encode()))
+
+    def test_parquet_to_csv_from_stdin(self, sample_parquet_file: Path, tmp_path: Path, monkeypatch) -> None:
+        """Parquet read from stdin converts to CSV."""
+        monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(sample_parquet_file.read_bytes())))
+        output_path = tmp_path / "output.csv"
+
+        parquet_to_csv(Path("-"), output_path)
+
+        assert pl.read_csv(output_path).equals(pl.read_parquet(sample_parquet_file))
+
+
+class TestCompressedInput:
+    """Tests for converting compressed CSV and NDJSON input."""
+
+    @pytest.mark.parametrize("eager", [False, True])
+    @pytest.mark.parametrize(
+        ("suffix", "compress"), [(".gz", gzip.compress), (".bz2", bz2.compress), (".zst", zstandard.compress)]
+    )
+    def test_csv_to_parquet(self, sample_csv_content: str, tmp_path: Path, suffix: str, compress, eager: bool) -> None:
+        """Compressed CSV files convert like the uncompressed file."""
+        csv_file = tmp_path / f"input.csv{suffix}"
+        csv_file.write_bytes(compress(sample_csv_content.encode()))
+        output_path = tmp_path / "output.parquet"
+
+        csv_to_parquet(csv_file, output_path, eager=eager)
+
+        assert pl.read_parquet(output_path).equals(pl.read_csv(sample_csv_content.encode()))
+
+    @pytest.mark.parametrize("eager", [False, True])
+    def test_ndjson_to_parquet(self, sample_ndjson_content: str, tmp_path: Path, eager: bool) -> None:
+        """Compressed NDJSON files convert like the uncompressed file."""
+        ndjson_file = tmp_path / "input.ndjson.gz"
+        ndjson_file.write_bytes(gzip.compress(sample_ndjson_content.encode()))
+        output_path = tmp_path / "output.parquet"
+
+        ndjson_to_parquet(ndjson_file, output_path, eager=eager)
+
+        assert pl.read_parquet(output_path).equals(pl.read_ndjson(sample_ndjson_content.encode()))
+
+    def test_compression_detected_from_magic_bytes(self, sample_csv_content: str, tmp_path: Path) -> None:
+        """A compressed file without a compression extension is still decompressed."""
+        csv_file = tmp_path / "input.csv"
+        csv_file.write_bytes(bz2.compress(sample_csv_content.encode()))
+        output_path = tmp_path / "output.parquet"
+
+        csv_to_parquet(csv_file, output_path)
+
+        assert pl.read_parquet(output_path).equals(pl.read_csv(sample_csv_content.encode()))
+
+    @pytest.mark.parametrize("compress", [gzip.compress, zstandard.compress])
+    def test_compressed_stdin(self, sample_ndjson_content: str, tmp_path: Path, monkeypatch, compress) -> None:
+        """Compressed stdin is detected and decompressed."""
+        stdin = io.BufferedReader(io.BytesIO(compress(sample_ndjson_content.encode())))
+        monkeypatch.setattr("sys.stdin", io.TextIOWrapper(stdin))
+        output_path = tmp_path / "output.parquet"
+
+        ndjson_to_parquet(Path("-"), output_path)
+
+        assert pl.read_parquet(output_path).equals(pl.read_ndjson(sample_ndjson_content.encode()))
+
+    @pytest.mark.parametrize("suffix", [".gz", ".zst"])
+    def test_compressed_file_streamed(self, sample_csv_content: str, tmp_path: Path, suffix: str) -> None:
+        """Compressed files are decompressed as a stream rather than handed to polars as a path."""
+        csv_file = tmp_path / f"input.csv{suffix}"
+        compress = gzip.compress if suffix == ".gz" else zstandard.compress
+        csv_file.write_bytes(compress(sample_csv_content.encode()))
+
+        with text_input(csv_file) as source:
+            assert not isinstance(source, Path)
+            assert source.read() == sample_csv_content.encode()
+
+    def test_compressed_with_schema(self, sample_csv_content: str, tmp_path: Path) -> None:
+        """An explicit schema applies to compressed input."""
+        csv_file = tmp_path / "input.csv.gz"
+        csv_file.write_bytes(gzip.compress(sample_csv_content.encode()))
+        schema = pl.read_csv(sample_csv_content.encode(), infer_schema=False).schema
+        output_path = tmp_path / "output.parquet"
+
+        csv_to_parquet(csv_file, output_path, schema=schema)
+
+        assert pl.read_parquet_schema(output_path) == schema
+
+    def test_sampled_inference_fails(self, sample_csv_content: str, tmp_path: Path) -> None:
+        """Sampled inference needs byte offsets into uncompressed data."""
+        csv_file = tmp_path / "input.csv.gz"
+        csv_file.write_bytes(gzip.compress(sample_csv_content.encode()))
+
+        with pytest.raises(ValueError, match="uncompressed"):
+            csv_to_parquet(csv_file, tmp_path / "output.parquet", schema_inference=SchemaInference.SAMPLED)
+
+
+class TestCompressedOutput:
+    """Tests for compressed CSV and NDJSON output."""
+
+    def test_parquet_to_csv_gzip(self, sample_parquet_file: Path, tmp_path: Path) -> None:
+        """gzip-compressed CSV output decompresses to the plain CSV output."""
+        plain_path = tmp_path / "output.csv"
+        compressed_path = tmp_path / "output.csv.gz"
+
+        parquet_to_csv(sample_parquet_file, plain_path)
+        parquet_to_csv(sample_parquet_file, compressed_path, compression=OutputCompression.GZIP)
+
+        assert gzip.decompress(compressed_path.read_bytes()) == plain_path.read_bytes()
+
+    def test_parquet_to_ndjson_bzip2_to_stdout(self, sample_parquet_file: Path, capsysbinary) -> None:
+        """bzip2-compressed NDJSON is written to stdout."""
+        parquet_to_ndjson(sample_parquet_file, None, compression=OutputCompression.BZIP2)
+
+        output = bz2.decompress(capsysbinary.readouterr().out)
+        assert pl.read_ndjson(output).equals(pl.read_parquet(sample_parquet_file))
+
+    @pytest.mark.parametrize("compression", list(OutputCompression))
+    def test_compressed_output_roundtrip(
+        self, sample_parquet_file: Path, tmp_path: Path, compression: OutputCompression
+    ) -> None:
+        """Compressed output converts back to the original data."""
+        csv_path = tmp_path / f"output.csv{OUTPUT_EXTENSIONS[compression]}"
+        parquet_path = tmp_path / "roundtrip.parquet"
+
+        parquet_to_csv(sample_parquet_file, csv_path, compression=compression)
+        csv_to_parquet(csv_path, parquet_path)
+
+        assert pl.read_parquet(parquet_path).equals(pl.read_parquet(sample_parquet_file))
+
+
+class TestPartitionedOutput:
+    """Tests for hive-partitioned Parquet output."""
+
+    @pytest.fixture
+    def regions_csv_file(self, tmp_path: Path) -> Path:
+        """Create a CSV file with a low-cardinality region column."""
+        csv_file = tmp_path / "regions.csv"
+        csv_file.write_text("region,value\neu,1\nus,2\neu,3\nap,4")
+        return csv_file
+
+    def test_csv_partitioned_by_column(self, regions_csv_file: Path, tmp_path: Path) -> None:
+        """Streaming conversion writes one directory per partition value."""
+        output_dir = tmp_path / "dataset"
+
+        csv_to_parquet(regions_csv_file, output_dir, write_options=ParquetWriteOptions(partition_by=["region"]))
+
+        assert sorted(p.name for p in output_dir.iterdir()) == ["region=ap", "region=eu", "region=us"]
+        eu = pl.read_parquet(output_dir / "region=eu")
+        assert eu.columns == ["value"]
+        assert sorted(eu["value"].to_list()) == [1, 3]
+
+    def test_eager_partitioned_with_open_file_cap(self, regions_csv_file: Path, tmp_path: Path) -> None:
+        """Eager conversion honours partitioning and a small open-file cap keeps every row."""
+        output_dir = tmp_path / "dataset"
+        options = ParquetWriteOptions(partition_by=["region"], max_open_files=1)
+
+        csv_to_parquet(regions_csv_file, output_dir, eager=True, write_options=options)
+
+        df = pl.read_parquet(output_dir, hive_partitioning=True)
+        assert sorted(df["value"].to_list()) == [1, 2, 3, 4]
+
+    @pytest.fixture
+    def interleaved_csv_file(self, tmp_path: Path) -> Path:
+        """Create a CSV file whose three keys alternate row by row over several batches."""
+        csv_file = tmp_path / "interleaved.csv"
+        pl.DataFrame({"key": [i % 3 for i in range(300_000)], "value": range(300_000)}).write_csv(csv_file)
+        return csv_file
+
+    @pytest.mark.parametrize(("max_open_files", "single_file"), [(DEFAULT_MAX_OPEN_FILES, True), (1, False)])
+    def test_open_file_cap_writes_out_partitions(
+        self, interleaved_csv_file: Path, tmp_path: Path, max_open_files: int, single_file: bool
+    ) -> None:
+        """Partitions beyond the cap are written out early and continue in new files."""
+        output_dir = tmp_path / "dataset"
+        options = ParquetWriteOptions(partition_by=["key"], max_open_files=max_open_files)
+
+        csv_to_parquet(interleaved_csv_file, output_dir, write_options=options)
+
+        files_per_partition = [len(list(partition.iterdir())) for partition in output_dir.iterdir()]
+        assert len(files_per_partition) == 3
+        assert all((count == 1) == single_file for count in files_per_partition)
+        df = pl.read_parquet(output_dir, hive_partitioning=True)
+        assert sorted(df["value"].to_list()) == list(range(300_000))
+
+    def test_memory_budget_writes_out_partitions(self, interleaved_csv_file: Path, tmp_path: Path, monkeypatch) -> None:
+        """Buffers beyond the memory budget are written out before the input is fully read."""
+        monkeypatch.setattr("parquet_lf.converters.base.PARTITION_BUFFER_BYTES", 1)
+        output_dir = tmp_path / "dataset"
+
+        csv_to_parquet(interleaved_csv_file, output_dir, write_options=ParquetWriteOptions(partition_by=["key"]))
+
+        assert len(list((output_dir / "key=0").iterdir())) > 1
+        df = pl.read_parquet(output_dir, hive_partitioning=True)
+        assert sorted(df["value"].to_list()) == list(range(300_000))
+
+    def test_partitioned_stdout_raises_error(self, regions_csv_file: Path) -> None:
+        """Partitioned output to stdout raises ValueError."""
+        with pytest.raises(ValueError, match="output directory"):
+            csv_to_parquet(regions_csv_file, None, write_options=ParquetWriteOptions(partition_by=["region"]))
+
+
+class TestWriterOptions:
+    """Tests for Parquet writer tuning options."""
+
+    @pytest.fixture
+    def repetitive_csv_file(self, tmp_path: Path) -> Path:
+        """Create a CSV file with highly compressible content."""
+        csv_file = tmp_path / "repetitive.csv"
+        pl.DataFrame({"id": list(range(5000)), "status": ["active"] * 5000}).write_csv(csv_file)
+        return csv_file
+
+    def test_uncompressed_larger_than_zstd(self, repetitive_csv_file: Path, tmp_path: Path) -> None:
+        """Uncompressed output is larger than zstd output for the same data."""
+        zstd_path = tmp_path / "zstd.parquet"
+        plain_path = tmp_path / "plain.parquet"
+
+        csv_to_parquet(repetitive_csv_file, zstd_path, write_options=ParquetWriteOptions(compression_level=19))
+        options = ParquetWriteOptions(compression=ParquetCompression.UNCOMPRESSED)
+        csv_to_parquet(repetitive_csv_file, plain_path, write_options=options)
+
+        assert plain_path.stat().st_size > zstd_path.stat().st_size
+        assert pl.read_parquet(plain_path).equals(pl.read_parquet(zstd_path))
+
+    @pytest.mark.parametrize("eager", [False, True])
+    def test_auto_row_groups_without_statistics(self, repetitive_csv_file: Path, tmp_path: Path, eager: bool) -> None:
+        """Auto row group sizing and disabled statistics produce readable output."""
+        output_path = tmp_path / "output.parquet"
+        options = ParquetWriteOptions(
+            compression=ParquetCompression.LZ4,
+            row_group_size="auto",
+            statistics=ParquetStatistics.OFF,
+        )
+
+        ndjson_path = tmp_path / "input.ndjson"
+        pl.read_csv(repetitive_csv_file).write_ndjson(ndjson_path)
+        ndjson_to_parquet(ndjson_path, output_path, eager=eager, write_options=options)
+
+        assert pl.read_parquet(output_path).shape == (5000, 2)
+
+
+class TestSortedOutput:
+    """Tests for sorting Parquet output with sort_by."""
+
+    @pytest.fixture
+    def shuffled_csv_file(self, tmp_path: Path) -> Path:
+        """Create a CSV file with keys in shuffled order."""
+        csv_file = tmp_path / "shuffled.csv"
+        rows = 10_000
+        pl.DataFrame({"id": pl.int_range(rows, eager=True).shuffle(seed=3), "value": range(rows)}).write_csv(csv_file)
+        return csv_file
+
+    @pytest.mark.parametrize("eager", [False, True])
+    def test_csv_sorted_with_spill(self, shuffled_csv_file: Path, tmp_path: Path, eager: bool) -> None:
+        """Output is sorted even when the memory budget forces spilling."""
+        output_path = tmp_path / "output.parquet"
+        options = ParquetWriteOptions(sort_by=["id"], sort_memory=16 * 1024, row_group_size=1000)
+
+        csv_to_parquet(shuffled_csv_file, output_path, eager=eager, write_options=options)
+
+        assert pl.read_parquet(output_path).equals(pl.read_csv(shuffled_csv_file).sort("id"))
+
+    def test_sorted_row_groups_do_not_overlap(self, shuffled_csv_file: Path, tmp_path: Path) -> None:
+        """Sorted output gives each row group a disjoint key range, so statistics prune."""
+        output_path = tmp_path / "output.parquet"
+        ndjson_path = tmp_path / "input.ndjson"
+        pl.read_csv(shuffled_csv_file).write_ndjson(ndjson_path)
+        options = ParquetWriteOptions(sort_by=["id"], sort_memory=16 * 1024, row_group_size=1000)
+
+        ndjson_to_parquet(ndjson_path, output_path, write_options=options)
+
+        pruning = count_pruned_row_groups(output_path, "id < 1000")
+        assert (pruning.total, pruning.pruned) == (10, 9)
+
+
+class TestShrinkTypes:
+    """Tests for narrowing numeric columns with shrink_types."""
+
+    @pytest.fixture
+    def numeric_frame(self) -> pl.DataFrame:
+        """Frame whose inferred Int64/Float64 columns fit narrower types."""
+        rows = 1000
+        return pl.DataFrame(
+            {
+                "id": range(rows),
+                "flag": [i % 2 for i in range(rows)],
+                "price": [i / 4 for i in range(rows)],
+                "ratio": [i / 3 for i in range(rows)],
+            }
+        )
+
+    @pytest.mark.parametrize("eager", [False, True])
+    def test_csv_narrowed_losslessly(self, numeric_frame: pl.DataFrame, tmp_path: Path, eager: bool) -> None:
+        """Numeric columns get their smallest lossless types and keep their values."""
+        csv_file = tmp_path / "input.csv"
+        numeric_frame.write_csv(csv_file)
+        output_path = tmp_path / "output.parquet"
+
+        shrinkage = csv_to_parquet(
+            csv_file, output_path, eager=eager, write_options=ParquetWriteOptions(shrink_types=True)
+        )
+
+        result = pl.read_parquet(output_path)
+        assert result.schema == pl.Schema(
+            {"id": pl.Int16(), "flag": pl.Int8(), "price": pl.Float32(), "ratio": pl.Float64()}
+        )
+        assert result.cast(dict(numeric_frame.schema)).equals(numeric_frame)
+        assert shrinkage is not None
+        assert (shrinkage.memory_before, shrinkage.memory_after) == (32_000, 15_000)
+
+    def test_ndjson_from_stdin_sorted(self, numeric_frame: pl.DataFrame, tmp_path: Path, monkeypatch) -> None:
+        """Input read once from stdin is staged, narrowed and sorted."""
+        buffer = io.BytesIO()
+        numeric_frame.reverse().write_ndjson(buffer)
+        monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(buffer.getvalue())))
+        output_path = tmp_path / "output.parquet"
+        options = ParquetWriteOptions(shrink_types=True, sort_by=["id"])
+
+        ndjson_to_parquet(Path("-"), output_path, write_options=options)
+
+        result = pl.read_parquet(output_path)
+        assert result.schema["id"] == pl.Int16
+        assert result.cast(dict(numeric_frame.schema)).equals(numeric_frame)
+
+    @pytest.fixture
+    def sink_targets(self, monkeypatch) -> list[object]:
+        """Record the target of every LazyFrame.sink_parquet call."""
+        targets: list[object] = []
+        sink_parquet = pl.LazyFrame.sink_parquet
+
+        def recording_sink(lf: pl.LazyFrame, path, *args, **kwargs):
+            targets.append(path)
+            return sink_parquet(lf, path, *args, **kwargs)
+
+        monkeypatch.setattr(pl.LazyFrame, "sink_parquet", recording_sink)
+        return targets
+
+    def test_csv_file_not_staged(self, numeric_frame: pl.DataFrame, tmp_path: Path, sink_targets: list[object]) -> None:
+        """A file input is scanned again instead of being staged to a temporary copy."""
+        csv_file = tmp_path / "input.csv"
+        numeric_frame.write_csv(csv_file)
+        output_path = tmp_path / "output.parquet"
+
+        csv_to_parquet(csv_file, output_path, write_options=ParquetWriteOptions(shrink_types=True))
+
+        assert len(sink_targets) == 1
+        assert pl.read_parquet_schema(output_path)["id"] == pl.Int16
+
+    def test_stdin_staged_next_to_output(
+        self, numeric_frame: pl.DataFrame, tmp_path: Path, monkeypatch, sink_targets: list[object]
+    ) -> None:
+        """Input read once from stdin is staged in the output directory and removed afterwards."""
+        monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(numeric_frame.write_csv().encode())))
+        output_path = tmp_path / "output.parquet"
+
+        csv_to_parquet(Path("-"), output_path, write_options=ParquetWriteOptions(shrink_types=True))
+
+        staged, _ = sink_targets
+        assert isinstance(staged, Path) and staged.parent == tmp_path
+        assert list(tmp_path.iterdir()) == [output_path]
+
+    def test_disabled_by_default(self, numeric_frame: pl.DataFrame, tmp_path: Path) -> None:
+        """Without shrink_types the inferred types are written and nothing is reported."""
+        csv_file = tmp_path / "input.csv"
+        numeric_frame.write_csv(csv_file)
+        output_path = tmp_path / "output.parquet"
+
+        assert csv_to_parquet(csv_file, output_path) is None
+        assert pl.read_parquet_schema(output_path) == numeric_frame.schema
+
+
+class TestExplicitSchema:
+    """Tests for converting text files with an explicit schema."""
+
+    @pytest.mark.parametrize("eager", [False, True])
+    def test_csv_uses_declared_types(self, sample_csv_file: Path, tmp_path: Path, eager: bool) -> None:
+        """CSV columns are parsed into the declared types, not inferred ones."""
+        output_path = tmp_path / "output.parquet"
+        schema = pl.Schema({"name": pl.String(), "value": pl.Float32()})
+
+        csv_to_parquet(sample_csv_file, output_path, eager=eager, schema=schema)
+
+        assert pl.read_parquet_schema(output_path) == schema
+
+    @pytest.mark.parametrize("eager", [False, True])
+    def test_ndjson_uses_declared_types(self, sample_ndjson_file: Path, tmp_path: Path, eager: bool) -> None:
+        """NDJSON values are parsed into the declared types, not inferred ones."""
+        output_path = tmp_path / "output.parquet"
+        schema = pl.Schema({"name": pl.String(), "value": pl.Int16()})
+
+        ndjson_to_parquet(sample_ndjson_file, output_path, eager=eager, schema=schema)
+
+        assert pl.read_parquet_schema(output_path) == schema
+
+    def test_csv_sampled_inference(self, tmp_path: Path) -> None:
+        """Sampled inference converts files whose types change after the leading rows."""
+        csv_file = tmp_path / "input.csv"
+        rows = 200_000
+        codes = [str(i) for i in range(rows // 2)] + [f"A{i}" for i in range(rows // 2)]
+        pl.DataFrame({"id": range(rows), "code": codes}).write_csv(csv_file)
+        output_path = tmp_path / "output.parquet"
+
+        with pytest.raises(pl.exceptions.ComputeError):
+            csv_to_parquet(csv_file, tmp_path / "head.parquet")
+        csv_to_parquet(csv_file, output_path, schema_inference=SchemaInference.SAMPLED)
+
+        assert pl.read_parquet(output_path)["code"].to_list() == codes
+
+    def test_sampled_inference_from_stdin_fails(self, sample_ndjson_content: str, tmp_path: Path, monkeypatch) -> None:
+        """Sampled inference needs a seekable file."""
+        monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(sample_ndjson_content.encode())))
+
+        with pytest.raises(ValueError, match="not stdin"):
+            ndjson_to_parquet(Path("-"), tmp_path / "output.parquet", schema_inference=SchemaInference.SAMPLED)
+
+    def test_ndjson_small_integer_overflow_fails(self, tmp_path: Path) -> None:
+        """NDJSON values that overflow a narrow integer type fail the conversion."""
+        ndjson_file = tmp_path / "input.ndjson"
+        ndjson_file.write_text('{"id": 1}\n{"id": 300}\n')
+
+        with pytest.raises(pl.exceptions.InvalidOperationError):
+            ndjson_to_parquet(ndjson_file, tmp_path / "output.parquet", schema=pl.Schema({"id": pl.UInt8()}))
+
+    def test_csv_mismatching_row_fails(self, tmp_path: Path) -> None:
+        """A value that does not fit its declared type fails the conversion."""
+        csv_file = tmp_path / "input.csv"
+        csv_file.write_text("id\n1\n2\nx\n")
+
+        with pytest.raises(pl.exceptions.ComputeError, match="could not parse `x`"):
+            csv_to_parquet(csv_file, tmp_path / "output.parquet", schema=pl.Schema({"id": pl.Int64()}))
+
+    def test_csv_header_mismatch_fails(self, sample_csv_file: Path, tmp_path: Path) -> None:
+        """A header that does not match the schema is rejected before conversion."""
+        schema = pl.Schema({"value": pl.Int64(), "name": pl.String()})
+
+        with pytest.raises(ValueError, match="CSV header does not match the schema"):
+            csv_to_parquet(sample_csv_file, tmp_path / "output.parquet", schema=schema)
+
+    def test_csv_from_stdin(self, sample_csv_content: str, tmp_path: Path, monkeypatch) -> None:
+        """CSV streamed from stdin is parsed into the declared types."""
+        monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(sample_csv_content.encode())))
+        output_path = tmp_path / "output.parquet"
+        schema = pl.Schema({"name": pl.String(), "value": pl.Float64()})
+
+        csv_to_parquet(Path("-"), output_path, schema=schema)
+
+        assert pl.read_parquet_schema(output_path) == schema
+
+    def test_ndjson_mismatching_value_fails(self, tmp_path: Path) -> None:
+        """A JSON value that does not fit its declared type fails the conversion."""
+        ndjson_file = tmp_path / "input.ndjson"
+        ndjson_file.write_text('{"id": 1}\n{"id": "x"}\n')
+
+        with pytest.raises(pl.exceptions.ComputeError):
+            ndjson_to_parquet(ndjson_file, tmp_path / "output.parquet", schema=pl.Schema({"id": pl.Int64()}))
+
+
+class TestAutoCategorical:
+    """Tests for storing low-cardinality string columns as Categorical."""
+
+    @pytest.fixture
+    def repetitive_frame(self) -> pl.DataFrame:
+        """Frame with a repetitive and a unique string column."""
+        rows = 1000
+        return pl.DataFrame(
+            {
+                "id": range(rows),
+                "city": ["Oslo", "Lima", "Pune"] * 333 + ["Oslo"],
+                "name": [f"n{i}" for i in range(rows)],
+            }
+        )
+
+    @pytest.mark.parametrize("eager", [False, True])
+    def test_csv(self, repetitive_frame: pl.DataFrame, tmp_path: Path, eager: bool) -> None:
+        """Repetitive CSV string columns are written as Categorical with the same values."""
+        csv_file = tmp_path / "input.csv"
+        repetitive_frame.write_csv(csv_file)
+        output_path = tmp_path / "output.parquet"
+
+        csv_to_parquet(csv_file, output_path, eager=eager, categorical_ratio=0.05)
+
+        result = pl.read_parquet(output_path)
+        assert result.schema == pl.Schema({"id": pl.Int64(), "city": pl.Categorical(), "name": pl.String()})
+        assert result.cast({"city": pl.String}).equals(repetitive_frame)
+
+    @pytest.mark.parametrize("eager", [False, True])
+    def test_compressed_ndjson(self, repetitive_frame: pl.DataFrame, tmp_path: Path, eager: bool) -> None:
+        """Streamed NDJSON detects Categorical columns from its first block."""
+        ndjson_file = tmp_path / "input.ndjson.gz"
+        buffer = io.BytesIO()
+        repetitive_frame.write_ndjson(buffer)
+        ndjson_file.write_bytes(gzip.compress(buffer.getvalue()))
+        output_path = tmp_path / "output.parquet"
+
+        ndjson_to_parquet(ndjson_file, output_path, eager=eager, categorical_ratio=0.05)
+
+        result = pl.read_parquet(output_path)
+        assert result.schema["city"] == pl.Categorical
+        assert result.cast({"city": pl.String}).equals(repetitive_frame)
+
+    @pytest.mark.parametrize("compressed", [False, True])
+    def test_ndjson_with_narrow_schema(self, repetitive_frame: pl.DataFrame, tmp_path: Path, compressed: bool) -> None:
+        """Declared narrow integer types are kept alongside detected Categorical columns."""
+        ndjson_file = tmp_path / ("input.ndjson.gz" if compressed else "input.ndjson")
+        buffer = io.BytesIO()
+        repetitive_frame.write_ndjson(buffer)
+        ndjson_file.write_bytes(gzip.compress(buffer.getvalue()) if compressed else buffer.getvalue())
+        schema = pl.Schema({"id": pl.Int16(), "city": pl.String(), "name": pl.String()})
+        output_path = tmp_path / "output.parquet"
+
+        ndjson_to_parquet(ndjson_file, output_path, schema=schema, categorical_ratio=0.05)
+
+        assert pl.read_parquet_schema(output_path) == pl.Schema(
+            {"id": pl.Int16(), "city": pl.Categorical(), "name": pl.String()}
+        )
+
+    def test_ratio_zero_keeps_strings(self, sample_csv_file: Path, tmp_path: Path) -> None:
+        """A zero ratio leaves every string column as String."""
+        output_path = tmp_path / "output.parquet"
+
+        csv_to_parquet(sample_csv_file, output_path, categorical_ratio=0.0)
+
+        assert pl.read_parquet(output_path).equals(pl.read_csv(sample_csv_file))
+
+
+class TestFailedConversion:
+    """Tests that a failed conversion leaves no partial output."""
+
+    @pytest.fixture
+    def late_error_csv_file(self, tmp_path: Path) -> Path:
+        """Create a CSV file whose only unparsable row comes after many valid ones."""
+        csv_file = tmp_path / "late.csv"
+        rows = 500_000
+        csv_file.write_text("id\n" + "".join(f"{i}\n" for i in range(rows)) + "x\n")
+        return csv_file
+
+    @pytest.mark.parametrize("eager", [False, True])
+    def test_late_bad_row_leaves_no_output(self, late_error_csv_file: Path, tmp_path: Path, eager: bool) -> None:
+        """A row failing near the end of the input leaves no output file."""
+        output_path = tmp_path / "output.parquet"
+        schema = pl.Schema({"id": pl.Int64()})
+
+        with pytest.raises(pl.exceptions.ComputeError):
+            csv_to_parquet(late_error_csv_file, output_path, eager=eager, schema=schema)
+
+        assert list(tmp_path.iterdir()) == [late_error_csv_file]
+
+    def test_ndjson_schema_mismatch_leaves_no_output(self, tmp_path: Path) -> None:
+        """An NDJSON value not matching the schema leaves no (empty) output file."""
+        ndjson_file = tmp_path / "input.ndjson"
+        ndjson_file.write_text('{"id": "x"}\n')
+        output_path = tmp_path / "output.parquet"
+
+        with pytest.raises(pl.exceptions.ComputeError):
+            ndjson_to_parquet(ndjson_file, output_path, schema=pl.Schema({"id": pl.Int64()}))
+
+        assert not output_path.exists()
+
+    @pytest.mark.parametrize("compression", [None, OutputCompression.GZIP])
+    @pytest.mark.parametrize("converter", [parquet_to_csv, parquet_to_ndjson])
+    def test_text_query_error_leaves_no_output(
+        self, sample_parquet_file: Path, tmp_path: Path, converter, compression: OutputCompression | None
+    ) -> None:
+        """A query failing while text is streamed to a file leaves no output file."""
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+
+        with pytest.raises(pl.exceptions.ComputeError):
+            converter(sample_parquet_file, output_dir / "output", ParquetReadOptions(where="name > 5"), compression)
+
+        assert list(output_dir.iterdir()) == []
+
+    def test_previous_output_kept(self, late_error_csv_file: Path, sample_parquet_file: Path) -> None:
+        """A failed conversion leaves an existing output file as it was."""
+        before = sample_parquet_file.read_bytes()
+
+        with pytest.raises(pl.exceptions.ComputeError):
+            csv_to_parquet(late_error_csv_file, sample_parquet_file, schema=pl.Schema({"id": pl.Int64()}))
+
+        assert sample_parquet_file.read_bytes() == before
+
+
+class TestColumnProjection:
+    """Tests for reading a subset of Parquet columns."""
+
+    def test_csv_selected_columns(self, sample_parquet_file: Path, tmp_path: Path) -> None:
+        """Only the selected columns are written, in the requested order."""
+        output_path = tmp_path / "output.csv"
+
+        parquet_to_csv(sample_parquet_file, output_path, ParquetReadOptions(columns=["value", "name"]))
+
+        df = pl.read_csv(output_path)
+        assert df.columns == ["value", "name"]
+        assert df.equals(pl.read_parquet(sample_parquet_file).select("value", "name"))
+
+    def test_ndjson_excluded_columns(self, sample_parquet_file: Path, tmp_path: Path) -> None:
+        """Excluded columns are left out of the output."""
+        output_path = tmp_path / "output.ndjson"
+
+        parquet_to_ndjson(sample_parquet_file, output_path, ParquetReadOptions(exclude=["value"]))
+
+        assert pl.read_ndjson(output_path).columns == ["name"]
+
+    def test_csv_stdout_selected_columns(self, sample_parquet_file: Path, capsysbinary) -> None:
+        """The streaming stdout path applies the projection too."""
+        parquet_to_csv(sample_parquet_file, None, ParquetReadOptions(columns=["value"]))
+
+        assert pl.read_csv(io.BytesIO(capsysbinary.readouterr().out)).columns == ["value"]
+
+    def test_unknown_column_fails(self, sample_parquet_file: Path, tmp_path: Path) -> None:
+        """Selecting a missing column raises ValueError before writing."""
+        output_path = tmp_path / "output.csv"
+
+        with pytest.raises(ValueError, match="Unknown column"):
+            parquet_to_csv(sample_parquet_file, output_path, ParquetReadOptions(columns=["missing"]))
+
+        assert not output_path.exists()
+
+
+class TestRowFilter:
+    """Tests for filtering Parquet rows with --where expressions."""
+
+    @pytest.fixture
+    def grouped_parquet_file(self, tmp_path: Path) -> Path:
+        """Create a Parquet file with several row groups."""
+        parquet_file = tmp_path / "grouped.parquet"
+        pl.DataFrame({"id": range(1000), "region": ["eu", "us"] * 500}).write_parquet(parquet_file, row_group_size=100)
+        return parquet_file
+
+    def test_csv_filtered_rows(self, grouped_parquet_file: Path, tmp_path: Path) -> None:
+        """Only rows matching the filter are written."""
+        output_path = tmp_path / "output.csv"
+
+        parquet_to_csv(grouped_parquet_file, output_path, ParquetReadOptions(where="id >= 990 and region == 'us'"))
+
+        assert pl.read_csv(output_path)["id"].to_list() == [991, 993, 995, 997, 999]
+
+    def test_filter_on_unselected_column(self, grouped_parquet_file: Path, tmp_path: Path) -> None:
+        """The filter may reference columns left out of the output."""
+        output_path = tmp_path / "output.ndjson"
+
+        parquet_to_ndjson(grouped_parquet_file, output_path, ParquetReadOptions(columns=["id"], where="region == 'eu'"))
+
+        df = pl.read_ndjson(output_path)
+        assert df.columns == ["id"]
+        assert df.height == 500
+
+    def test_stdout_invalid_comparison_fails(self, grouped_parquet_file: Path) -> None:
+        """Errors raised while streaming to stdout reach the caller."""
+        with pytest.raises(pl.exceptions.PolarsError):
+            parquet_to_ndjson(grouped_parquet_file, None, ParquetReadOptions(where="region > 1"))
+
+
+class TestRowSlice:
+    """Tests for reading a slice of Parquet rows with offset and limit."""
+
+    @pytest.fixture
+    def grouped_parquet_file(self, tmp_path: Path) -> Path:
+        """Create a Parquet file with ten row groups."""
+        parquet_file = tmp_path / "grouped.parquet"
+        pl.DataFrame({"id": range(1000)}).write_parquet(parquet_file, row_group_size=100)
+        return parquet_file
+
+    def test_csv_slice_across_row_groups(self, grouped_parquet_file: Path, tmp_path: Path) -> None:
+        """A slice spanning a row group boundary returns exactly its rows."""
+        output_path = tmp_path / "output.csv"
+
+        parquet_to_csv(grouped_parquet_file, output_path, ParquetReadOptions(offset=295, limit=10))
+
+        assert pl.read_csv(output_path)["id"].to_list() == list(range(295, 305))
+
+    def test_ndjson_stdout_offset_only(self, grouped_parquet_file: Path, capsysbinary) -> None:
+        """Without a limit, every row after the offset is written."""
+        parquet_to_ndjson(grouped_parquet_file, None, ParquetReadOptions(offset=997))
+
+        df = pl.read_ndjson(io.BytesIO(capsysbinary.readouterr().out))
+        assert df["id"].to_list() == [997, 998, 999]
+
+    def test_slice_counts_filtered_rows(self, grouped_parquet_file: Path, tmp_path: Path) -> None:
+        """Offset and limit apply to the rows that match the filter."""
+        output_path = tmp_path / "output.csv"
+
+        parquet_to_csv(grouped_parquet_file, output_path, ParquetReadOptions(where="id % 100 == 0", offset=2, limit=3))
+
+        assert pl.read_csv(output_path)["id"].to_list() == [200, 300, 400]
+
+
 class TestHypothesisRoundtrip:
     """Property-based tests using Hypothesis."""
 
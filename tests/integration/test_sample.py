@@ -0,0 +1,64 @@
+"""Integration tests for the sample module.
+
+These tests cover functions that interact with the filesystem.
+"""
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from parquet_lf.sample import sample_parquet
+
+
+@pytest.fixture
+def grouped_parquet_file(tmp_path: Path) -> Path:
+    """Create a Parquet file with ten row groups of 100 rows."""
+    parquet_file = tmp_path / "grouped.parquet"
+    pl.DataFrame({"id": range(1000), "label": [f"row{i}" for i in range(1000)]}).write_parquet(
+        parquet_file, row_group_size=100
+    )
+    return parquet_file
+
+
+class TestSampleParquet:
+    """Tests for the sample_parquet function with real files."""
+
+    def test_sampled_rows_are_intact(self, grouped_parquet_file: Path) -> None:
+        """Test every sampled row is a real row in file order."""
+        sample = sample_parquet(grouped_parquet_file, rows=50, seed=1)
+
+        ids = sample.rows["id"].to_list()
+        assert len(ids) == 50
+        assert ids == sorted(set(ids))
+        assert sample.rows["label"].to_list() == [f"row{i}" for i in ids]
+        assert sample.row_groups_total == 10
+
+    def test_seed_is_reproducible(self, grouped_parquet_file: Path) -> None:
+        """Test the same seed draws the same rows."""
+        first = sample_parquet(grouped_parquet_file, fraction=0.05, seed=9)
+        second = sample_parquet(grouped_parquet_file, fraction=0.05, seed=9)
+
+        assert first.rows.equals(second.rows)
+
+    def test_by_row_group_reads_only_needed_groups(self, grouped_parquet_file: Path) -> None:
+        """Test sampling by row group reads only the groups that hold the sample."""
+        sample = sample_parquet(grouped_parquet_file, rows=150, seed=3, by_row_group=True)
+
+        assert sample.rows.height == 150
+        assert sample.row_groups_read == 2
+        assert (sample.rows["id"] // 100).n_unique() == 2
+
+    def test_selected_columns(self, grouped_parquet_file: Path) -> None:
+        """Test column selection applies to the sample."""
+        sample = sample_parquet(grouped_parquet_file, rows=5, columns=["label"])
+
+        assert sample.rows.columns == ["label"]
+
+    def test_empty_sample_keeps_schema(self, grouped_parquet_file: Path) -> None:
+        """Test a zero-row sample reads nothing but keeps the columns."""
+        sample = sample_parquet(grouped_parquet_file, rows=0)
+
+        assert sample.rows.columns == ["id", "label"]
+        assert sample.rows.is_empty()
+        assert sample.row_groups_read == 0
@@ -0,0 +1,148 @@
+"""Integration tests for the schema module.
+
+These tests cover functions that interact with the filesystem.
+"""
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from parquet_lf.schema import check_csv_header, infer_schema, infer_schema_sampled, load_schema, schema_to_json
+
+
+class TestLoadSchema:
+    """Tests for the load_schema function with real files."""
+
+    def test_loads_columns_in_order(self, tmp_path: Path) -> None:
+        """Test a schema file loads with its declared types and column order."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text('{"b": "String", "a": "Datetime(time_unit=\'ms\', time_zone=None)"}')
+
+        schema = load_schema(schema_file)
+
+        assert schema == pl.Schema({"b": pl.String(), "a": pl.Datetime("ms")})
+
+    def test_roundtrips_inferred_schema(self, sample_parquet_file: Path, tmp_path: Path) -> None:
+        """Test a written schema file loads back to the same schema."""
+        schema = infer_schema(sample_parquet_file)
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(schema_to_json(schema))
+
+        assert load_schema(schema_file) == schema
+
+    def test_missing_file_raises_error(self, tmp_path: Path) -> None:
+        """Test a missing schema file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="Schema file not found"):
+            load_schema(tmp_path / "missing.json")
+
+    def test_invalid_json_raises_error(self, tmp_path: Path) -> None:
+        """Test malformed JSON raises ValueError."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text("{not json")
+
+        with pytest.raises(ValueError, match="Invalid schema file"):
+            load_schema(schema_file)
+
+    def test_non_object_raises_error(self, tmp_path: Path) -> None:
+        """Test JSON that is not an object of type strings raises ValueError."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text('["Int64"]')
+
+        with pytest.raises(ValueError, match="expected a JSON object"):
+            load_schema(schema_file)
+
+
+class TestInferSchema:
+    """Tests for the infer_schema function with real files."""
+
+    def test_csv(self, sample_csv_file: Path) -> None:
+        """Test CSV schemas are inferred."""
+        assert infer_schema(sample_csv_file) == pl.Schema({"name": pl.String(), "value": pl.Int64()})
+
+    def test_ndjson(self, sample_ndjson_file: Path) -> None:
+        """Test NDJSON schemas are inferred."""
+        assert infer_schema(sample_ndjson_file) == pl.Schema({"name": pl.String(), "value": pl.Int64()})
+
+    def test_parquet(self, sample_parquet_file: Path) -> None:
+        """Test Parquet schemas come from the file metadata."""
+        assert infer_schema(sample_parquet_file) == pl.read_parquet_schema(sample_parquet_file)
+
+    def test_sample_rows_limits_inference(self, tmp_path: Path) -> None:
+        """Test only the sampled rows decide the types."""
+        csv_file = tmp_path / "late.csv"
+        csv_file.write_text("a\n1\n2\nx\n")
+
+        assert infer_schema(csv_file, sample_rows=2)["a"] == pl.Int64()
+        assert infer_schema(csv_file, sample_rows=3)["a"] == pl.String()
+
+    def test_missing_file_raises_error(self, tmp_path: Path) -> None:
+        """Test a missing input raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="Input file not found"):
+            infer_schema(tmp_path / "missing.csv")
+
+
+def _late_type_change_frame(rows: int = 200_000) -> pl.DataFrame:
+    """Build data whose types only show after the leading rows.
+
+    `discount` is empty for the first 40% of rows and then holds floats;
+    `code` holds integers for the first half and then alphanumeric codes.
+    """
+    empty = rows * 4 // 10
+    return pl.DataFrame(
+        {
+            "id": range(rows),
+            "discount": [None] * empty + [i / 100 for i in range(rows - empty)],
+            "code": [str(i) for i in range(rows // 2)] + [f"A{i}" for i in range(rows - rows // 2)],
+        }
+    )
+
+
+class TestInferSchemaSampled:
+    """Tests for the infer_schema_sampled function with real files."""
+
+    def test_csv_matches_full_inference(self, tmp_path: Path) -> None:
+        """Test samples across a CSV find types the leading rows miss."""
+        csv_file = tmp_path / "late.csv"
+        _late_type_change_frame().write_csv(csv_file)
+
+        assert infer_schema(csv_file)["code"] == pl.Int64()
+        assert infer_schema_sampled(csv_file) == infer_schema(csv_file, sample_rows=None)
+
+    def test_ndjson_matches_full_inference(self, tmp_path: Path) -> None:
+        """Test samples across an NDJSON file find types the leading rows miss."""
+        ndjson_file = tmp_path / "late.ndjson"
+        _late_type_change_frame().write_ndjson(ndjson_file)
+
+        assert infer_schema(ndjson_file)["discount"] == pl.Null()
+        assert infer_schema_sampled(ndjson_file) == infer_schema(ndjson_file, sample_rows=None)
+
+    def test_small_file_uses_every_row(self, tmp_path: Path) -> None:
+        """Test files smaller than the samples are inferred from every row."""
+        csv_file = tmp_path / "small.csv"
+        csv_file.write_text("a\n" + "1\n" * 20_000 + "x\n")
+
+        assert infer_schema_sampled(csv_file)["a"] == pl.String()
+
+    def test_parquet_raises_error(self, sample_parquet_file: Path) -> None:
+        """Test Parquet files are rejected; their schema is in the metadata."""
+        with pytest.raises(ValueError, match="applies to CSV and NDJSON"):
+            infer_schema_sampled(sample_parquet_file)
+
+    def test_missing_file_raises_error(self, tmp_path: Path) -> None:
+        """Test a missing input raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="Input file not found"):
+            infer_schema_sampled(tmp_path / "missing.ndjson")
+
+
+class TestCheckCsvHeader:
+    """Tests for the check_csv_header function."""
+
+    def test_matching_header(self, sample_csv_file: Path) -> None:
+        """Test a matching header passes."""
+        check_csv_header(sample_csv_file, pl.Schema({"name": pl.String(), "value": pl.Int64()}))
+
+    def test_mismatched_header_raises_error(self) -> None:
+        """Test a header with other names raises ValueError."""
+        with pytest.raises(ValueError, match="CSV header does not match the schema"):
+            check_csv_header(b"value,name\n1,a\n", pl.Schema({"name": pl.String(), "value": pl.Int64()}))
@@ -0,0 +1,62 @@
+"""Integration tests for the external sort module.
+
+These tests cover functions that spill to the filesystem.
+"""
+
+import polars as pl
+import pytest
+
+from parquet_lf.converters.sort import external_sort
+
+
+@pytest.fixture
+def shuffled_frame() -> pl.DataFrame:
+    """A frame with shuffled keys, repeated keys and nulls."""
+    rows = 20_000
+    return pl.DataFrame(
+        {
+            "group": pl.Series([None if i % 97 == 0 else i % 50 for i in range(rows)]).shuffle(seed=1),
+            "id": pl.int_range(rows, eager=True).shuffle(seed=2),
+            "label": [f"row{i}" for i in range(rows)],
+        }
+    )
+
+
+class TestExternalSort:
+    """Tests for the external_sort function."""
+
+    def test_spilled_sort_matches_in_memory_sort(self, shuffled_frame: pl.DataFrame) -> None:
+        """Test a budget far below the data size still sorts every row by all keys."""
+        with external_sort(shuffled_frame.lazy(), ["group", "id"], memory_budget=64 * 1024) as lf:
+            result = lf.collect()
+
+        assert result.equals(shuffled_frame.sort(["group", "id"]))
+
+    def test_in_memory_sort(self, shuffled_frame: pl.DataFrame) -> None:
+        """Test input within the budget is sorted without spilling."""
+        with external_sort(shuffled_frame.lazy(), ["id"], memory_budget=1024 * 1024 * 1024) as lf:
+            result = lf.collect()
+
+        assert result.equals(shuffled_frame.sort("id"))
+
+    def test_string_keys(self, shuffled_frame: pl.DataFrame) -> None:
+        """Test string keys are range partitioned in sort order."""
+        with external_sort(shuffled_frame.lazy(), ["label"], memory_budget=64 * 1024) as lf:
+            result = lf.collect()
+
+        assert result["label"].to_list() == sorted(shuffled_frame["label"].to_list())
+
+    def test_empty_input(self) -> None:
+        """Test empty input yields an empty frame with the schema."""
+        empty = pl.DataFrame(schema={"id": pl.Int64})
+
+        with external_sort(empty.lazy(), ["id"], memory_budget=1024) as lf:
+            result = lf.collect()
+
+        assert result.schema == empty.schema
+        assert result.is_empty()
+
+    def test_unknown_column(self, shuffled_frame: pl.DataFrame) -> None:
+        """Test sorting by a missing column raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown sort column"), external_sort(shuffled_frame.lazy(), ["x"], 1024):
+            pass
@@ -0,0 +1,39 @@
+"""Unit tests for the batch module.
+
+These tests cover pure logic functions without filesystem operations.
+"""
+
+from pathlib import Path
+
+from parquet_lf.batch import batch_output_path, threads_per_worker
+
+
+class TestBatchOutputPath:
+    """Tests for the batch_output_path function."""
+
+    def test_replaces_extension(self) -> None:
+        """Test the output keeps the input stem with the new extension."""
+        assert batch_output_path(Path("in/data.csv"), Path("out"), ".parquet") == Path("out/data.parquet")
+
+    def test_drops_input_directory(self) -> None:
+        """Test nested inputs are written directly into the output directory."""
+        assert batch_output_path(Path("/a/b/c/events.parquet"), Path("/out"), ".ndjson") == Path("/out/events.ndjson")
+
+
+class TestThreadsPerWorker:
+    """Tests for the threads_per_worker function."""
+
+    def test_divides_cpus_between_workers(self, monkeypatch) -> None:
+        """Test CPUs are split evenly between workers."""
+        monkeypatch.setattr("os.process_cpu_count", lambda: 8)
+        assert threads_per_worker(4) == 2
+
+    def test_at_least_one_thread(self, monkeypatch) -> None:
+        """Test more workers than CPUs still gives each worker one thread."""
+        monkeypatch.setattr("os.process_cpu_count", lambda: 2)
+        assert threads_per_worker(8) == 1
+
+    def test_unknown_cpu_count(self, monkeypatch) -> None:
+        """Test an unknown CPU count falls back to one thread."""
+        monkeypatch.setattr("os.process_cpu_count", lambda: None)
+        assert threads_per_worker(1) == 1
@@ -0,0 +1,83 @@
+"""Unit tests for the cache module.
+
+These tests cover cache location logic without filesystem operations.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from parquet_lf.cache import default_cache_dir, dump_file_info, load_file_info
+from parquet_lf.info import FileFormat, FileInfo
+from parquet_lf.parquet_footer import ColumnChunkMetadata, ColumnStatistics, ParquetFooter, RowGroupMetadata
+
+
+class TestDefaultCacheDir:
+    """Tests for the default_cache_dir function."""
+
+    def test_env_override(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test PARQUET_LF_CACHE_DIR takes precedence."""
+        monkeypatch.setenv("PARQUET_LF_CACHE_DIR", "/custom/cache")
+        monkeypatch.setenv("XDG_CACHE_HOME", "/xdg")
+
+        assert default_cache_dir() == Path("/custom/cache")
+
+    def test_xdg_cache_home(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test XDG_CACHE_HOME is used when set."""
+        monkeypatch.delenv("PARQUET_LF_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", "/xdg")
+
+        assert default_cache_dir() == Path("/xdg/parquet-lf")
+
+    def test_home_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test ~/.cache is used without environment overrides."""
+        monkeypatch.delenv("PARQUET_LF_CACHE_DIR", raising=False)
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+
+        assert default_cache_dir() == Path.home() / ".cache" / "parquet-lf"
+
+
+class TestFileInfoEncoding:
+    """Tests for the dump_file_info and load_file_info functions."""
+
+    def test_round_trip_with_footer(self) -> None:
+        """Test FileInfo with footer statistics survives encoding unchanged."""
+        column = ColumnChunkMetadata(
+            path="id",
+            physical_type="INT64",
+            codec="ZSTD",
+            encodings=["PLAIN", "RLE"],
+            num_values=3,
+            compressed_size=40,
+            uncompressed_size=60,
+            statistics=ColumnStatistics(min_value=b"\x01\x00", max_value=None, null_count=0),
+        )
+        footer = ParquetFooter(
+            num_rows=3,
+            schema={"id": "Int64"},
+            row_groups=[RowGroupMetadata(num_rows=3, compressed_size=40, uncompressed_size=60, columns=[column])],
+            created_by="polars",
+        )
+        info = FileInfo(
+            path=Path("data.parquet"),
+            format=FileFormat.PARQUET,
+            size_bytes=100,
+            row_count=3,
+            column_count=1,
+            schema={"id": "Int64"},
+            parquet_footer=footer,
+        )
+
+        assert load_file_info(dump_file_info(info), Path("data.parquet")) == info
+
+    def test_path_taken_from_caller(self) -> None:
+        """Test the decoded entry describes the path it was looked up under."""
+        info = FileInfo(path=Path("a.csv"), format=FileFormat.CSV, size_bytes=8, row_count=1, column_count=2, schema={})
+
+        assert load_file_info(dump_file_info(info), Path("b.csv")).path == Path("b.csv")
+
+    @pytest.mark.parametrize("text", [b"\x80\x04K\x01.", "{}", "[]", '{"format": "xlsx"}'])
+    def test_malformed_entry_raises_error(self, text: str | bytes) -> None:
+        """Test entries that are not valid JSON FileInfo raise ValueError."""
+        with pytest.raises(ValueError):
+            load_file_info(text, Path("a.csv"))
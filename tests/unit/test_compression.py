@@ -0,0 +1,163 @@
+"""Unit tests for the compression module."""
+
+import bz2
+import gzip
+import io
+import os
+from pathlib import Path
+
+import polars as pl
+import pytest
+import zstandard
+
+from parquet_lf.converters.compression import (
+    InputCompression,
+    OutputCompression,
+    ParallelCompressor,
+    decompress_stream,
+    infer_output_compression,
+    sniff_compression,
+    strip_compression_suffix,
+)
+
+
+class TestStripCompressionSuffix:
+    """Tests for the strip_compression_suffix function."""
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("data.csv.gz", "data.csv"),
+            ("data.ndjson.zst", "data.ndjson"),
+            ("data.jsonl.BZ2", "data.jsonl"),
+            ("data.csv", "data.csv"),
+            ("archive.tar", "archive.tar"),
+        ],
+    )
+    def test_strip(self, path: str, expected: str) -> None:
+        """Test only a compression extension is removed."""
+        assert strip_compression_suffix(Path(path)) == Path(expected)
+
+
+class TestSniffCompression:
+    """Tests for the sniff_compression function."""
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            (gzip.compress(b"a,b\n"), InputCompression.GZIP),
+            (bz2.compress(b"a,b\n"), InputCompression.BZIP2),
+            (b"\x28\xb5\x2f\xfd\x00", InputCompression.ZSTD),
+            (b"a,b\n1,2\n", None),
+            (b"", None),
+        ],
+    )
+    def test_sniff(self, data: bytes, expected: InputCompression | None) -> None:
+        """Test formats are recognized from their magic bytes."""
+        assert sniff_compression(data) == expected
+
+
+class TestDecompressStream:
+    """Tests for the decompress_stream function."""
+
+    @pytest.mark.parametrize(
+        ("compress", "compression"),
+        [
+            (gzip.compress, InputCompression.GZIP),
+            (bz2.compress, InputCompression.BZIP2),
+            (zstandard.compress, InputCompression.ZSTD),
+        ],
+    )
+    def test_roundtrip(self, compress, compression: InputCompression) -> None:
+        """Test the stream yields the original bytes."""
+        stream = decompress_stream(io.BytesIO(compress(b"x\n" * 1000)), compression)
+
+        assert stream.read() == b"x\n" * 1000
+
+    def test_zstd_concatenated_frames(self) -> None:
+        """Test concatenated zstd frames decompress as one stream."""
+        source = io.BytesIO(zstandard.compress(b"a,b\n") + zstandard.compress(b"1,2\n"))
+
+        assert decompress_stream(source, InputCompression.ZSTD).read() == b"a,b\n1,2\n"
+
+    def test_zstd_streamed(self) -> None:
+        """Test zstd is decompressed incrementally, reading only part of the source for a small read."""
+        # Random bytes do not compress, so the compressed stream is as large as the data
+        compressed = zstandard.compress(os.urandom(4 * 1024 * 1024))
+        source = io.BytesIO(compressed)
+
+        assert len(decompress_stream(source, InputCompression.ZSTD).read(10)) == 10
+        assert source.tell() < len(compressed) // 4
+
+    def test_source_left_open(self) -> None:
+        """Test closing the decompressed stream does not close the source."""
+        source = io.BytesIO(zstandard.compress(b"x\n"))
+
+        decompress_stream(source, InputCompression.ZSTD).close()
+
+        assert not source.closed
+
+
+class TestInferOutputCompression:
+    """Tests for the infer_output_compression function."""
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("out.csv.gz", OutputCompression.GZIP),
+            ("out.csv.zst", OutputCompression.ZSTD),
+            ("out.ndjson.bz2", OutputCompression.BZIP2),
+            ("out.csv", None),
+        ],
+    )
+    def test_infer(self, path: str, expected: OutputCompression | None) -> None:
+        """Test the compression follows the extension."""
+        assert infer_output_compression(Path(path)) == expected
+
+
+class TestParallelCompressor:
+    """Tests for the ParallelCompressor class."""
+
+    @pytest.mark.parametrize(
+        ("compression", "decompress"),
+        [
+            (OutputCompression.GZIP, gzip.decompress),
+            (OutputCompression.BZIP2, bz2.decompress),
+            (OutputCompression.ZSTD, lambda data: decompress_stream(io.BytesIO(data), InputCompression.ZSTD).read()),
+        ],
+    )
+    def test_blocks_decompress_in_order(self, compression: OutputCompression, decompress) -> None:
+        """Test many blocks compressed in parallel decompress to the written bytes in order."""
+        data = b"".join(f"{i},row\n".encode() for i in range(5000))
+        sink = io.BytesIO()
+
+        with ParallelCompressor(sink, compression, workers=4, block_size=1000) as compressor:
+            for start in range(0, len(data), 777):
+                compressor.write(data[start : start + 777])
+
+        assert decompress(sink.getvalue()) == data
+
+    def test_workers_follow_polars_threads(self) -> None:
+        """Test the default pool shares the thread budget polars was given."""
+        with ParallelCompressor(io.BytesIO(), OutputCompression.GZIP) as compressor:
+            assert compressor.workers == pl.thread_pool_size()
+
+    def test_empty_output_is_valid(self) -> None:
+        """Test writing nothing still produces a valid compressed stream."""
+        sink = io.BytesIO()
+
+        with ParallelCompressor(sink, OutputCompression.GZIP):
+            pass
+
+        assert gzip.decompress(sink.getvalue()) == b""
+
+    def test_failure_discards_pending_data(self) -> None:
+        """Test nothing more is written when the body raises."""
+        sink = io.BytesIO()
+
+        with pytest.raises(RuntimeError), ParallelCompressor(sink, OutputCompression.GZIP) as compressor:
+            compressor.write(b"partial")
+            raise RuntimeError("boom")
+
+        assert sink.getvalue() == b""
+        assert compressor.closed
@@ -0,0 +1,117 @@
+"""Unit tests for the converters base module.
+
+These tests cover pure logic functions without filesystem operations.
+"""
+
+import polars as pl
+import pytest
+
+from parquet_lf.converters.base import (
+    AUTO_MAX_ROW_GROUP_SIZE,
+    AUTO_MIN_ROW_GROUP_SIZE,
+    ParquetCompression,
+    ParquetReadOptions,
+    ParquetWriteOptions,
+    auto_row_group_size,
+    select_columns,
+)
+
+
+class TestAutoRowGroupSize:
+    """Tests for the auto_row_group_size function."""
+
+    def test_narrow_table_capped_at_maximum(self) -> None:
+        """Test a narrow table on a large input uses the maximum size."""
+        assert auto_row_group_size(1, input_bytes=100 * 1024**3) == AUTO_MAX_ROW_GROUP_SIZE
+
+    def test_wide_table_gets_fewer_rows(self) -> None:
+        """Test wider tables get fewer rows per row group."""
+        assert auto_row_group_size(200) < auto_row_group_size(20)
+
+    def test_small_input_split_into_several_groups(self) -> None:
+        """Test a mid-sized input is split into several row groups."""
+        input_bytes = 64 * 1024 * 1024
+        rows = auto_row_group_size(10, input_bytes=input_bytes)
+
+        assert input_bytes // (10 * 8) // rows >= 4
+
+    def test_tiny_input_uses_minimum(self) -> None:
+        """Test tiny inputs never go below the minimum size."""
+        assert auto_row_group_size(5, input_bytes=1024) == AUTO_MIN_ROW_GROUP_SIZE
+
+    def test_zero_columns(self) -> None:
+        """Test a table without columns does not divide by zero."""
+        assert auto_row_group_size(0) == AUTO_MAX_ROW_GROUP_SIZE
+
+
+class TestParquetWriteOptions:
+    """Tests for the ParquetWriteOptions dataclass."""
+
+    def test_defaults(self) -> None:
+        """Test default options use zstd without a level."""
+        options = ParquetWriteOptions()
+
+        assert options.compression == ParquetCompression.ZSTD
+        assert options.compression_level is None
+        assert options.row_group_size is None
+
+    def test_level_allowed_for_zstd(self) -> None:
+        """Test a compression level is accepted for zstd."""
+        assert ParquetWriteOptions(compression_level=9).compression_level == 9
+
+    def test_level_rejected_for_snappy(self) -> None:
+        """Test a compression level is rejected for snappy."""
+        with pytest.raises(ValueError, match="not supported for snappy"):
+            ParquetWriteOptions(compression=ParquetCompression.SNAPPY, compression_level=3)
+
+
+class TestParquetReadOptions:
+    """Tests for the ParquetReadOptions dataclass."""
+
+    def test_defaults_read_every_column(self) -> None:
+        """Test default options select no projection."""
+        options = ParquetReadOptions()
+
+        assert options.columns is None
+        assert options.exclude is None
+
+    def test_columns_and_exclude_rejected(self) -> None:
+        """Test columns and exclude cannot be combined."""
+        with pytest.raises(ValueError, match="cannot be combined"):
+            ParquetReadOptions(columns=["a"], exclude=["b"])
+
+    def test_negative_offset_rejected(self) -> None:
+        """Test a negative offset raises ValueError."""
+        with pytest.raises(ValueError, match="must not be negative"):
+            ParquetReadOptions(offset=-1)
+
+
+class TestSelectColumns:
+    """Tests for the select_columns function."""
+
+    @pytest.fixture
+    def lf(self) -> pl.LazyFrame:
+        """Create a three-column LazyFrame."""
+        return pl.LazyFrame({"a": [1], "b": [2], "c": [3]})
+
+    def test_no_selection_keeps_all(self, lf: pl.LazyFrame) -> None:
+        """Test no columns or exclusions returns every column."""
+        assert select_columns(lf).collect_schema().names() == ["a", "b", "c"]
+
+    def test_columns_in_given_order(self, lf: pl.LazyFrame) -> None:
+        """Test selected columns come out in the requested order."""
+        assert select_columns(lf, columns=["c", "a"]).collect_schema().names() == ["c", "a"]
+
+    def test_exclude_keeps_file_order(self, lf: pl.LazyFrame) -> None:
+        """Test excluded columns are dropped and the rest keep their order."""
+        assert select_columns(lf, exclude=["b"]).collect_schema().names() == ["a", "c"]
+
+    def test_unknown_column_rejected(self, lf: pl.LazyFrame) -> None:
+        """Test naming a missing column raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown column\\(s\\): x, y"):
+            select_columns(lf, columns=["a", "x", "y"])
+
+    def test_excluding_everything_rejected(self, lf: pl.LazyFrame) -> None:
+        """Test excluding every column raises ValueError."""
+        with pytest.raises(ValueError, match="No columns selected"):
+            select_columns(lf, exclude=["a", "b", "c"])
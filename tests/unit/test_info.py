@@ -5,6 +5,7 @@ These tests cover pure logic functions without filesystem operations.
 
 from pathlib import Path
 
+import polars as pl
 import pytest
 
 from parquet_lf.info import (
@@ -17,6 +18,7 @@ from parquet_lf.info import (
     format_file_info,
     format_size,
 )
+from parquet_lf.parquet_footer import ColumnChunkMetadata, ParquetFooter, RowGroupMetadata
 
 
 class TestDetectFormat:
@@ -68,6 +70,23 @@ class TestDetectFormat:
         """Test path with directory components."""
         assert detect_format(Path("/some/dir/test.parquet")) == FileFormat.PARQUET
 
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("test.csv.gz", FileFormat.CSV),
+            ("test.ndjson.zst", FileFormat.NDJSON),
+            ("test.JSONL.BZ2", FileFormat.NDJSON),
+        ],
+    )
+    def test_compression_extension_skipped(self, name: str, expected: FileFormat) -> None:
+        """Test the format is detected from the extension before a compression extension."""
+        assert detect_format(Path(name)) == expected
+
+    def test_unknown_extension_before_compression_raises_value_error(self) -> None:
+        """Test the extension before a compression extension is reported when unsupported."""
+        with pytest.raises(ValueError, match="Unsupported file extension: .txt"):
+            detect_format(Path("test.txt.gz"))
+
 
 class TestFormatSize:
     """Tests for the format_size function."""
@@ -174,6 +193,35 @@ class TestFormatFileInfo:
 
         assert "Format: Ndjson" in output
 
+    def test_approximate_row_count(self) -> None:
+        """Test an estimated row count is marked with its error bound."""
+        info = FileInfo(
+            path=Path("test.csv"),
+            format=FileFormat.CSV,
+            size_bytes=500,
+            row_count=1000,
+            column_count=1,
+            schema={"a": "Int64"},
+            row_count_error=25,
+        )
+        output = format_file_info(info)
+
+        assert "Rows: ~1000 (±25)" in output
+
+    def test_preview_after_offset(self) -> None:
+        """Test a preview after an offset names where it starts."""
+        info = FileInfo(
+            path=Path("test.parquet"),
+            format=FileFormat.PARQUET,
+            size_bytes=1024,
+            row_count=100,
+            column_count=1,
+            schema={"id": "Int64"},
+        )
+        output = format_file_info(info, preview=pl.DataFrame({"id": [50, 51]}), preview_offset=50)
+
+        assert "Preview (2 rows from offset 50):" in output
+
     def test_no_preview_section_when_none(self) -> None:
         """Test no preview section when preview is None."""
         info = FileInfo(
@@ -204,6 +252,55 @@ class TestFormatFileInfo:
         assert "Columns: 0" in output
         assert "Schema:" in output
 
+    def test_parquet_layout_section(self) -> None:
+        """Test Parquet row groups, codecs and encodings are displayed."""
+        column = ColumnChunkMetadata(
+            path="id",
+            physical_type="INT64",
+            codec="ZSTD",
+            encodings=["PLAIN", "RLE"],
+            num_values=10,
+            compressed_size=100,
+            uncompressed_size=2048,
+            statistics=None,
+        )
+        footer = ParquetFooter(
+            num_rows=10,
+            schema={"id": "Int64"},
+            row_groups=[RowGroupMetadata(num_rows=10, compressed_size=100, uncompressed_size=2048, columns=[column])],
+            created_by=None,
+        )
+        info = FileInfo(
+            path=Path("test.parquet"),
+            format=FileFormat.PARQUET,
+            size_bytes=1024,
+            row_count=10,
+            column_count=1,
+            schema={"id": "Int64"},
+            parquet_footer=footer,
+        )
+        output = format_file_info(info)
+
+        assert "Row groups: 1" in output
+        assert "Compression: ZSTD" in output
+        assert "  0: 10 rows, 100 B (2.0 KB uncompressed)" in output
+        assert "  id: PLAIN, RLE" in output
+
+    def test_no_parquet_layout_for_csv(self) -> None:
+        """Test the Parquet layout section is omitted for other formats."""
+        info = FileInfo(
+            path=Path("test.csv"),
+            format=FileFormat.CSV,
+            size_bytes=500,
+            row_count=10,
+            column_count=1,
+            schema={"a": "Int64"},
+        )
+        output = format_file_info(info)
+
+        assert "Row groups" not in output
+        assert "Encodings" not in output
+
 
 class TestFileFormat:
     """Tests for the FileFormat enum."""
@@ -0,0 +1,52 @@
+"""Unit tests for the Parquet footer module.
+
+These tests cover the Thrift decoder without filesystem operations.
+"""
+
+import pytest
+
+from parquet_lf.parquet_footer import _CompactReader
+
+
+class TestCompactReader:
+    """Tests for the Thrift compact protocol decoder."""
+
+    def test_varint(self) -> None:
+        """Test multi-byte varints are decoded."""
+        assert _CompactReader(bytes([0xAC, 0x02])).read_varint() == 300
+
+    def test_zigzag_negative(self) -> None:
+        """Test zigzag encoding maps odd values to negatives."""
+        assert _CompactReader(bytes([0x03])).read_zigzag() == -2
+
+    def test_struct_with_field_deltas(self) -> None:
+        """Test struct fields use short-form id deltas."""
+        # field 1: i32 = 5 (zigzag 10), field 3: binary "ab", field 4: bool true, stop
+        data = bytes([0x15, 0x0A, 0x28, 0x02]) + b"ab" + bytes([0x11, 0x00])
+
+        assert _CompactReader(data).read_struct() == {1: 5, 3: b"ab", 4: True}
+
+    def test_struct_with_long_field_id(self) -> None:
+        """Test field ids that do not fit a delta are read as zigzag varints."""
+        # field 20 (delta 0, zigzag 40): i64 = 1, stop
+        data = bytes([0x06, 0x28, 0x02, 0x00])
+
+        assert _CompactReader(data).read_struct() == {20: 1}
+
+    def test_list_of_structs(self) -> None:
+        """Test lists with an element count in the header nibble."""
+        # list of 2 structs, each {1: i32 = 1}
+        data = bytes([0x2C, 0x15, 0x02, 0x00, 0x15, 0x02, 0x00])
+
+        assert _CompactReader(data).read_list() == [{1: 1}, {1: 1}]
+
+    def test_long_list(self) -> None:
+        """Test lists with 15 or more elements carry a varint size."""
+        data = bytes([0xF5, 20]) + bytes([0x02] * 20)
+
+        assert _CompactReader(data).read_list() == [1] * 20
+
+    def test_unknown_type_raises_error(self) -> None:
+        """Test an unknown type code raises ValueError."""
+        with pytest.raises(ValueError, match="unknown Thrift type"):
+            _CompactReader(b"").read_value(13)
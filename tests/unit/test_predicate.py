@@ -0,0 +1,162 @@
+"""Unit tests for the predicate module.
+
+These tests cover pure logic functions without filesystem operations.
+"""
+
+import datetime
+import struct
+
+import polars as pl
+import pytest
+
+from parquet_lf.parquet_footer import ColumnChunkMetadata, ColumnStatistics, ParquetFooter, RowGroupMetadata
+from parquet_lf.predicate import parse_where, prune_row_groups
+
+
+def _int_chunk(path: str, low: int, high: int, null_count: int = 0) -> ColumnChunkMetadata:
+    """Build INT64 column chunk metadata with min/max statistics."""
+    return ColumnChunkMetadata(
+        path=path,
+        physical_type="INT64",
+        codec="ZSTD",
+        encodings=["PLAIN"],
+        num_values=10,
+        compressed_size=80,
+        uncompressed_size=80,
+        statistics=ColumnStatistics(
+            min_value=struct.pack("<q", low), max_value=struct.pack("<q", high), null_count=null_count
+        ),
+    )
+
+
+def _string_chunk(path: str, low: str, high: str) -> ColumnChunkMetadata:
+    """Build BYTE_ARRAY column chunk metadata with min/max statistics."""
+    return ColumnChunkMetadata(
+        path=path,
+        physical_type="BYTE_ARRAY",
+        codec="ZSTD",
+        encodings=["PLAIN"],
+        num_values=10,
+        compressed_size=80,
+        uncompressed_size=80,
+        statistics=ColumnStatistics(min_value=low.encode(), max_value=high.encode(), null_count=0),
+    )
+
+
+@pytest.fixture
+def footer() -> ParquetFooter:
+    """Three row groups with ids 0-9, 10-19 and 20-29 and one region each."""
+    row_groups = [
+        RowGroupMetadata(
+            num_rows=10,
+            compressed_size=160,
+            uncompressed_size=160,
+            columns=[_int_chunk("id", start, start + 9), _string_chunk("region", region, region)],
+        )
+        for start, region in [(0, "eu"), (10, "us"), (20, "eu")]
+    ]
+    return ParquetFooter(
+        num_rows=30, schema={"id": "Int64", "region": "String"}, row_groups=row_groups, created_by=None
+    )
+
+
+class TestParseWhere:
+    """Tests for the parse_where function."""
+
+    @pytest.fixture
+    def df(self) -> pl.DataFrame:
+        """Create a small DataFrame to filter."""
+        return pl.DataFrame(
+            {
+                "id": [1, 2, 3, None],
+                "region": ["eu", "us", "eu", "us"],
+                "day": [datetime.date(2024, 1, d) for d in (1, 2, 3, 4)],
+                "unit price": [1.5, 2.5, 3.5, 4.5],
+            }
+        )
+
+    @pytest.mark.parametrize(
+        ("where", "expected_days"),
+        [
+            ("id == 2", [2]),
+            ("id >= 2 and region == 'eu'", [3]),
+            ("region == 'us' or id == 1", [1, 2, 4]),
+            ("not region == 'eu'", [2, 4]),
+            ("1 < id <= 3", [2, 3]),
+            ("id in [1, 3]", [1, 3]),
+            ("region not in ['eu']", [2, 4]),
+            ("id is None", [4]),
+            ("id * 2 > 4", [3]),
+            ("day >= date('2024-01-03')", [3, 4]),
+            ("col('unit price') < 3", [1, 2]),
+            ("id > -1", [1, 2, 3]),
+        ],
+    )
+    def test_filters_rows(self, df: pl.DataFrame, where: str, expected_days: list[int]) -> None:
+        """Test supported expressions select the expected rows."""
+        result = df.filter(parse_where(where))
+
+        assert [day.day for day in result["day"]] == expected_days
+
+    @pytest.mark.parametrize(
+        ("where", "message"),
+        [
+            ("id ==", "Invalid filter expression"),
+            ("__import__('os')", "Unknown function"),
+            ("id in 5", "needs a list"),
+            ("id is 5", "only compare to None"),
+            ("date('yesterday') == day", "Invalid date"),
+            ("[x for x in id]", "Unsupported expression"),
+            ("id == ...", "Unsupported expression"),
+            ("name == b'x'", "Unsupported expression"),
+            ("id == 1j", "Unsupported expression"),
+            ("id in [1, ...]", "Unsupported expression"),
+        ],
+    )
+    def test_invalid_expression_raises_error(self, where: str, message: str) -> None:
+        """Test unsupported or malformed expressions raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            parse_where(where)
+
+
+class TestPruneRowGroups:
+    """Tests for the prune_row_groups function."""
+
+    @pytest.mark.parametrize(
+        ("where", "pruned"),
+        [
+            ("id == 15", 2),
+            ("15 == id", 2),
+            ("id < 10", 2),
+            ("id >= 10", 1),
+            ("id in [5, 25]", 1),
+            ("region == 'us'", 2),
+            ("region == 'eu' and id > 15", 2),
+            ("id == 5 or id == 25", 1),
+            ("0 < id < 5", 2),
+            ("id is None", 3),
+            ("id is not None", 0),
+        ],
+    )
+    def test_statistics_exclude_row_groups(self, footer: ParquetFooter, where: str, pruned: int) -> None:
+        """Test row groups whose min/max rule out the filter are counted."""
+        assert prune_row_groups(footer, where).pruned == pruned
+
+    @pytest.mark.parametrize(
+        "where",
+        ["not id == 15", "id != 15", "id * 2 == 15", "missing == 1", "id == 'text'", "region > date('2024-01-01')"],
+    )
+    def test_undecidable_filters_prune_nothing(self, footer: ParquetFooter, where: str) -> None:
+        """Test filters the statistics cannot decide keep every row group."""
+        result = prune_row_groups(footer, where)
+
+        assert result.total == 3
+        assert result.pruned == 0
+
+    def test_missing_statistics_prune_nothing(self, footer: ParquetFooter) -> None:
+        """Test row groups without statistics are never pruned."""
+        for row_group in footer.row_groups:
+            for column in row_group.columns:
+                column.statistics = None
+
+        assert prune_row_groups(footer, "id == 100").pruned == 0
@@ -0,0 +1,83 @@
+"""Unit tests for the sample module.
+
+These tests cover pure logic functions without filesystem operations.
+"""
+
+import pytest
+
+from parquet_lf.sample import plan_sample, sample_size
+
+
+class TestSampleSize:
+    """Tests for the sample_size function."""
+
+    def test_fixed_rows(self) -> None:
+        """Test a fixed number of rows is used as given."""
+        assert sample_size(1000, rows=10) == 10
+
+    def test_fixed_rows_capped_at_total(self) -> None:
+        """Test asking for more rows than exist samples every row."""
+        assert sample_size(5, rows=10) == 5
+
+    def test_fraction_rounds_to_rows(self) -> None:
+        """Test a fraction is rounded to whole rows."""
+        assert sample_size(1_000_000, fraction=0.001) == 1000
+        assert sample_size(10, fraction=0.26) == 3
+
+    @pytest.mark.parametrize(("rows", "fraction"), [(None, None), (10, 0.5)])
+    def test_exactly_one_of_rows_and_fraction(self, rows: int | None, fraction: float | None) -> None:
+        """Test giving neither or both of rows and fraction raises ValueError."""
+        with pytest.raises(ValueError, match="either"):
+            sample_size(100, rows=rows, fraction=fraction)
+
+    @pytest.mark.parametrize("fraction", [-0.1, 1.5])
+    def test_fraction_out_of_range(self, fraction: float) -> None:
+        """Test a fraction outside 0-1 raises ValueError."""
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            sample_size(100, fraction=fraction)
+
+
+class TestPlanSample:
+    """Tests for the plan_sample function."""
+
+    def test_chooses_requested_number_of_rows(self) -> None:
+        """Test the plan holds exactly the requested number of rows."""
+        plan = plan_sample([100, 100, 100], 50, seed=1)
+
+        assert sum(len(positions) for positions in plan.values()) == 50
+
+    def test_positions_sorted_within_row_groups(self) -> None:
+        """Test positions are sorted, distinct and inside their row group."""
+        row_counts = [10, 3, 7]
+        plan = plan_sample(row_counts, 15, seed=2)
+
+        for group, positions in plan.items():
+            assert positions == sorted(set(positions))
+            assert all(0 <= position < row_counts[group] for position in positions)
+
+    def test_same_seed_same_plan(self) -> None:
+        """Test a seed makes the plan reproducible."""
+        assert plan_sample([1000] * 10, 20, seed=42) == plan_sample([1000] * 10, 20, seed=42)
+
+    def test_all_rows_when_size_exceeds_total(self) -> None:
+        """Test a size beyond the total chooses every row."""
+        assert plan_sample([2, 0, 3], 10, seed=1) == {0: [0, 1], 2: [0, 1, 2]}
+
+    def test_empty_row_groups_never_chosen(self) -> None:
+        """Test row groups without rows never appear in the plan."""
+        assert 1 not in plan_sample([5, 0, 5], 10, seed=3)
+
+    def test_no_row_groups(self) -> None:
+        """Test a file without row groups yields an empty plan."""
+        assert plan_sample([], 5) == {}
+
+    def test_by_row_group_reads_few_groups(self) -> None:
+        """Test sampling by row group picks only as many groups as needed."""
+        plan = plan_sample([1000] * 100, 1500, seed=7, by_row_group=True)
+
+        assert len(plan) == 2
+        assert sum(len(positions) for positions in plan.values()) == 1500
+
+    def test_uniform_sample_spreads_over_groups(self) -> None:
+        """Test the default sample draws from many row groups."""
+        assert len(plan_sample([1000] * 100, 1500, seed=7)) > 50
@@ -0,0 +1,120 @@
+"""Unit tests for the schema module.
+
+These tests cover data type parsing without filesystem operations.
+"""
+
+import polars as pl
+import pytest
+
+from parquet_lf.schema import _merge_schemas, categorical_schema, parse_dtype, schema_to_json
+
+
+class TestParseDtype:
+    """Tests for the parse_dtype function."""
+
+    @pytest.mark.parametrize(
+        "dtype",
+        [
+            pl.Int64(),
+            pl.String(),
+            pl.Boolean(),
+            pl.Date(),
+            pl.Datetime("us", "UTC"),
+            pl.Duration("ns"),
+            pl.Decimal(10, 2),
+            pl.List(pl.Int64),
+            pl.Array(pl.Int32, 3),
+            pl.Struct({"a": pl.List(pl.String), "b": pl.Float32}),
+            pl.Enum(["low", "high"]),
+        ],
+    )
+    def test_roundtrips_polars_repr(self, dtype: pl.DataType) -> None:
+        """Test the string polars prints for a dtype parses back to it."""
+        assert parse_dtype(str(dtype)) == dtype
+
+    def test_surrounding_whitespace(self) -> None:
+        """Test surrounding whitespace is ignored."""
+        assert parse_dtype("  Int32 ") == pl.Int32()
+
+    def test_unknown_type_raises_error(self) -> None:
+        """Test an unknown name raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown data type: Int65"):
+            parse_dtype("Int65")
+
+    def test_code_is_not_evaluated(self) -> None:
+        """Test names other than polars data types are rejected."""
+        with pytest.raises(ValueError, match="Unknown data type: __import__"):
+            parse_dtype("__import__('os')")
+
+    def test_expressions_are_rejected(self) -> None:
+        """Test operators are not evaluated."""
+        with pytest.raises(ValueError, match="Unsupported expression"):
+            parse_dtype("Array(Int32, shape=1 + 2)")
+
+    def test_syntax_error_raises_value_error(self) -> None:
+        """Test malformed strings raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid data type"):
+            parse_dtype("List(Int64")
+
+
+class TestSchemaToJson:
+    """Tests for the schema_to_json function."""
+
+    def test_roundtrips_through_parse_dtype(self) -> None:
+        """Test serialized types parse back to the same schema."""
+        schema = pl.Schema({"id": pl.Int64(), "tags": pl.List(pl.String)})
+
+        output = schema_to_json(schema)
+
+        assert '"tags": "List(String)"' in output
+        assert output.index('"id"') < output.index('"tags"')
+
+
+class TestMergeSchemas:
+    """Tests for the _merge_schemas function."""
+
+    def test_widens_to_supertype(self) -> None:
+        """Test differing types widen the way full inference would."""
+        merged = _merge_schemas(
+            [
+                pl.Schema({"a": pl.Int64(), "b": pl.Null(), "c": pl.Int64()}),
+                pl.Schema({"a": pl.Float64(), "b": pl.Boolean(), "c": pl.String()}),
+            ]
+        )
+
+        assert merged == pl.Schema({"a": pl.Float64(), "b": pl.Boolean(), "c": pl.String()})
+
+    def test_keeps_first_seen_column_order(self) -> None:
+        """Test columns only present in later samples are appended."""
+        merged = _merge_schemas([pl.Schema({"b": pl.Int64()}), pl.Schema({"a": pl.Int64(), "b": pl.Int64()})])
+
+        assert merged.names() == ["b", "a"]
+
+
+class TestCategoricalSchema:
+    """Tests for the categorical_schema function."""
+
+    def test_marks_low_cardinality_strings(self) -> None:
+        """Test only string columns with few distinct values become Categorical."""
+        sample = pl.DataFrame(
+            {"city": ["Oslo", "Lima"] * 50, "name": [f"n{i}" for i in range(100)], "code": [1, 2] * 50}
+        )
+
+        schema = categorical_schema(sample, 0.05)
+
+        assert schema == pl.Schema({"city": pl.Categorical(), "name": pl.String(), "code": pl.Int64()})
+
+    def test_ratio_ignores_nulls(self) -> None:
+        """Test the distinct ratio is taken over non-null values only."""
+        sample = pl.DataFrame(
+            {"sparse": ["x"] + [None] * 9, "empty": [None] * 10}, schema={"sparse": pl.String, "empty": pl.String}
+        )
+
+        assert categorical_schema(sample, 0.5) == sample.schema
+
+    def test_updates_given_schema(self) -> None:
+        """Test an explicit schema keeps its own types and only String columns change."""
+        sample = pl.DataFrame({"id": [1, 1, 1, 1], "tag": ["a", "a", "a", "a"]})
+        schema = pl.Schema({"id": pl.Int8(), "tag": pl.String()})
+
+        assert categorical_schema(sample, 0.5, schema) == pl.Schema({"id": pl.Int8(), "tag": pl.Categorical()})
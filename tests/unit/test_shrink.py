@@ -0,0 +1,64 @@
+"""Unit tests for the numeric type narrowing module."""
+
+import polars as pl
+import pytest
+
+from parquet_lf.converters.shrink import plan_shrinkage, smallest_integer_type
+
+
+class TestSmallestIntegerType:
+    """Tests for the smallest_integer_type function."""
+
+    @pytest.mark.parametrize(
+        ("low", "high", "expected"),
+        [
+            (0, 1, pl.Int8()),
+            (-128, 127, pl.Int8()),
+            (-129, 0, pl.Int16()),
+            (0, 40_000, pl.Int32()),
+            (0, 2**31, pl.Int64()),
+        ],
+    )
+    def test_signed_ranges(self, low: int, high: int, expected: pl.DataType) -> None:
+        """Test the narrowest signed type holding the range is chosen."""
+        assert smallest_integer_type(pl.Int64(), low, high) == expected
+
+    def test_keeps_unsigned(self) -> None:
+        """Test unsigned columns stay unsigned."""
+        assert smallest_integer_type(pl.UInt64(), 0, 255) == pl.UInt8()
+
+    def test_never_widens(self) -> None:
+        """Test a type already narrower than the candidates is kept."""
+        assert smallest_integer_type(pl.Int16(), -1000, 1000) == pl.Int16()
+
+    def test_column_without_values(self) -> None:
+        """Test an all-null column narrows to the smallest type."""
+        assert smallest_integer_type(pl.Int64(), None, None) == pl.Int8()
+
+
+class TestPlanShrinkage:
+    """Tests for the plan_shrinkage function."""
+
+    def test_narrows_numeric_columns(self) -> None:
+        """Test integers narrow to their range and exact floats to Float32."""
+        lf = pl.LazyFrame(
+            {
+                "flag": [0, 1, None],
+                "big": [0, 2**40, 1],
+                "half": [0.5, float("nan"), None],
+                "tenth": [0.1, 0.2, 0.3],
+                "name": ["a", "b", "c"],
+            }
+        )
+
+        shrinkage = plan_shrinkage(lf)
+
+        assert shrinkage.dtypes == {"flag": pl.Int8(), "half": pl.Float32()}
+        assert (shrinkage.rows, shrinkage.memory_before, shrinkage.memory_after) == (3, 96, 63)
+
+    def test_no_numeric_columns(self) -> None:
+        """Test frames without numeric columns need no casts."""
+        shrinkage = plan_shrinkage(pl.LazyFrame({"name": ["a"]}))
+
+        assert shrinkage.dtypes == {}
+        assert shrinkage.memory_before == shrinkage.memory_after == 0
@@ -0,0 +1,29 @@
+"""Unit tests for the external sort module."""
+
+import polars as pl
+
+from parquet_lf.converters.sort import choose_boundaries
+
+
+class TestChooseBoundaries:
+    """Tests for the choose_boundaries function."""
+
+    def test_even_split(self) -> None:
+        """Test boundaries split the samples into equal parts."""
+        assert choose_boundaries(pl.Series(range(100)), 4) == [25, 50, 75]
+
+    def test_unsorted_samples_with_nulls(self) -> None:
+        """Test samples are sorted and nulls ignored."""
+        assert choose_boundaries(pl.Series([9, None, 1, 5, 3, None, 7]), 2) == [5]
+
+    def test_repeated_keys_deduplicated(self) -> None:
+        """Test repeated keys give fewer, distinct boundaries."""
+        assert choose_boundaries(pl.Series([1] * 90 + [2] * 10), 4) == [1]
+
+    def test_single_partition(self) -> None:
+        """Test one partition needs no boundaries."""
+        assert choose_boundaries(pl.Series([3, 1, 2]), 1) == []
+
+    def test_only_nulls(self) -> None:
+        """Test all-null samples give no boundaries."""
+        assert choose_boundaries(pl.Series([None, None], dtype=pl.Int64), 3) == []
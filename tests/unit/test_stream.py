@@ -0,0 +1,76 @@
+"""Unit tests for the incremental stream parsing module."""
+
+import io
+
+import polars as pl
+
+from parquet_lf.converters.stream import iter_record_chunks, scan_csv_stream, scan_ndjson_stream
+
+
+class TestIterRecordChunks:
+    """Tests for the iter_record_chunks function."""
+
+    def test_chunks_end_on_newlines(self) -> None:
+        """Test every chunk ends on a line boundary."""
+        source = io.BytesIO(b"a\nbb\nccc\ndddd\n")
+
+        chunks = list(iter_record_chunks(source, chunk_size=4))
+
+        assert b"".join(chunks) == b"a\nbb\nccc\ndddd\n"
+        assert all(chunk.endswith(b"\n") for chunk in chunks)
+
+    def test_trailing_record_without_newline(self) -> None:
+        """Test a final record without a newline is still yielded."""
+        chunks = list(iter_record_chunks(io.BytesIO(b"a\nb"), chunk_size=1))
+
+        assert b"".join(chunks) == b"a\nb"
+        assert chunks[-1] == b"b"
+
+    def test_quoted_newline_not_split(self) -> None:
+        """Test a newline inside a quoted field does not end a chunk."""
+        source = io.BytesIO(b'a,b\n1,"x\ny"\n2,z\n')
+
+        chunks = list(iter_record_chunks(source, quote_char=b'"', chunk_size=7))
+
+        assert chunks == [b"a,b\n", b'1,"x\ny"\n', b"2,z\n"]
+
+    def test_empty_stream(self) -> None:
+        """Test an empty stream yields no chunks."""
+        assert list(iter_record_chunks(io.BytesIO(b""))) == []
+
+
+class TestScanStream:
+    """Tests for the scan_csv_stream and scan_ndjson_stream functions."""
+
+    def test_csv_stream_matches_read_csv(self) -> None:
+        """Test streamed CSV parsing matches an eager read."""
+        content = b"name,value\ntest,42\nhello,100\n"
+
+        df = scan_csv_stream(io.BytesIO(content)).collect()
+
+        assert df.equals(pl.read_csv(content))
+
+    def test_ndjson_stream_matches_read_ndjson(self) -> None:
+        """Test streamed NDJSON parsing matches an eager read."""
+        content = b'{"name": "test", "value": 42}\n{"name": "hello", "value": 100}\n'
+
+        df = scan_ndjson_stream(io.BytesIO(content)).collect()
+
+        assert df.equals(pl.read_ndjson(content))
+
+    def test_projection_and_limit(self) -> None:
+        """Test column selection and row limits are applied to the stream."""
+        content = b"a,b\n1,x\n2,y\n3,z\n"
+
+        df = scan_csv_stream(io.BytesIO(content)).select("b").head(2).collect()
+
+        assert df.to_dict(as_series=False) == {"b": ["x", "y"]}
+
+    def test_categorical_ratio(self) -> None:
+        """Test low-cardinality string columns of the first block are parsed as Categorical."""
+        content = b"".join(f'{{"id": {i}, "kind": "{"ab"[i % 2]}"}}\n'.encode() for i in range(100))
+
+        df = scan_ndjson_stream(io.BytesIO(content), categorical_ratio=0.05).collect()
+
+        assert df.schema == pl.Schema({"id": pl.Int64(), "kind": pl.Categorical()})
+        assert df.equals(pl.read_ndjson(content).cast({"kind": pl.Categorical()}))